@@ -14,6 +14,7 @@ Creates regional CSV files for each component.
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from functools import lru_cache
 import sys
 
 # Add scripts directory to path
@@ -55,15 +56,28 @@ def ensure_fips_column(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+@lru_cache(maxsize=None)
+def load_population_2022() -> pd.DataFrame:
+    """
+    Load 2022 county population with normalized 5-digit FIPS codes.
+
+    Parsed once per run and shared by every component that weights or
+    normalizes by population. Callers only merge against the returned
+    frame and must not mutate it.
+    """
+    pop_2022 = pd.read_csv(Path('data/processed') / 'census_population_growth_2000_2022.csv',
+                           usecols=['fips', 'population_2022'])
+    pop_2022['fips'] = pop_2022['fips'].astype(str).str.zfill(5)
+    return pop_2022
+
+
 def extract_region_key(rdm: RegionalDataManager, df: pd.DataFrame) -> pd.DataFrame:
     """Helper to extract region_key from FIPS code."""
     # Ensure we have a fips column
     df = ensure_fips_column(df)
 
     # Extract region_key
-    df['region_key'] = df['fips'].apply(
-        lambda fips: rdm.county_to_region.get(str(fips), {}).get('region_key') if str(fips) in rdm.county_to_region else None
-    )
+    df['region_key'] = rdm.map_region_keys(df['fips'])
     return df
 
 
@@ -123,11 +137,9 @@ def aggregate_component3(rdm: RegionalDataManager) -> pd.DataFrame:
     life_exp = life_exp.dropna(subset=['region_key', 'life_expectancy'])
 
     # Need population for weighting - use 2022 population from census
-    pop_data = pd.read_csv(data_dir / 'census_population_growth_2000_2022.csv')
-    pop_2022 = pop_data[['fips', 'population_2022']].copy()
-    pop_2022['fips'] = pop_2022['fips'].astype(str).str.zfill(5)
+    pop_2022 = load_population_2022()
 
-    life_exp_merged = pd.merge(life_exp, pop_2022[['fips', 'population_2022']], on='fips', how='left')
+    life_exp_merged = pd.merge(life_exp, pop_2022, on='fips', how='left')
 
     # Weighted average by population
     regional_life_exp = life_exp_merged.groupby('region_key').apply(
@@ -206,9 +218,7 @@ def aggregate_component4(rdm: RegionalDataManager) -> pd.DataFrame:
     data_dir = Path('data/processed')
 
     # Load population data for weighting (used by multiple measures)
-    pop_data = pd.read_csv(data_dir / 'census_population_growth_2000_2022.csv')
-    pop_2022 = pop_data[['fips', 'population_2022']].copy()
-    pop_2022['fips'] = pop_2022['fips'].astype(str).str.zfill(5)
+    pop_2022 = load_population_2022()
 
     # 4.1: Population Growth
     print("\n[4.1] Population Growth (2000-2022)...")
@@ -398,9 +408,7 @@ def aggregate_component6(rdm: RegionalDataManager) -> pd.DataFrame:
     data_dir = Path('data/processed')
 
     # Load population data for weighting (needed for 6.3 and 6.6)
-    pop_data = pd.read_csv(data_dir / 'census_population_growth_2000_2022.csv')
-    pop_2022 = pop_data[['fips', 'population_2022']].copy()
-    pop_2022['fips'] = pop_2022['fips'].astype(str).str.zfill(5)
+    pop_2022 = load_population_2022()
 
     # 6.1: Broadband Access
     print("\n[6.1] Broadband Access...")
@@ -604,11 +612,9 @@ def aggregate_component7(rdm: RegionalDataManager) -> pd.DataFrame:
     crime = crime.dropna(subset=['region_key'])
 
     # Need population for crime rate calculation
-    pop_data = pd.read_csv(data_dir / 'census_population_growth_2000_2022.csv')
-    pop_2022 = pop_data[['fips', 'population_2022']].copy()
-    pop_2022['fips'] = pop_2022['fips'].astype(str).str.zfill(5)
+    pop_2022 = load_population_2022()
 
-    crime_merged = pd.merge(crime, pop_2022[['fips', 'population_2022']], on='fips', how='left')
+    crime_merged = pd.merge(crime, pop_2022, on='fips', how='left')
 
     # Aggregate crime counts and population
     regional_crime = crime_merged.groupby('region_key').agg({
@@ -642,7 +648,7 @@ def aggregate_component7(rdm: RegionalDataManager) -> pd.DataFrame:
     healthcare = healthcare.dropna(subset=['region_key'])
 
     # Merge with population
-    healthcare_merged = pd.merge(healthcare, pop_2022[['fips', 'population_2022']], on='fips', how='left')
+    healthcare_merged = pd.merge(healthcare, pop_2022, on='fips', how='left')
 
     # Aggregate healthcare employment and population
     regional_healthcare = healthcare_merged.groupby('region_key').agg({
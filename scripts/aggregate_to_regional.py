@@ -10,12 +10,48 @@ import numpy as np
 from pathlib import Path
 from typing import Dict, List, Optional
 import json
+import traceback
 from datetime import datetime
 
 from regional_data_manager import RegionalDataManager
 from aggregation_config import AGGREGATION_CONFIG
 
 
+# Dtypes for county-level count columns. They use the nullable Int64 type so
+# blank or suppressed cells read as <NA> and negative Census sentinels
+# (e.g. -666666666) are kept as-is instead of wrapping around.
+DTYPE_HINTS = {
+    'population_2022': 'Int64',
+    'total_population': 'Int64',
+    'ESTAB': 'Int64',
+    'ESTABS_ENTRY': 'Int64',
+    'ESTABS_EXIT': 'Int64',
+    'annual_avg_emplvl': 'Int64',
+    'avg_annual_pay': 'float32',
+    'org_count_501c3': 'Int64',
+    'B08128_001E': 'Int64',
+    'B08128_002E': 'Int64',
+}
+
+
+def build_fips(state: pd.Series, county: pd.Series) -> pd.Series:
+    """
+    Build 5-digit county FIPS codes from numeric state and county codes.
+
+    Combines the codes as integers and zero-pads once, instead of padding
+    and concatenating two string columns.
+
+    Args:
+        state: State FIPS codes (e.g., 51)
+        county: County FIPS codes within the state (e.g., 3)
+
+    Returns:
+        Series of 5-digit FIPS strings (e.g., "51003")
+    """
+    fips = state.to_numpy(dtype=np.int32) * 1000 + county.to_numpy(dtype=np.int32)
+    return pd.Series(np.char.zfill(fips.astype(str), 5), index=state.index)
+
+
 class RegionalAggregator:
     """Handles aggregation of county-level data to regional level."""
 
@@ -42,6 +78,19 @@ class RegionalAggregator:
             'errors': []
         }
 
+    def _read(self, filename: str, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Read a county-level CSV from the data directory.
+
+        Args:
+            filename: CSV filename within data_dir
+            usecols: Columns to parse. If None, all columns are read.
+
+        Returns:
+            DataFrame with DTYPE_HINTS applied to the count columns
+        """
+        return pd.read_csv(self.data_dir / filename, usecols=usecols, dtype=DTYPE_HINTS)
+
     def aggregate_component2(self) -> pd.DataFrame:
         """
         Aggregate Component 2: Economic Opportunity & Diversity.
@@ -55,84 +104,82 @@ class RegionalAggregator:
 
         # Load data files
         print("  Loading Component 2 data files...")
-        bds_df = pd.read_csv(self.data_dir / "bds_business_dynamics_2021.csv")
-        proprietors_df = pd.read_csv(self.data_dir / "bea_proprietors_2022.csv")
-        cbp_est_df = pd.read_csv(self.data_dir / "cbp_establishments_2021.csv")
-        nonemp_df = pd.read_csv(self.data_dir / "nonemp_firms_2021.csv")
-        occupation_df = pd.read_csv(self.data_dir / "census_occupation_2022.csv")
-        telecommuter_df = pd.read_csv(self.data_dir / "census_telecommuter_2022.csv")
+        bds_df = self._read("bds_business_dynamics_2021.csv",
+                            usecols=['state', 'county', 'ESTABS_ENTRY', 'ESTABS_EXIT'])
+        proprietors_df = self._read("bea_proprietors_2022.csv", usecols=['GeoFips', 'DataValue'])
+        cbp_est_df = self._read("cbp_establishments_2021.csv", usecols=['state', 'county', 'ESTAB'])
+        nonemp_df = self._read("nonemp_firms_2021.csv", usecols=['state', 'county'])
+        occupation_df = self._read("census_occupation_2022.csv", usecols=['state', 'county'])
+        telecommuter_df = self._read("census_telecommuter_2022.csv",
+                                     usecols=['state', 'county', 'B08128_001E', 'B08128_002E'])
 
         # Add fips columns where needed
         if 'fips' not in cbp_est_df.columns:
-            cbp_est_df['fips'] = cbp_est_df['state'].astype(str).str.zfill(2) + cbp_est_df['county'].astype(str).str.zfill(3)
+            cbp_est_df['fips'] = build_fips(cbp_est_df['state'], cbp_est_df['county'])
         if 'fips' not in nonemp_df.columns:
-            nonemp_df['fips'] = nonemp_df['state'].astype(str).str.zfill(2) + nonemp_df['county'].astype(str).str.zfill(3)
+            nonemp_df['fips'] = build_fips(nonemp_df['state'], nonemp_df['county'])
         if 'fips' not in occupation_df.columns:
-            occupation_df['fips'] = occupation_df['state'].astype(str).str.zfill(2) + occupation_df['county'].astype(str).str.zfill(3)
+            occupation_df['fips'] = build_fips(occupation_df['state'], occupation_df['county'])
         if 'fips' not in telecommuter_df.columns:
-            telecommuter_df['fips'] = telecommuter_df['state'].astype(str).str.zfill(2) + telecommuter_df['county'].astype(str).str.zfill(3)
+            telecommuter_df['fips'] = build_fips(telecommuter_df['state'], telecommuter_df['county'])
 
         # Get population data for per-capita calculations
-        pop_df = pd.read_csv(self.data_dir / "census_population_growth_2000_2022.csv")
+        pop_df = self._read("census_population_growth_2000_2022.csv", usecols=['fips', 'population_2022'])
         pop_df['fips'] = pop_df['fips'].astype(str).str.zfill(5)
-        pop_df = pop_df[['fips', 'population_2022']].copy()
 
         # 2.1: Entrepreneurial activity (per capita)
         print("  Processing 2.1: Entrepreneurial activity...")
-        bds_df['fips'] = bds_df['state'].astype(str).str.zfill(2) + bds_df['county'].astype(str).str.zfill(3)
+        bds_df['fips'] = build_fips(bds_df['state'], bds_df['county'])
         bds_df['entrep_count'] = bds_df['ESTABS_ENTRY'] + bds_df['ESTABS_EXIT']
-        bds_with_pop = bds_df.merge(pop_df, on='fips', how='left')
-
-        entrep_agg = self.manager.aggregate_county_data(
-            bds_with_pop,
-            value_column='entrep_count',
-            aggregation_method='sum'
-        )
-        pop_agg = self.manager.aggregate_county_data(
-            bds_with_pop,
-            value_column='population_2022',
-            aggregation_method='sum'
-        )
-        entrep_agg['entrepreneurial_activity'] = entrep_agg['entrep_count'] / pop_agg['population_2022']
 
         # 2.2: Proprietors per 1000
         print("  Processing 2.2: Proprietors per 1,000...")
         proprietors_df['fips'] = proprietors_df['GeoFips'].astype(str).str.zfill(5)
-        prop_with_pop = proprietors_df.merge(pop_df, on='fips', how='left')
-
-        prop_agg = self.manager.aggregate_county_data(
-            prop_with_pop,
-            value_column='DataValue',
-            aggregation_method='sum'
-        )
-        prop_pop_agg = self.manager.aggregate_county_data(
-            prop_with_pop,
-            value_column='population_2022',
-            aggregation_method='sum'
-        )
-        prop_agg['proprietors_per_1000'] = (prop_agg['DataValue'] / prop_pop_agg['population_2022']) * 1000
 
         # 2.3: Establishments per 1000
         print("  Processing 2.3: Establishments per 1,000...")
-        cbp_with_pop = cbp_est_df.merge(pop_df, on='fips', how='left')
 
-        est_agg = self.manager.aggregate_county_data(
-            cbp_with_pop,
-            value_column='ESTAB',
+        # Combine the three numerators with population in one county-level frame so
+        # 2.1-2.3 share a single region lookup and groupby. Each measure's
+        # denominator only counts the population of counties present in its source.
+        per_capita = pop_df.merge(bds_df[['fips', 'entrep_count']], on='fips', how='outer')
+        per_capita = per_capita.merge(proprietors_df[['fips', 'DataValue']], on='fips', how='outer')
+        per_capita = per_capita.merge(cbp_est_df[['fips', 'ESTAB']], on='fips', how='outer')
+
+        population = per_capita['population_2022']
+        per_capita['entrep_population'] = population.where(per_capita['fips'].isin(bds_df['fips']))
+        per_capita['prop_population'] = population.where(per_capita['fips'].isin(proprietors_df['fips']))
+        per_capita['est_population'] = population.where(per_capita['fips'].isin(cbp_est_df['fips']))
+
+        per_capita_agg = self.manager.aggregate_county_data(
+            per_capita,
+            value_column=[
+                'entrep_count', 'entrep_population',
+                'DataValue', 'prop_population',
+                'ESTAB', 'est_population'
+            ],
             aggregation_method='sum'
         )
-        est_pop_agg = self.manager.aggregate_county_data(
-            cbp_with_pop,
-            value_column='population_2022',
-            aggregation_method='sum'
+        per_capita_agg['entrepreneurial_activity'] = (
+            per_capita_agg['entrep_count'] / per_capita_agg['entrep_population']
+        )
+        per_capita_agg['proprietors_per_1000'] = (
+            per_capita_agg['DataValue'] / per_capita_agg['prop_population'] * 1000
+        )
+        per_capita_agg['establishments_per_1000'] = (
+            per_capita_agg['ESTAB'] / per_capita_agg['est_population'] * 1000
         )
-        est_agg['establishments_per_1000'] = (est_agg['ESTAB'] / est_pop_agg['population_2022']) * 1000
 
         # 2.7: Telecommuter share (skip diversity measures for now - they require special calculation)
         print("  Processing 2.7: Telecommuter share...")
-        telecommuter_df['total_workers'] = telecommuter_df['B08128_001E'].astype(float)
-        telecommuter_df['worked_at_home'] = telecommuter_df['B08128_002E'].astype(float)
-        telecommuter_df['telecommuter_pct'] = (telecommuter_df['worked_at_home'] / telecommuter_df['total_workers']) * 100
+        telecommuter_df['total_workers'] = telecommuter_df['B08128_001E']
+        total_workers = telecommuter_df['B08128_001E'].to_numpy(dtype=float, na_value=np.nan)
+        worked_at_home = telecommuter_df['B08128_002E'].to_numpy(dtype=float, na_value=np.nan)
+        # Counties reporting no workers get a 0% share (and carry no weight)
+        telecommuter_df['telecommuter_pct'] = np.divide(
+            worked_at_home, total_workers,
+            out=np.zeros(len(telecommuter_df)), where=total_workers != 0
+        ) * 100
         telecom_agg = self.manager.aggregate_county_data(
             telecommuter_df,
             value_column='telecommuter_pct',
@@ -141,9 +188,10 @@ class RegionalAggregator:
         )
 
         # Merge results
-        result = entrep_agg[['region_key', 'region_name', 'state_name', 'entrepreneurial_activity']].copy()
-        result = result.merge(prop_agg[['region_key', 'proprietors_per_1000']], on='region_key', how='left')
-        result = result.merge(est_agg[['region_key', 'establishments_per_1000']], on='region_key', how='left')
+        result = per_capita_agg[[
+            'region_key', 'region_name', 'state_name',
+            'entrepreneurial_activity', 'proprietors_per_1000', 'establishments_per_1000'
+        ]].copy()
         result = result.merge(telecom_agg[['region_key', 'telecommuter_pct']], on='region_key', how='left')
 
         self.stats['measures_processed'] += 4  # 2.1, 2.2, 2.3, 2.7 (skipping 2.4, 2.5, 2.6 for now)
@@ -166,14 +214,14 @@ class RegionalAggregator:
 
         # Load BEA employment data
         print("  Processing 1.1: Employment growth...")
-        employment_df = pd.read_csv(self.data_dir / "bea_employment_processed.csv")
+        employment_df = self._read("bea_employment_processed.csv",
+                                   usecols=['GeoFips', 'TimePeriod', 'DataValue'])
 
         # Pivot to get 2020 and 2022 columns
-        emp_pivot = employment_df.pivot_table(
+        emp_pivot = employment_df.drop_duplicates(['GeoFips', 'TimePeriod']).pivot(
             index='GeoFips',
             columns='TimePeriod',
-            values='DataValue',
-            aggfunc='first'
+            values='DataValue'
         ).reset_index()
         emp_pivot.columns.name = None
         emp_pivot = emp_pivot.rename(columns={'GeoFips': 'fips'})
@@ -204,39 +252,40 @@ class RegionalAggregator:
         # Load QCEW data for measures 1.2 and 1.3
         print("  Processing 1.2: Private employment...")
         print("  Processing 1.3: Wage growth...")
-        qcew_df = pd.read_csv(self.data_dir / "qcew_private_employment_wages_2020_2022.csv")
-
-        # Get 2022 private employment (measure 1.2)
-        qcew_2022 = qcew_df[qcew_df['year'] == 2022].copy()
-        private_emp = self.manager.aggregate_county_data(
-            qcew_2022,
-            value_column='annual_avg_emplvl',
+        qcew_df = self._read("qcew_private_employment_wages_2020_2022.csv",
+                             usecols=['area_fips', 'year', 'annual_avg_emplvl', 'avg_annual_pay'])
+
+        # Average pay is employment-weighted, so pre-multiply pay by employment and
+        # sum the products and weights instead of taking a weighted mean per year
+        qcew_df['pay_weighted'] = qcew_df['avg_annual_pay'] * qcew_df['annual_avg_emplvl']
+        qcew_df['pay_weight'] = qcew_df['annual_avg_emplvl'].where(qcew_df['pay_weighted'].notna())
+
+        # Put 2020 and 2022 side by side so both years aggregate in one pass. Rows
+        # repeating a county and year (e.g. several ownership codes) are summed,
+        # as the regional sums and weighted means would do.
+        qcew_wide = qcew_df[qcew_df['year'].isin([2020, 2022])].pivot_table(
+            index='area_fips',
+            columns='year',
+            values=['annual_avg_emplvl', 'pay_weighted', 'pay_weight'],
+            aggfunc='sum'
+        )
+        qcew_wide.columns = [f"{name}_{year}" for name, year in qcew_wide.columns]
+        # The pivot widens every value column to float; keep employment as counts
+        qcew_wide = qcew_wide.astype({'annual_avg_emplvl_2020': 'Int64', 'annual_avg_emplvl_2022': 'Int64'})
+        qcew_agg = self.manager.aggregate_county_data(
+            qcew_wide.reset_index(),
+            value_column=list(qcew_wide.columns),
             aggregation_method='sum',
             county_fips_column='area_fips'
         )
-        private_emp = private_emp.rename(columns={'annual_avg_emplvl': 'private_employment_2022'})
-
-        # Calculate wage growth (measure 1.3)
-        qcew_2020 = qcew_df[qcew_df['year'] == 2020].copy()
 
-        wage_2020 = self.manager.aggregate_county_data(
-            qcew_2020,
-            value_column='avg_annual_pay',
-            aggregation_method='weighted_mean',
-            weight_column='annual_avg_emplvl',
-            county_fips_column='area_fips'
-        )
-        wage_2022 = self.manager.aggregate_county_data(
-            qcew_2022,
-            value_column='avg_annual_pay',
-            aggregation_method='weighted_mean',
-            weight_column='annual_avg_emplvl',
-            county_fips_column='area_fips'
-        )
+        # Get 2022 private employment (measure 1.2)
+        private_emp = qcew_agg.rename(columns={'annual_avg_emplvl_2022': 'private_employment_2022'})
 
-        wage_growth = wage_2020[['region_key']].copy()
-        wage_growth['avg_annual_pay_2020'] = wage_2020['avg_annual_pay']
-        wage_growth['avg_annual_pay_2022'] = wage_2022['avg_annual_pay']
+        # Calculate wage growth (measure 1.3)
+        wage_growth = qcew_agg[['region_key']].copy()
+        wage_growth['avg_annual_pay_2020'] = qcew_agg['pay_weighted_2020'] / qcew_agg['pay_weight_2020']
+        wage_growth['avg_annual_pay_2022'] = qcew_agg['pay_weighted_2022'] / qcew_agg['pay_weight_2022']
         wage_growth['wage_growth_pct'] = (
             (wage_growth['avg_annual_pay_2022'] - wage_growth['avg_annual_pay_2020'])
             / wage_growth['avg_annual_pay_2020'] * 100
@@ -244,7 +293,8 @@ class RegionalAggregator:
 
         # Measure 1.4: Households with children growth
         print("  Processing 1.4: Households with children growth...")
-        hh_df = pd.read_csv(self.data_dir / "census_households_children_processed.csv")
+        hh_df = self._read("census_households_children_processed.csv",
+                           usecols=['fips', 'year', 'households_with_children'])
 
         # Separate 2017 and 2022 data
         hh_2017 = hh_df[hh_df['year'] == 2017].copy()
@@ -271,13 +321,12 @@ class RegionalAggregator:
 
         # Measure 1.5: DIR income growth
         print("  Processing 1.5: DIR income growth...")
-        dir_df = pd.read_csv(self.data_dir / "bea_dir_income_processed.csv")
+        dir_df = self._read("bea_dir_income_processed.csv", usecols=['GeoFips', 'TimePeriod', 'DataValue'])
 
-        dir_pivot = dir_df.pivot_table(
+        dir_pivot = dir_df.drop_duplicates(['GeoFips', 'TimePeriod']).pivot(
             index='GeoFips',
             columns='TimePeriod',
-            values='DataValue',
-            aggfunc='first'
+            values='DataValue'
         ).reset_index()
         dir_pivot.columns.name = None
         dir_pivot = dir_pivot.rename(columns={'GeoFips': 'fips'})
@@ -326,25 +375,31 @@ class RegionalAggregator:
 
         # Load component 8 data (already has all 5 measures in one file)
         print("  Loading social capital data...")
-        sc_df = pd.read_csv(self.data_dir / "component8_social_capital_2022.csv")
+        sc_df = self._read("component8_social_capital_2022.csv", usecols=[
+            'fips', 'org_count_501c3', 'total_population', 'volunteering_rate',
+            'social_associations_per_10k', 'voter_turnout_pct', 'civic_organizations_per_1k'
+        ])
 
         # Ensure fips column exists
         sc_df['fips'] = sc_df['fips'].astype(str).str.zfill(5)
 
+        # Measure 8.3 is recalculated from counts, so derive the association count
+        # from its rate and the population of the counties that report it
+        sc_df['social_assoc_count'] = (
+            sc_df['social_associations_per_10k'] * sc_df['total_population'] / 10000
+        )
+        sc_df['assoc_population'] = sc_df['total_population'].where(sc_df['social_assoc_count'].notna())
+
         # Measure 8.1: Nonprofits per 1000
         print("  Processing 8.1: Nonprofits per 1,000...")
+        # Sum the 8.1 and 8.3 counts and populations in a single pass
         nonprofits_agg = self.manager.aggregate_county_data(
-            sc_df[['fips', 'org_count_501c3', 'total_population']],
-            value_column='org_count_501c3',
-            aggregation_method='sum'
-        )
-        pop_agg = self.manager.aggregate_county_data(
-            sc_df[['fips', 'total_population']],
-            value_column='total_population',
+            sc_df,
+            value_column=['org_count_501c3', 'total_population', 'social_assoc_count', 'assoc_population'],
             aggregation_method='sum'
         )
         nonprofits_agg['orgs_per_1000'] = (
-            nonprofits_agg['org_count_501c3'] / pop_agg['total_population'] * 1000
+            nonprofits_agg['org_count_501c3'] / nonprofits_agg['total_population'] * 1000
         )
 
         # Measure 8.2: Volunteer rate (weighted mean)
@@ -358,22 +413,8 @@ class RegionalAggregator:
 
         # Measure 8.3: Social associations per 10k
         print("  Processing 8.3: Social associations...")
-        # Calculate count from rate
-        sc_df['social_assoc_count'] = (
-            sc_df['social_associations_per_10k'] * sc_df['total_population'] / 10000
-        )
-        assoc_agg = self.manager.aggregate_county_data(
-            sc_df[sc_df['social_assoc_count'].notna()][['fips', 'social_assoc_count', 'total_population']],
-            value_column='social_assoc_count',
-            aggregation_method='sum'
-        )
-        pop_assoc = self.manager.aggregate_county_data(
-            sc_df[sc_df['social_assoc_count'].notna()][['fips', 'total_population']],
-            value_column='total_population',
-            aggregation_method='sum'
-        )
-        assoc_agg['social_associations_per_10k'] = (
-            assoc_agg['social_assoc_count'] / pop_assoc['total_population'] * 10000
+        nonprofits_agg['social_associations_per_10k'] = (
+            nonprofits_agg['social_assoc_count'] / nonprofits_agg['assoc_population'] * 10000
         )
 
         # Measure 8.4: Voter turnout (weighted mean)
@@ -396,13 +437,13 @@ class RegionalAggregator:
 
         # Merge all Component 8 measures
         result = nonprofits_agg[['region_key', 'region_name', 'state_name', 'orgs_per_1000', 'org_count_501c3']].copy()
-        result['total_population'] = pop_agg['total_population']
+        result['total_population'] = nonprofits_agg['total_population']
         result = result.merge(
             volunteer_agg[['region_key', 'volunteering_rate']],
             on='region_key', how='left'
         )
         result = result.merge(
-            assoc_agg[['region_key', 'social_associations_per_10k']],
+            nonprofits_agg[['region_key', 'social_associations_per_10k']],
             on='region_key', how='left'
         )
         result = result.merge(
@@ -447,6 +488,15 @@ class RegionalAggregator:
         print()
 
 
+# Components aggregated by main(), in order:
+# (aggregation method, output filename, label, number of measures)
+COMPONENT_JOBS = [
+    ('aggregate_component1', "component1_growth_index_regional.csv", "Component 1", 5),
+    ('aggregate_component2', "component2_economic_opportunity_regional.csv", "Component 2", 7),
+    ('aggregate_component8', "component8_social_capital_regional.csv", "Component 8", 5),
+]
+
+
 def main():
     """Main aggregation workflow."""
     print("=" * 80)
@@ -462,36 +512,15 @@ def main():
     # Initialize aggregator
     aggregator = RegionalAggregator(data_dir, output_dir)
 
-    # Component 1: Growth Index
-    try:
-        comp1_data = aggregator.aggregate_component1()
-        aggregator.save_regional_data(comp1_data, "component1_growth_index_regional.csv")
-    except Exception as e:
-        print(f"ERROR in Component 1: {e}")
-        import traceback
-        traceback.print_exc()
-        aggregator.stats['measures_failed'] += 5
-        aggregator.stats['errors'].append(f"Component 1: {str(e)}")
-
-    # Component 2: Economic Opportunity & Diversity
-    try:
-        comp2_data = aggregator.aggregate_component2()
-        aggregator.save_regional_data(comp2_data, "component2_economic_opportunity_regional.csv")
-    except Exception as e:
-        print(f"ERROR in Component 2: {e}")
-        import traceback
-        traceback.print_exc()
-        aggregator.stats['measures_failed'] += 7
-        aggregator.stats['errors'].append(f"Component 2: {str(e)}")
-
-    # Component 8: Social Capital
-    try:
-        comp8_data = aggregator.aggregate_component8()
-        aggregator.save_regional_data(comp8_data, "component8_social_capital_regional.csv")
-    except Exception as e:
-        print(f"ERROR in Component 8: {e}")
-        aggregator.stats['measures_failed'] += 5
-        aggregator.stats['errors'].append(f"Component 8: {str(e)}")
+    for method_name, filename, label, num_measures in COMPONENT_JOBS:
+        try:
+            comp_data = getattr(aggregator, method_name)()
+            aggregator.save_regional_data(comp_data, filename)
+        except Exception as e:
+            print(f"ERROR in {label}: {e}")
+            traceback.print_exc()
+            aggregator.stats['measures_failed'] += num_measures
+            aggregator.stats['errors'].append(f"{label}: {str(e)}")
 
     # Print summary
     aggregator.print_summary()
@@ -12,6 +12,29 @@ Aggregation Methods:
 - 'max': Maximum value (for binary indicators like highway presence)
 """
 
+from collections import defaultdict
+from types import MappingProxyType
+from typing import List, Mapping
+
+import numpy as np
+
+
+def _hhi_diversity(emp_by_sector: np.ndarray) -> np.ndarray:
+    """
+    Herfindahl diversity (1 - sum of squared shares) for every region at once.
+
+    Args:
+        emp_by_sector: Array of shape (n_regions, n_sectors) with employment or
+            worker counts; missing sectors should be 0
+
+    Returns:
+        Array of n_regions diversity scores (1.0 for regions with no employment)
+    """
+    totals = emp_by_sector.sum(axis=1, keepdims=True)
+    shares = np.divide(emp_by_sector, totals, out=np.zeros(emp_by_sector.shape), where=totals != 0)
+    return 1.0 - np.einsum('ij,ij->i', shares, shares)
+
+
 # Component 1: Growth Index (5 measures)
 # Note: Growth rates must be RECALCULATED from aggregated base/current values
 COMPONENT1_CONFIG = {
@@ -95,13 +118,15 @@ COMPONENT2_CONFIG = {
         'note': 'Calculate regional employment shares across 19 NAICS sectors',
         'requires_multi_file': True,
         'files': 'cbp_industry_naics*_2021.csv',
-        'formula': '1 - sum(share_i^2) for all industries i'
+        'formula': '1 - sum(share_i^2) for all industries i',
+        'kernel': _hhi_diversity
     },
     '2.6_occupation_diversity': {
         'description': 'Occupation Diversity (Herfindahl index)',
         'method': 'recalculate',
         'note': 'Calculate regional occupation shares across major occupation groups',
-        'formula': '1 - sum(share_i^2) for all occupations i'
+        'formula': '1 - sum(share_i^2) for all occupations i',
+        'kernel': _hhi_diversity
     },
     '2.7_telecommuter_share': {
         'description': 'Share of Telecommuters',
@@ -379,6 +404,26 @@ AGGREGATION_CONFIG = {
     'component8': COMPONENT8_CONFIG
 }
 
+# Lookup tables built once from the static config above
+_MEASURE_INDEX = {
+    (component, measure_id): config
+    for component, measures in AGGREGATION_CONFIG.items()
+    for measure_id, config in measures.items()
+}
+
+_ALL_MEASURES = MappingProxyType({
+    measure_id: {'component': component, **config}
+    for (component, measure_id), config in _MEASURE_INDEX.items()
+})
+
+# Measure IDs by aggregation method, and weighted measures by weight column
+_METHOD_INDEX = defaultdict(list)
+_WEIGHT_INDEX = defaultdict(list)
+for _measure_id, _config in _ALL_MEASURES.items():
+    _METHOD_INDEX[_config.get('method', 'unknown')].append(_measure_id)
+    if 'weight_column' in _config:
+        _WEIGHT_INDEX[_config['weight_column']].append(_measure_id)
+
 
 def get_measure_config(component: str, measure: str) -> dict:
     """
@@ -391,30 +436,49 @@ def get_measure_config(component: str, measure: str) -> dict:
     Returns:
         Dictionary with aggregation configuration
     """
-    if component not in AGGREGATION_CONFIG:
-        raise ValueError(f"Unknown component: {component}")
-
-    if measure not in AGGREGATION_CONFIG[component]:
+    config = _MEASURE_INDEX.get((component, measure))
+    if config is None:
+        if component not in AGGREGATION_CONFIG:
+            raise ValueError(f"Unknown component: {component}")
         raise ValueError(f"Unknown measure {measure} in {component}")
 
-    return AGGREGATION_CONFIG[component][measure]
+    return config
 
 
-def get_all_measures() -> dict:
+def get_all_measures() -> Mapping[str, dict]:
     """
     Get flat dictionary of all measures across all components.
 
     Returns:
-        Dictionary mapping measure ID to config
+        Read-only mapping of measure ID to config
     """
-    all_measures = {}
-    for component, measures in AGGREGATION_CONFIG.items():
-        for measure_id, config in measures.items():
-            all_measures[measure_id] = {
-                'component': component,
-                **config
-            }
-    return all_measures
+    return _ALL_MEASURES
+
+
+def get_measures_by_method(method: str) -> List[str]:
+    """
+    Get the IDs of all measures aggregated with a given method.
+
+    Args:
+        method: Aggregation method (e.g., 'weighted_mean')
+
+    Returns:
+        List of measure IDs (empty if no measure uses the method)
+    """
+    return list(_METHOD_INDEX.get(method, []))
+
+
+def get_measures_by_weight(weight_column: str) -> List[str]:
+    """
+    Get the IDs of all measures weighted by a given column.
+
+    Args:
+        weight_column: Weight column name (e.g., 'total_population')
+
+    Returns:
+        List of measure IDs (empty if no measure uses the weight)
+    """
+    return list(_WEIGHT_INDEX.get(weight_column, []))
 
 
 def print_aggregation_summary():
@@ -424,19 +488,11 @@ def print_aggregation_summary():
     print("=" * 80)
     print()
 
-    method_counts = {}
-    for component, measures in AGGREGATION_CONFIG.items():
-        for measure_id, config in measures.items():
-            method = config.get('method', 'unknown')
-            if method not in method_counts:
-                method_counts[method] = 0
-            method_counts[method] += 1
-
-    for method, count in sorted(method_counts.items(), key=lambda x: -x[1]):
-        print(f"{method:20} - {count:2} measures")
+    for method, measure_ids in sorted(_METHOD_INDEX.items(), key=lambda x: -len(x[1])):
+        print(f"{method:20} - {len(measure_ids):2} measures")
 
     print()
-    print(f"Total measures: {sum(method_counts.values())}")
+    print(f"Total measures: {len(_ALL_MEASURES)}")
     print()
 
 
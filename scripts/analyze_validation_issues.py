@@ -3,9 +3,12 @@ Analyze data validation report and prioritize fixes.
 """
 
 import json
-import pandas as pd
+import re
 from pathlib import Path
 
+# Percentage inside the first parenthesis of an issue, e.g. "... (12.5% missing)"
+_PCT_RE = re.compile(r'^[^(]*\(([^(%]*)%')
+
 
 def load_validation_report():
     """Load the most recent validation report."""
@@ -26,15 +29,49 @@ def load_validation_report():
 
 def analyze_critical_issues(report):
     """Identify and prioritize critical data quality issues."""
+    # Imported here so the no-report exit path does not pay pandas' import time
+    import numpy as np
+    import pandas as pd
+
     print("="*80)
     print("CRITICAL DATA QUALITY ISSUES")
     print("="*80)
 
-    critical_issues = []
+    # Flatten every per-file issue into one frame and classify them all at once
+    issues = pd.DataFrame(
+        [
+            (result['file_name'], category, issue)
+            for result in report['detailed_results']
+            for category, category_issues in result.get('issues', {}).items()
+            for issue in category_issues
+        ],
+        columns=['file', 'category', 'issue']
+    )
+    is_range = issues['category'] == 'data_ranges'
+    is_fips = issues['category'] == 'fips'
+    is_fips_missing = is_fips & issues['issue'].str.contains('No FIPS code column found', regex=False)
+    # Duplicates might be OK for time series data
+    is_fips_duplicate = is_fips & ~is_fips_missing & issues['issue'].str.lower().str.contains('duplicate', regex=False)
+    is_fips_invalid = is_fips & ~is_fips_missing & ~is_fips_duplicate
+    missing_pct = issues['issue'].str.extract(_PCT_RE, expand=False)
+    missing_pct = pd.to_numeric(missing_pct, errors='coerce')
+    is_missing = (issues['category'] == 'missing_values') & (missing_pct > 10)
+
+    issues['severity'] = np.select(
+        [is_range, is_fips_missing, is_fips_invalid, is_missing],
+        ['HIGH', 'MEDIUM', 'HIGH', 'MEDIUM'],
+        default=''
+    )
+    issues['type'] = np.select(
+        [is_range, is_fips_missing, is_fips_invalid, is_missing],
+        ['range', 'fips_missing', 'fips_invalid', 'missing_values'],
+        default=''
+    )
 
     # Check coverage issues
     print("\n[1] FILES WITH ZERO OR LOW COVERAGE (<90%)")
     print("-"*80)
+    critical_issues = []
     for item in report['coverage']:
         if item['coverage_pct'] < 90:
             critical_issues.append({
@@ -45,96 +82,49 @@ def analyze_critical_issues(report):
             })
             print(f"  ⚠️  {item['file']}: {item['coverage_pct']}% coverage")
 
-    if not any(item['coverage_pct'] < 90 for item in report['coverage']):
+    if not critical_issues:
         print("  ✓ All files have adequate coverage (>=90%)")
 
     # Check for range violations
     print("\n[2] DATA RANGE VIOLATIONS")
     print("-"*80)
-    range_issues_found = False
-    for result in report['detailed_results']:
-        if 'data_ranges' in result.get('issues', {}):
-            range_issues_found = True
-            for issue in result['issues']['data_ranges']:
-                critical_issues.append({
-                    'severity': 'HIGH',
-                    'file': result['file_name'],
-                    'issue': issue,
-                    'type': 'range'
-                })
-                print(f"  ⚠️  {result['file_name']}: {issue}")
-
-    if not range_issues_found:
+    for row in issues[is_range].itertuples():
+        print(f"  ⚠️  {row.file}: {row.issue}")
+
+    if not is_range.any():
         print("  ✓ All values within expected ranges")
 
     # Check for missing FIPS columns
     print("\n[3] FIPS CODE ISSUES")
     print("-"*80)
-    fips_issues_found = False
-    for result in report['detailed_results']:
-        if 'fips' in result.get('issues', {}):
-            for issue in result['issues']['fips']:
-                if 'No FIPS code column found' in issue:
-                    critical_issues.append({
-                        'severity': 'MEDIUM',
-                        'file': result['file_name'],
-                        'issue': issue,
-                        'type': 'fips_missing'
-                    })
-                    print(f"  ⚠️  {result['file_name']}: {issue}")
-                    fips_issues_found = True
-                elif 'duplicate' in issue.lower():
-                    # Duplicates might be OK for time series data
-                    print(f"  ℹ️  {result['file_name']}: {issue} (may be time series)")
-                else:
-                    critical_issues.append({
-                        'severity': 'HIGH',
-                        'file': result['file_name'],
-                        'issue': issue,
-                        'type': 'fips_invalid'
-                    })
-                    print(f"  ⚠️  {result['file_name']}: {issue}")
-                    fips_issues_found = True
-
-    if not fips_issues_found:
+    for row, duplicate in zip(issues[is_fips].itertuples(), is_fips_duplicate[is_fips]):
+        if duplicate:
+            print(f"  ℹ️  {row.file}: {row.issue} (may be time series)")
+        else:
+            print(f"  ⚠️  {row.file}: {row.issue}")
+
+    if not (is_fips_missing | is_fips_invalid).any():
         print("  ✓ All FIPS codes valid")
 
     # Check for excessive missing values
     print("\n[4] EXCESSIVE MISSING VALUES (>10%)")
     print("-"*80)
-    missing_issues_found = False
-    for result in report['detailed_results']:
-        if 'missing_values' in result.get('issues', {}):
-            for issue in result['issues']['missing_values']:
-                # Extract percentage
-                if '(' in issue and '%' in issue:
-                    pct_str = issue.split('(')[1].split('%')[0]
-                    try:
-                        pct = float(pct_str)
-                        if pct > 10:
-                            critical_issues.append({
-                                'severity': 'MEDIUM',
-                                'file': result['file_name'],
-                                'issue': issue,
-                                'type': 'missing_values'
-                            })
-                            print(f"  ⚠️  {result['file_name']}: {issue}")
-                            missing_issues_found = True
-                    except ValueError:
-                        pass
-
-    if not missing_issues_found:
+    for row in issues[is_missing].itertuples():
+        print(f"  ⚠️  {row.file}: {row.issue}")
+
+    if not is_missing.any():
         print("  ✓ No excessive missing values (all <10%)")
 
+    # Collect flagged issues in section order: coverage, range, FIPS, missing values
+    flagged = pd.concat([issues[is_range], issues[is_fips_missing | is_fips_invalid], issues[is_missing]])
+    critical_issues += flagged[['severity', 'file', 'issue', 'type']].to_dict('records')
+
     # Summary
     print("\n" + "="*80)
     print(f"TOTAL CRITICAL ISSUES: {len(critical_issues)}")
     print("="*80)
 
-    severity_counts = {}
-    for issue in critical_issues:
-        severity = issue['severity']
-        severity_counts[severity] = severity_counts.get(severity, 0) + 1
+    severity_counts = pd.Series([issue['severity'] for issue in critical_issues], dtype=str).value_counts()
 
     for severity in ['CRITICAL', 'HIGH', 'MEDIUM']:
         count = severity_counts.get(severity, 0)
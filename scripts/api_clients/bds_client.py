@@ -7,70 +7,130 @@ Primary use: Business births and deaths (entrepreneurial activity)
 Documentation: https://www.census.gov/data/developers/data-sets/business-dynamics.html
 """
 
+import pandas as pd
 import requests
-import time
 import json
+import os
 from pathlib import Path
 import sys
 
 # Add parent directory to path to import config
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from config import CENSUS_API_KEY, REQUEST_DELAY, MAX_RETRIES, TIMEOUT, RAW_DATA_DIR
+from config import CENSUS_API_KEY, TIMEOUT, RAW_DATA_DIR, create_session, get_rate_limiter, write_json, request_error_message
 
 
 class BDSClient:
     """Client for Census Business Dynamics Statistics API"""
 
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, cache_dir=None):
         """
         Initialize Census BDS API client.
 
         Args:
             api_key: Census API key. If None, uses key from config.
+            cache_dir: Directory for caching API responses. If None, uses default.
         """
         self.api_key = api_key or CENSUS_API_KEY
         if not self.api_key:
             raise ValueError("Census API key is required")
 
         self.base_url = "https://api.census.gov/data/timeseries/bds"
-        self.session = requests.Session()
+        self.session = create_session()
+        self.rate_limiter = get_rate_limiter(self.base_url)
 
-    def _make_request(self, url, params, retries=MAX_RETRIES):
+        # Raw responses are saved here
+        self.output_dir = RAW_DATA_DIR / 'bds'
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Set up cache directory
+        if cache_dir is None:
+            self.cache_dir = self.output_dir / '_cache'
+        else:
+            self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _get_cache_path(self, year, state_fips, naics):
+        """
+        Get the cache file path for a specific request.
+
+        Args:
+            year: Year of data
+            state_fips: State FIPS code (None for all states)
+            naics: NAICS code
+
+        Returns:
+            Path: Path to cache file
+        """
+        filename = f"bds_{year}_{state_fips or 'all'}_{naics}.json"
+        return self.cache_dir / filename
+
+    def _load_from_cache(self, cache_path):
+        """
+        Load data from cache file if it exists.
+
+        Args:
+            cache_path: Path to cache file
+
+        Returns:
+            list or None: Cached data if exists, None otherwise
+        """
+        if cache_path.exists():
+            try:
+                with open(cache_path, 'r') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"Warning: Failed to load cache from {cache_path}: {e}")
+                return None
+        return None
+
+    def _save_to_cache(self, cache_path, data):
+        """
+        Save data to cache file.
+
+        Writes to a temporary file first so an interrupted run never leaves a
+        truncated cache entry behind.
+
+        Args:
+            cache_path: Path to cache file
+            data: Data to cache
+        """
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Warning: Failed to save cache to {cache_path}: {e}")
+
+    def _make_request(self, url, params):
         """
-        Make API request with retry logic.
+        Make API request. Retries with backoff are handled by the session.
 
         Args:
             url: Full API URL
             params: Dictionary of query parameters
-            retries: Number of retries remaining
 
         Returns:
             list: JSON response from API (list of lists)
         """
-        params['key'] = self.api_key
+        params = {**params, 'key': self.api_key}
 
+        self.rate_limiter.acquire()
         try:
             response = self.session.get(url, params=params, timeout=TIMEOUT)
             response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise Exception(request_error_message('Census BDS API', e)) from e
 
-            data = response.json()
-
-            # Census API returns errors as JSON with single element containing error message
-            if len(data) == 1 and isinstance(data[0], str) and 'error' in data[0].lower():
-                raise Exception(f"Census BDS API Error: {data[0]}")
+        data = response.json()
 
-            time.sleep(REQUEST_DELAY)
-            return data
+        # Census API returns errors as JSON with single element containing error message
+        if len(data) == 1 and isinstance(data[0], str) and 'error' in data[0].lower():
+            raise Exception(f"Census BDS API Error: {data[0]}")
 
-        except requests.exceptions.RequestException as e:
-            if retries > 0:
-                print(f"Request failed, retrying... ({retries} attempts left)")
-                time.sleep(REQUEST_DELAY * 2)
-                return self._make_request(url, params, retries - 1)
-            else:
-                raise Exception(f"Census BDS API request failed after {MAX_RETRIES} attempts: {str(e)}")
+        return data
 
-    def get_business_dynamics(self, year, state_fips=None, naics='00'):
+    def get_business_dynamics(self, year, state_fips=None, naics='00', use_cache=True):
         """
         Get business dynamics data (births and deaths).
 
@@ -78,10 +138,18 @@ class BDSClient:
             year: Year of data (e.g., 2021)
             state_fips: State FIPS code (None for all states)
             naics: NAICS code (default '00' for all industries)
+            use_cache: Whether to use cached data if available
 
         Returns:
             list: API response as list of lists (first row is headers)
         """
+        # Check cache first
+        cache_path = self._get_cache_path(year, state_fips, naics)
+        if use_cache:
+            cached_data = self._load_from_cache(cache_path)
+            if cached_data is not None:
+                return cached_data
+
         # ESTABS_ENTRY = Number of establishments born during the last 12 months
         # ESTABS_EXIT = Number of establishments exited during the last 12 months
         # ESTAB = Total number of establishments
@@ -98,40 +166,62 @@ class BDSClient:
         if state_fips:
             params['in'] = f'state:{state_fips}'
 
-        return self._make_request(self.base_url, params)
+        data = self._make_request(self.base_url, params)
 
-    def parse_response_to_dict(self, response):
+        # Cache the result
+        if use_cache:
+            self._save_to_cache(cache_path, data)
+
+        return data
+
+    def parse_response_to_df(self, response):
         """
-        Convert Census API response to list of dictionaries.
+        Convert Census API response to a DataFrame.
+
+        The establishment counts are converted to numbers; geography, YEAR and
+        NAICS codes stay as strings.
 
         Args:
             response: Census API response (list of lists)
 
         Returns:
-            list: List of dictionaries with column names as keys
+            DataFrame with one row per county and API variables as columns
         """
         if not response or len(response) < 2:
-            return []
+            return pd.DataFrame()
 
-        headers = response[0]
-        data_rows = response[1:]
+        df = pd.DataFrame(response[1:], columns=response[0])
 
-        return [dict(zip(headers, row)) for row in data_rows]
+        count_columns = [col for col in ['ESTABS_ENTRY', 'ESTABS_EXIT', 'ESTAB'] if col in df.columns]
+        df[count_columns] = df[count_columns].apply(pd.to_numeric, errors='coerce')
 
-    def save_response(self, data, filename):
+        return df
+
+    def parse_response_to_dict(self, response):
+        """
+        Convert Census API response to list of dictionaries.
+
+        Deprecated: use parse_response_to_df, which skips building a dict per row.
+
+        Args:
+            response: Census API response (list of lists)
+
+        Returns:
+            list: List of dictionaries with column names as keys
+        """
+        return self.parse_response_to_df(response).to_dict('records')
+
+    def save_response(self, data, filename, pretty=False):
         """
         Save API response to file.
 
         Args:
             data: Response data (list or dict)
             filename: Output filename (will be saved in data/raw/bds/)
+            pretty: If True, indent the JSON for reading by hand
         """
-        output_dir = RAW_DATA_DIR / 'bds'
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        output_path = output_dir / filename
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        output_path = self.output_dir / filename
+        write_json(output_path, data, pretty)
 
         print(f"Saved: {output_path}")
 
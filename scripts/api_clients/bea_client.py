@@ -10,45 +10,134 @@ Documentation: https://apps.bea.gov/api/
 import requests
 import time
 import json
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import sys
 
 # Add parent directory to path to import config
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from config import BEA_API_KEY, BEA_API_URL, REQUEST_DELAY, MAX_RETRIES, TIMEOUT, RAW_DATA_DIR
+from config import BEA_API_KEY, BEA_API_URL, TIMEOUT, RAW_DATA_DIR, CACHE_EXPIRE_AFTER, create_session, get_rate_limiter, write_json, request_error_message
+
+
+class BEAAPIError(Exception):
+    """Raised when the BEA Regional API returns an error or a request keeps failing."""
+    __slots__ = ()
 
 
 class BEAClient:
     """Client for BEA Regional Economic Accounts API"""
 
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, cache_dir=None):
         """
         Initialize BEA API client.
 
         Args:
             api_key: BEA API key. If None, uses key from config.
+            cache_dir: Directory for caching API responses. If None, uses default.
         """
         self.api_key = api_key or BEA_API_KEY
         if not self.api_key:
             raise ValueError("BEA API key is required")
 
         self.base_url = BEA_API_URL
-        self.session = requests.Session()
+        self.session = create_session()
+        self.rate_limiter = get_rate_limiter(self.base_url)
+        # Sent with every request, so callers' params dicts are never modified
+        self.session.params = {'UserID': self.api_key, 'ResultFormat': 'JSON'}
+
+        # Raw responses are saved here
+        self.output_dir = RAW_DATA_DIR / 'bea'
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Set up cache directory
+        if cache_dir is None:
+            self.cache_dir = self.output_dir / '_cache'
+        else:
+            self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _get_cache_path(self, url, params):
+        """
+        Get the cache file path for a request.
+
+        The file name is a hash of the URL and query parameters, excluding the
+        API key, so identical queries share one entry.
+
+        Args:
+            url: Full API URL
+            params: Dictionary of query parameters
+
+        Returns:
+            Path: Path to cache file
+        """
+        key = {k: v for k, v in params.items() if k != 'UserID'}
+        payload = json.dumps([url, key], sort_keys=True, default=str)
+        digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.json"
 
-    def _make_request(self, params, retries=MAX_RETRIES):
+    def _load_from_cache(self, cache_path):
         """
-        Make API request with retry logic.
+        Load data from cache file if it exists and has not expired.
+
+        Args:
+            cache_path: Path to cache file
+
+        Returns:
+            dict, list or None: Cached data if fresh, None otherwise
+        """
+        try:
+            if time.time() - cache_path.stat().st_mtime > CACHE_EXPIRE_AFTER:
+                return None
+            with open(cache_path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Failed to load cache from {cache_path}: {e}")
+            return None
+
+    def _save_to_cache(self, cache_path, data):
+        """
+        Save data to cache file.
+
+        Writes to a temporary file first so an interrupted run never leaves a
+        truncated cache entry behind.
+
+        Args:
+            cache_path: Path to cache file
+            data: Data to cache
+        """
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Warning: Failed to save cache to {cache_path}: {e}")
+
+    def _make_request(self, params, skip_cache=False):
+        """
+        Make API request. Retries with backoff are handled by the session.
+
+        Successful responses are cached on disk for CACHE_EXPIRE_AFTER seconds.
 
         Args:
             params: Dictionary of API parameters
-            retries: Number of retries remaining
+            skip_cache: If True, always query the API and refresh the cache
 
         Returns:
             dict: JSON response from API
         """
-        params['UserID'] = self.api_key
-        params['ResultFormat'] = 'JSON'
+        cache_path = self._get_cache_path(self.base_url, params)
+        if not skip_cache:
+            cached_data = self._load_from_cache(cache_path)
+            if cached_data is not None:
+                return cached_data
 
+        self.rate_limiter.acquire()
         try:
             response = self.session.get(
                 self.base_url,
@@ -56,24 +145,18 @@ class BEAClient:
                 timeout=TIMEOUT
             )
             response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise BEAAPIError(request_error_message('BEA API', e)) from e
 
-            data = response.json()
-
-            # Check for BEA API errors
-            if 'BEAAPI' in data and 'Error' in data['BEAAPI']:
-                error_msg = data['BEAAPI']['Error'].get('APIErrorDescription', 'Unknown error')
-                raise Exception(f"BEA API Error: {error_msg}")
+        data = response.json()
 
-            time.sleep(REQUEST_DELAY)
-            return data
+        # Check for BEA API errors
+        error = data.get('BEAAPI', {}).get('Error')
+        if error:
+            raise BEAAPIError(f"BEA API Error: {error.get('APIErrorDescription', 'Unknown error')}")
 
-        except requests.exceptions.RequestException as e:
-            if retries > 0:
-                print(f"Request failed, retrying... ({retries} attempts left)")
-                time.sleep(REQUEST_DELAY * 2)
-                return self._make_request(params, retries - 1)
-            else:
-                raise Exception(f"BEA API request failed after {MAX_RETRIES} attempts: {str(e)}")
+        self._save_to_cache(cache_path, data)
+        return data
 
     def get_dataset_list(self):
         """
@@ -103,6 +186,31 @@ class BEAClient:
         response = self._make_request(params)
         return response['BEAAPI']['Results']['Parameter']
 
+    def _filter_to_states(self, response, state_fips_list):
+        """
+        Keep only county rows whose FIPS code falls in the given states.
+
+        Args:
+            response: API response from a county-level GetData request
+            state_fips_list: List of state FIPS codes, or None to keep all rows
+
+        Returns:
+            dict: The response, with its Data rows filtered in place
+        """
+        if not state_fips_list:
+            return response
+
+        results = response.get('BEAAPI', {}).get('Results', {})
+        if 'Data' in results:
+            # Filter to only counties in specified states
+            state_set = frozenset(state_fips_list)
+            results['Data'] = [
+                row for row in results['Data']
+                if row['GeoFips'][:2] in state_set
+            ]
+
+        return response
+
     def get_cainc5_data(self, year, line_code, state_fips_list=None):
         """
         Get CAINC5 table data (Personal Income by Major Component).
@@ -125,19 +233,7 @@ class BEAClient:
         }
 
         response = self._make_request(params)
-
-        # Filter by state if requested
-        if state_fips_list and 'BEAAPI' in response and 'Results' in response['BEAAPI']:
-            if 'Data' in response['BEAAPI']['Results']:
-                data = response['BEAAPI']['Results']['Data']
-                # Filter to only counties in specified states
-                filtered_data = [
-                    row for row in data
-                    if row['GeoFips'][:2] in state_fips_list
-                ]
-                response['BEAAPI']['Results']['Data'] = filtered_data
-
-        return response
+        return self._filter_to_states(response, state_fips_list)
 
     def get_employment_data(self, years, state_fips_list=None):
         """
@@ -193,19 +289,7 @@ class BEAClient:
         }
 
         response = self._make_request(params)
-
-        # Filter by state if requested
-        if state_fips_list and 'BEAAPI' in response and 'Results' in response['BEAAPI']:
-            if 'Data' in response['BEAAPI']['Results']:
-                data = response['BEAAPI']['Results']['Data']
-                # Filter to only counties in specified states
-                filtered_data = [
-                    row for row in data
-                    if row['GeoFips'][:2] in state_fips_list
-                ]
-                response['BEAAPI']['Results']['Data'] = filtered_data
-
-        return response
+        return self._filter_to_states(response, state_fips_list)
 
     def get_proprietors_data(self, years, state_fips_list=None, include_farm=False):
         """
@@ -225,19 +309,20 @@ class BEAClient:
         if isinstance(years, list):
             years = ','.join(str(y) for y in years)
 
-        # Get nonfarm proprietors income (Line Code 72)
-        nonfarm_response = self.get_cainc4_data(years, line_code=72, state_fips_list=state_fips_list)
-
         if include_farm:
-            # Also get farm proprietors income (Line Code 71)
-            farm_response = self.get_cainc4_data(years, line_code=71, state_fips_list=state_fips_list)
+            # Fetch nonfarm (Line Code 72) and farm (Line Code 71) proprietors
+            # income concurrently, since both calls mostly wait on the network
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                nonfarm_future = executor.submit(self.get_cainc4_data, years, 72, state_fips_list)
+                farm_future = executor.submit(self.get_cainc4_data, years, 71, state_fips_list)
             # Combine the responses
             return {
-                'nonfarm': nonfarm_response,
-                'farm': farm_response
+                'nonfarm': nonfarm_future.result(),
+                'farm': farm_future.result()
             }
 
-        return nonfarm_response
+        # Get nonfarm proprietors income (Line Code 72)
+        return self.get_cainc4_data(years, line_code=72, state_fips_list=state_fips_list)
 
     def get_cainc1_data(self, year, line_code, state_fips_list=None):
         """
@@ -261,19 +346,7 @@ class BEAClient:
         }
 
         response = self._make_request(params)
-
-        # Filter by state if requested
-        if state_fips_list and 'BEAAPI' in response and 'Results' in response['BEAAPI']:
-            if 'Data' in response['BEAAPI']['Results']:
-                data = response['BEAAPI']['Results']['Data']
-                # Filter to only counties in specified states
-                filtered_data = [
-                    row for row in data
-                    if row['GeoFips'][:2] in state_fips_list
-                ]
-                response['BEAAPI']['Results']['Data'] = filtered_data
-
-        return response
+        return self._filter_to_states(response, state_fips_list)
 
     def get_total_personal_income(self, years, state_fips_list=None):
         """
@@ -291,24 +364,35 @@ class BEAClient:
 
         return self.get_cainc1_data(years, line_code=1, state_fips_list=state_fips_list)
 
-    def save_response(self, data, filename):
+    def save_response(self, data, filename, pretty=False):
         """
         Save API response to file.
 
         Args:
             data: Response data (dict)
             filename: Output filename (will be saved in data/raw/bea/)
+            pretty: If True, indent the JSON for reading by hand
         """
-        output_dir = RAW_DATA_DIR / 'bea'
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        output_path = output_dir / filename
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        output_path = self.output_dir / filename
+        write_json(output_path, data, pretty)
 
         print(f"Saved: {output_path}")
 
 
+@lru_cache(maxsize=1)
+def get_bea_client():
+    """
+    Get the process-wide BEAClient.
+
+    Pipeline modules that share it also share one session and its pool of
+    keep-alive connections.
+
+    Returns:
+        BEAClient: Client using the API key from config
+    """
+    return BEAClient()
+
+
 if __name__ == '__main__':
     # Test the BEA client
     print("Testing BEA API Client...")
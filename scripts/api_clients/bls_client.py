@@ -9,14 +9,45 @@ QCEW Series ID Format: ENUCS + state FIPS + county FIPS + ownership + aggregate
 """
 
 import requests
-import time
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import sys
 
 # Add parent directory to path to import config
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from config import BLS_API_KEY, BLS_API_URL, REQUEST_DELAY, MAX_RETRIES, TIMEOUT, RAW_DATA_DIR
+from config import BLS_API_KEY, BLS_API_URL, TIMEOUT, RAW_DATA_DIR, create_session, get_rate_limiter, write_json, request_error_message
+
+
+class BLSAPIError(Exception):
+    """Raised when the BLS QCEW API returns an error or a request keeps failing."""
+    __slots__ = ()
+
+
+# QCEW data type codes used in series IDs
+QCEW_DATA_TYPE_CODES = {
+    'employment': '5',  # Annual average employment
+    'wages': '6',  # Total quarterly wages
+}
+
+
+@lru_cache(maxsize=4096)
+def _build_series_id(state_fips, county_fips, dt_code, ownership, industry):
+    """
+    Format a QCEW series ID from already-normalized components.
+
+    Args:
+        state_fips: 2-digit state FIPS code
+        county_fips: 3-digit county FIPS code
+        dt_code: QCEW data type code
+        ownership: Ownership code
+        industry: Industry code
+
+    Returns:
+        str: BLS series ID
+    """
+    # Build series ID: ENU + state + county + ownership + dt_code + aggregate + industry
+    return f"ENU{state_fips}{county_fips}{ownership}{dt_code}{industry}"
 
 
 class BLSClient:
@@ -34,17 +65,22 @@ class BLSClient:
             raise ValueError("BLS API key is required")
 
         self.base_url = BLS_API_URL
-        self.session = requests.Session()
+        self.session = create_session()
+        self.rate_limiter = get_rate_limiter(self.base_url)
+        self._base_payload = {'registrationkey': self.api_key}
+
+        # Raw responses are saved here
+        self.output_dir = RAW_DATA_DIR / 'bls'
+        self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def _make_request(self, series_ids, start_year, end_year, retries=MAX_RETRIES):
+    def _make_request(self, series_ids, start_year, end_year):
         """
-        Make API request with retry logic.
+        Make API request. Retries with backoff are handled by the session.
 
         Args:
             series_ids: List of BLS series IDs
             start_year: Start year
             end_year: End year
-            retries: Number of retries remaining
 
         Returns:
             dict: JSON response from API
@@ -54,12 +90,13 @@ class BLSClient:
             raise ValueError("BLS API limited to 50 series per request")
 
         payload = {
+            **self._base_payload,
             'seriesid': series_ids,
             'startyear': str(start_year),
-            'endyear': str(end_year),
-            'registrationkey': self.api_key
+            'endyear': str(end_year)
         }
 
+        self.rate_limiter.acquire()
         try:
             response = self.session.post(
                 self.base_url,
@@ -68,24 +105,17 @@ class BLSClient:
                 timeout=TIMEOUT
             )
             response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise BLSAPIError(request_error_message('BLS API', e)) from e
 
-            data = response.json()
-
-            # Check for BLS API errors
-            if data.get('status') != 'REQUEST_SUCCEEDED':
-                error_msg = data.get('message', ['Unknown error'])[0]
-                raise Exception(f"BLS API Error: {error_msg}")
+        data = response.json()
 
-            time.sleep(REQUEST_DELAY)
-            return data
+        # Check for BLS API errors
+        if data.get('status') != 'REQUEST_SUCCEEDED':
+            error_msg = (data.get('message') or ['Unknown error'])[0]
+            raise BLSAPIError(f"BLS API Error: {error_msg}")
 
-        except requests.exceptions.RequestException as e:
-            if retries > 0:
-                print(f"Request failed, retrying... ({retries} attempts left)")
-                time.sleep(REQUEST_DELAY * 2)
-                return self._make_request(series_ids, start_year, end_year, retries - 1)
-            else:
-                raise Exception(f"BLS API request failed after {MAX_RETRIES} attempts: {str(e)}")
+        return data
 
     def build_qcew_series_id(self, state_fips, county_fips, data_type='employment',
                              ownership='5', industry='10'):
@@ -114,17 +144,11 @@ class BLSClient:
         county_fips = str(county_fips).zfill(3)
 
         # Data type code
-        if data_type == 'employment':
-            dt_code = '5'  # Annual average employment
-        elif data_type == 'wages':
-            dt_code = '6'  # Total quarterly wages
-        else:
+        dt_code = QCEW_DATA_TYPE_CODES.get(data_type)
+        if dt_code is None:
             raise ValueError(f"Invalid data_type: {data_type}")
 
-        # Build series ID: ENU + state + county + ownership + dt_code + aggregate + industry
-        series_id = f"ENU{state_fips}{county_fips}{ownership}{dt_code}{industry}"
-
-        return series_id
+        return _build_series_id(state_fips, county_fips, dt_code, str(ownership), str(industry))
 
     def get_county_data(self, state_fips, county_fips, start_year, end_year,
                        data_types=['employment', 'wages']):
@@ -149,50 +173,57 @@ class BLSClient:
         return self._make_request(series_ids, start_year, end_year)
 
     def get_state_counties_data(self, state_fips, county_fips_list, start_year, end_year,
-                                data_type='employment'):
+                                data_type='employment', max_workers=8):
         """
         Get QCEW data for multiple counties in batches.
 
+        Batches are posted concurrently on a thread pool over the session's
+        pooled keep-alive connections, since each request mostly waits on the network.
+
         Args:
             state_fips: State FIPS code
             county_fips_list: List of county FIPS codes
             start_year: Start year
             end_year: End year
             data_type: 'employment' or 'wages'
+            max_workers: Maximum number of concurrent requests
 
         Returns:
             list: List of API responses (one per batch of 50 counties)
         """
-        all_responses = []
+        state_fips = str(state_fips).zfill(2)
+        # Shared by every batch's payload
+        start_year, end_year = str(start_year), str(end_year)
+        all_series_ids = [
+            self.build_qcew_series_id(state_fips, county_fips, data_type=data_type)
+            for county_fips in county_fips_list
+        ]
 
         # Process in batches of 50 (API limit)
-        for i in range(0, len(county_fips_list), 50):
-            batch = county_fips_list[i:i + 50]
-            series_ids = [
-                self.build_qcew_series_id(state_fips, county_fips, data_type=data_type)
-                for county_fips in batch
-            ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for i in range(0, len(all_series_ids), 50):
+                series_ids = all_series_ids[i:i + 50]
 
-            print(f"Fetching batch {i // 50 + 1} ({len(series_ids)} series)...")
-            response = self._make_request(series_ids, start_year, end_year)
-            all_responses.append(response)
+                print(f"Fetching batch {i // 50 + 1} ({len(series_ids)} series)...")
+                futures.append(executor.submit(self._make_request, series_ids, start_year, end_year))
+
+            # Responses stay in batch order; a failed batch re-raises here
+            all_responses = [future.result() for future in futures]
 
         return all_responses
 
-    def save_response(self, data, filename):
+    def save_response(self, data, filename, pretty=False):
         """
         Save API response to file.
 
         Args:
             data: Response data (dict)
             filename: Output filename (will be saved in data/raw/bls/)
+            pretty: If True, indent the JSON for reading by hand
         """
-        output_dir = RAW_DATA_DIR / 'bls'
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        output_path = output_dir / filename
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        output_path = self.output_dir / filename
+        write_json(output_path, data, pretty)
 
         print(f"Saved: {output_path}")
 
@@ -7,68 +7,153 @@ Primary use: Business establishments and employment data by industry
 Documentation: https://www.census.gov/data/developers/data-sets/cbp-nonemp-zbp.html
 """
 
+import pandas as pd
 import requests
 import time
 import json
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import sys
 
 # Add parent directory to path to import config
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from config import CENSUS_API_KEY, CENSUS_API_BASE, REQUEST_DELAY, MAX_RETRIES, TIMEOUT, RAW_DATA_DIR
+from config import CENSUS_API_KEY, CENSUS_API_BASE, TIMEOUT, RAW_DATA_DIR, CACHE_EXPIRE_AFTER, create_session, get_rate_limiter, write_json, request_error_message
+
+
+class CBPAPIError(Exception):
+    """Raised when the Census CBP API returns an error or a request keeps failing."""
+    __slots__ = ()
 
 
 class CBPClient:
     """Client for Census County Business Patterns API"""
 
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, cache_dir=None):
         """
         Initialize Census CBP API client.
 
         Args:
             api_key: Census API key. If None, uses key from config.
+            cache_dir: Directory for caching API responses. If None, uses default.
         """
         self.api_key = api_key or CENSUS_API_KEY
         if not self.api_key:
             raise ValueError("Census API key is required")
 
         self.base_url = CENSUS_API_BASE
-        self.session = requests.Session()
+        self.session = create_session()
+        self.rate_limiter = get_rate_limiter(self.base_url)
+        # Sent with every request, so callers' params dicts are never modified
+        self.session.params = {'key': self.api_key}
+
+        # Raw responses are saved here
+        self.output_dir = RAW_DATA_DIR / 'cbp'
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Set up cache directory
+        if cache_dir is None:
+            self.cache_dir = self.output_dir / '_cache'
+        else:
+            self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _get_cache_path(self, url, params):
+        """
+        Get the cache file path for a request.
+
+        The file name is a hash of the URL and query parameters, excluding the
+        API key, so identical queries share one entry.
+
+        Args:
+            url: Full API URL
+            params: Dictionary of query parameters
+
+        Returns:
+            Path: Path to cache file
+        """
+        key = {k: v for k, v in params.items() if k != 'key'}
+        payload = json.dumps([url, key], sort_keys=True, default=str)
+        digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _load_from_cache(self, cache_path):
+        """
+        Load data from cache file if it exists and has not expired.
+
+        Args:
+            cache_path: Path to cache file
+
+        Returns:
+            dict, list or None: Cached data if fresh, None otherwise
+        """
+        try:
+            if time.time() - cache_path.stat().st_mtime > CACHE_EXPIRE_AFTER:
+                return None
+            with open(cache_path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Failed to load cache from {cache_path}: {e}")
+            return None
+
+    def _save_to_cache(self, cache_path, data):
+        """
+        Save data to cache file.
+
+        Writes to a temporary file first so an interrupted run never leaves a
+        truncated cache entry behind.
 
-    def _make_request(self, url, params, retries=MAX_RETRIES):
+        Args:
+            cache_path: Path to cache file
+            data: Data to cache
+        """
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Warning: Failed to save cache to {cache_path}: {e}")
+
+    def _make_request(self, url, params, skip_cache=False):
         """
-        Make API request with retry logic.
+        Make API request. Retries with backoff are handled by the session.
+
+        Successful responses are cached on disk for CACHE_EXPIRE_AFTER seconds.
 
         Args:
             url: Full API URL
             params: Dictionary of query parameters
-            retries: Number of retries remaining
+            skip_cache: If True, always query the API and refresh the cache
 
         Returns:
             list: JSON response from API (list of lists)
         """
-        params['key'] = self.api_key
+        cache_path = self._get_cache_path(url, params)
+        if not skip_cache:
+            cached_data = self._load_from_cache(cache_path)
+            if cached_data is not None:
+                return cached_data
 
+        self.rate_limiter.acquire()
         try:
             response = self.session.get(url, params=params, timeout=TIMEOUT)
             response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise CBPAPIError(request_error_message('Census CBP API', e)) from e
 
-            data = response.json()
-
-            # Census API returns errors as JSON with single element containing error message
-            if len(data) == 1 and isinstance(data[0], str) and 'error' in data[0].lower():
-                raise Exception(f"Census CBP API Error: {data[0]}")
+        data = response.json()
 
-            time.sleep(REQUEST_DELAY)
-            return data
+        # Census API returns errors as JSON with single element containing error message
+        if len(data) == 1 and isinstance(data[0], str) and 'error' in data[0].lower():
+            raise CBPAPIError(f"Census CBP API Error: {data[0]}")
 
-        except requests.exceptions.RequestException as e:
-            if retries > 0:
-                print(f"Request failed, retrying... ({retries} attempts left)")
-                time.sleep(REQUEST_DELAY * 2)
-                return self._make_request(url, params, retries - 1)
-            else:
-                raise Exception(f"Census CBP API request failed after {MAX_RETRIES} attempts: {str(e)}")
+        self._save_to_cache(cache_path, data)
+        return data
 
     def get_cbp_data(self, year, variables, naics='00', state_fips=None):
         """
@@ -77,7 +162,7 @@ class CBPClient:
         Args:
             year: Year of data (e.g., 2021)
             variables: List of variable codes or comma-separated string
-            naics: NAICS code (default '00' for total all industries)
+            naics: NAICS code, or list of codes to OR together (default '00' for total all industries)
             state_fips: State FIPS code (None for all states)
 
         Returns:
@@ -118,14 +203,20 @@ class CBPClient:
 
         return self.get_cbp_data(year, variables, naics, state_fips)
 
-    def get_industry_employment(self, year, state_fips, naics_codes=None):
+    def get_industry_employment(self, year, state_fips, naics_codes=None, max_workers=10):
         """
         Get employment by industry (for diversity calculations).
 
+        All sectors are requested in one call by repeating the NAICS2017
+        predicate, which the Census API treats as OR, and the rows are bucketed
+        by sector. If that call fails, sectors are fetched one per request on a
+        thread pool instead.
+
         Args:
             year: Year of data
             state_fips: State FIPS code
             naics_codes: List of 2-digit NAICS codes (None for all 2-digit industries)
+            max_workers: Maximum number of concurrent requests
 
         Returns:
             dict: Dictionary mapping NAICS code to data
@@ -154,12 +245,63 @@ class CBPClient:
                 '81',  # Other Services (except Public Administration)
             ]
 
-        results = {}
         variables = ['NAME', 'EMP', 'ESTAB', 'NAICS2017']
 
-        for naics in naics_codes:
+        try:
+            response = self.get_cbp_data(year, variables, list(naics_codes), state_fips)
+        except Exception as e:
+            print(f"  Combined NAICS request failed ({e}); fetching sectors individually")
+            return self._get_sectors_concurrently(year, state_fips, naics_codes, variables, max_workers)
+
+        # Split rows by sector in a single pass
+        header = response[0]
+        naics_idx = header.index('NAICS2017')
+        sectors = {naics: [header] for naics in naics_codes}
+        for row in response[1:]:
+            rows = sectors.get(row[naics_idx])
+            if rows is not None:
+                rows.append(row)
+
+        results = {}
+        for naics, data in sectors.items():
+            if len(data) > 1:
+                results[naics] = data
+                print(f"  Retrieved data for NAICS {naics}: {len(data) - 1} counties")
+            else:
+                print(f"  Warning: Could not retrieve NAICS {naics}: no rows returned")
+                results[naics] = None
+
+        return results
+
+    def _get_sectors_concurrently(self, year, state_fips, naics_codes, variables, max_workers):
+        """
+        Get industry data with one request per NAICS sector.
+
+        The per-sector requests are network-bound, so they run concurrently on a
+        thread pool over the session's pooled keep-alive connections.
+
+        Args:
+            year: Year of data
+            state_fips: State FIPS code
+            naics_codes: List of NAICS codes
+            variables: List of variable codes
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            dict: Dictionary mapping NAICS code to data
+        """
+        results = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (naics, executor.submit(self.get_cbp_data, year, variables, naics, state_fips))
+                for naics in naics_codes
+            ]
+
+        # Report results in NAICS order
+        for naics, future in futures:
             try:
-                data = self.get_cbp_data(year, variables, naics, state_fips)
+                data = future.result()
                 results[naics] = data
                 print(f"  Retrieved data for NAICS {naics}: {len(data) - 1} counties")
             except Exception as e:
@@ -185,64 +327,98 @@ class CBPClient:
         """
         variables = ['NAME', 'EMP', 'ESTAB', 'NAICS2017']
 
+        sectors = [
+            ('ambulatory', '621', 'Ambulatory'),  # Ambulatory healthcare services
+            ('hospitals', '622', 'Hospitals'),  # Hospitals
+        ]
+
         results = {}
 
-        # Get ambulatory healthcare services (NAICS 621)
-        try:
-            data_621 = self.get_cbp_data(year, variables, '621', state_fips)
-            results['ambulatory'] = data_621
-            print(f"  Retrieved NAICS 621 (Ambulatory): {len(data_621) - 1} counties")
-        except Exception as e:
-            print(f"  Warning: Could not retrieve NAICS 621: {e}")
-            results['ambulatory'] = None
+        # Both requests mostly wait on the network, so send them concurrently
+        with ThreadPoolExecutor(max_workers=len(sectors)) as executor:
+            futures = [
+                (key, naics, label, executor.submit(self.get_cbp_data, year, variables, naics, state_fips))
+                for key, naics, label in sectors
+            ]
 
-        # Get hospitals (NAICS 622)
-        try:
-            data_622 = self.get_cbp_data(year, variables, '622', state_fips)
-            results['hospitals'] = data_622
-            print(f"  Retrieved NAICS 622 (Hospitals): {len(data_622) - 1} counties")
-        except Exception as e:
-            print(f"  Warning: Could not retrieve NAICS 622: {e}")
-            results['hospitals'] = None
+        for key, naics, label, future in futures:
+            try:
+                data = future.result()
+                results[key] = data
+                print(f"  Retrieved NAICS {naics} ({label}): {len(data) - 1} counties")
+            except Exception as e:
+                print(f"  Warning: Could not retrieve NAICS {naics}: {e}")
+                results[key] = None
 
         return results
 
-    def parse_response_to_dict(self, response):
+    def parse_response_to_df(self, response):
         """
-        Convert Census API response to list of dictionaries.
+        Convert Census API response to a DataFrame.
+
+        Preferred over parse_response_to_dict: the rows go straight into
+        columns without building a dict per row. EMP and ESTAB are converted to
+        numbers; geography and NAICS codes stay as strings.
 
         Args:
             response: Census API response (list of lists)
 
         Returns:
-            list: List of dictionaries with column names as keys
+            DataFrame with one row per county and API variables as columns
         """
         if not response or len(response) < 2:
-            return []
+            return pd.DataFrame()
+
+        df = pd.DataFrame(response[1:], columns=response[0])
+
+        count_columns = [col for col in ['EMP', 'ESTAB'] if col in df.columns]
+        df[count_columns] = df[count_columns].apply(pd.to_numeric, errors='coerce')
+
+        return df
+
+    def parse_response_to_dict(self, response):
+        """
+        Convert Census API response to list of dictionaries.
 
-        headers = response[0]
-        data_rows = response[1:]
+        Deprecated: use parse_response_to_df, which skips building a dict per row.
 
-        return [dict(zip(headers, row)) for row in data_rows]
+        Args:
+            response: Census API response (list of lists)
+
+        Returns:
+            list: List of dictionaries with column names as keys
+        """
+        return self.parse_response_to_df(response).to_dict('records')
 
-    def save_response(self, data, filename):
+    def save_response(self, data, filename, pretty=False):
         """
         Save API response to file.
 
         Args:
             data: Response data (list or dict)
             filename: Output filename (will be saved in data/raw/cbp/)
+            pretty: If True, indent the JSON for reading by hand
         """
-        output_dir = RAW_DATA_DIR / 'cbp'
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        output_path = output_dir / filename
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        output_path = self.output_dir / filename
+        write_json(output_path, data, pretty)
 
         print(f"Saved: {output_path}")
 
 
+@lru_cache(maxsize=1)
+def get_cbp_client():
+    """
+    Get the process-wide CBPClient.
+
+    Pipeline modules that share it also share one session and its pool of
+    keep-alive connections.
+
+    Returns:
+        CBPClient: Client using the API key from config
+    """
+    return CBPClient()
+
+
 if __name__ == '__main__':
     # Test the CBP client
     print("Testing Census County Business Patterns API Client...")
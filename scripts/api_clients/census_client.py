@@ -7,83 +7,391 @@ Primary use: Demographic, household, education, and housing data
 Documentation: https://www.census.gov/data/developers/data-sets/acs-5year.html
 """
 
+import pandas as pd
 import requests
 import time
 import json
+import gzip
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
 # Add parent directory to path to import config
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from config import CENSUS_API_KEY, CENSUS_API_BASE, REQUEST_DELAY, MAX_RETRIES, TIMEOUT, RAW_DATA_DIR
+from config import CENSUS_API_KEY, CENSUS_API_BASE, TIMEOUT, RAW_DATA_DIR, CACHE_EXPIRE_AFTER, STATE_FIPS, create_session, get_rate_limiter, write_json, request_error_message
+
+
+# The Census API accepts at most 50 variables (including NAME) per request
+MAX_VARIABLES_PER_REQUEST = 50
+
+# API path under CENSUS_API_BASE for each dataset, formatted with the year
+DATASET_PATHS = {
+    'detail': '{year}/acs/acs5',
+    'subject': '{year}/acs/acs5/subject',
+    'profile': '{year}/acs/acs5/profile',
+    'dec2000': '2000/dec/sf1',
+}
+
+# ===== Variables requested by each client method =====
+
+# S1101_C01_005E = Households with own children of the householder under 18 years (COUNT)
+# S1101_C01_001E = Total households
+# NOTE: S1101_C01_002E is average household size (not a count)
+# NOTE: S1101_C01_010E is a percentage (not a count)
+HOUSEHOLDS_WITH_CHILDREN_VARIABLES = ('NAME', 'S1101_C01_005E', 'S1101_C01_001E')
+
+# S1701_C03_001E = Percent below poverty level
+POVERTY_RATE_VARIABLES = ('NAME', 'S1701_C03_001E')
+
+# S1501 - Educational Attainment
+# S1501_C02_015E = Percent bachelor's degree or higher (25+ population)
+# S1501_C02_014E = Percent associate's degree or higher
+# S1501_C02_009E = Percent high school graduate or higher
+EDUCATION_ATTAINMENT_VARIABLES = (
+    'NAME',
+    'S1501_C02_015E',  # Bachelor's or higher
+    'S1501_C02_014E',  # Associate's or higher
+    'S1501_C02_009E',   # HS diploma or higher
+)
+
+# B25077_001E = Median value (owner-occupied units)
+# B25064_001E = Median gross rent
+HOUSING_VALUE_VARIABLES = ('NAME', 'B25077_001E', 'B25064_001E')
+
+# S2401 - Occupation by Sex and Median Earnings
+# Get employment counts by major occupation group
+OCCUPATION_VARIABLES = (
+    'NAME',
+    'S2401_C01_001E',  # Total civilian employed population 16 years and over
+    'S2401_C01_002E',  # Management, business, science, and arts occupations
+    'S2401_C01_003E',  # Service occupations
+    'S2401_C01_004E',  # Sales and office occupations
+    'S2401_C01_005E',  # Natural resources, construction, and maintenance occupations
+    'S2401_C01_006E',  # Production, transportation, and material moving occupations
+)
+
+# B08128 - Means of Transportation to Work by Class of Worker
+# B08128_001E = Total workers 16 years and over
+# B08128_002E = Workers who worked at home
+# B08128_003E = Worked at home: Private wage and salary workers
+# B08128_009E = Worked at home: Self-employed in own not incorporated business workers
+# B08128_013E = Worked at home: Self-employed in own incorporated business workers
+TELECOMMUTER_VARIABLES = (
+    'NAME',
+    'B08128_001E',  # Total workers
+    'B08128_002E',  # Total worked at home
+    'B08128_003E',  # Worked at home: Private wage and salary
+    'B08128_009E',  # Worked at home: Self-employed not incorporated
+    'B08128_013E',  # Worked at home: Self-employed incorporated
+)
+
+# B01001_001E = Total population
+POPULATION_VARIABLES = ('NAME', 'B01001_001E')
+
+# B01001 - Sex by Age
+# We need age breakdowns to calculate dependency ratio
+# Under 15: sum of age 0-14 groups
+# 15-64: working age population
+# 65+: elderly dependents
+AGE_DISTRIBUTION_VARIABLES = (
+    'NAME',
+    'B01001_001E',  # Total population
+    # Male population by age
+    'B01001_003E',  # Male: Under 5 years
+    'B01001_004E',  # Male: 5 to 9 years
+    'B01001_005E',  # Male: 10 to 14 years
+    'B01001_006E',  # Male: 15 to 17 years
+    'B01001_007E',  # Male: 18 and 19 years
+    'B01001_008E',  # Male: 20 years
+    'B01001_009E',  # Male: 21 years
+    'B01001_010E',  # Male: 22 to 24 years
+    'B01001_011E',  # Male: 25 to 29 years
+    'B01001_012E',  # Male: 30 to 34 years
+    'B01001_013E',  # Male: 35 to 39 years
+    'B01001_014E',  # Male: 40 to 44 years
+    'B01001_015E',  # Male: 45 to 49 years
+    'B01001_016E',  # Male: 50 to 54 years
+    'B01001_017E',  # Male: 55 to 59 years
+    'B01001_018E',  # Male: 60 and 61 years
+    'B01001_019E',  # Male: 62 to 64 years
+    'B01001_020E',  # Male: 65 and 66 years
+    'B01001_021E',  # Male: 67 to 69 years
+    'B01001_022E',  # Male: 70 to 74 years
+    'B01001_023E',  # Male: 75 to 79 years
+    'B01001_024E',  # Male: 80 to 84 years
+    'B01001_025E',  # Male: 85 years and over
+    # Female population by age
+    'B01001_027E',  # Female: Under 5 years
+    'B01001_028E',  # Female: 5 to 9 years
+    'B01001_029E',  # Female: 10 to 14 years
+    'B01001_030E',  # Female: 15 to 17 years
+    'B01001_031E',  # Female: 18 and 19 years
+    'B01001_032E',  # Female: 20 years
+    'B01001_033E',  # Female: 21 years
+    'B01001_034E',  # Female: 22 to 24 years
+    'B01001_035E',  # Female: 25 to 29 years
+    'B01001_036E',  # Female: 30 to 34 years
+    'B01001_037E',  # Female: 35 to 39 years
+    'B01001_038E',  # Female: 40 to 44 years
+    'B01001_039E',  # Female: 45 to 49 years
+    'B01001_040E',  # Female: 50 to 54 years
+    'B01001_041E',  # Female: 55 to 59 years
+    'B01001_042E',  # Female: 60 and 61 years
+    'B01001_043E',  # Female: 62 to 64 years
+    'B01001_044E',  # Female: 65 and 66 years
+    'B01001_045E',  # Female: 67 to 69 years
+    'B01001_046E',  # Female: 70 to 74 years
+    'B01001_047E',  # Female: 75 to 79 years
+    'B01001_048E',  # Female: 80 to 84 years
+    'B01001_049E',  # Female: 85 years and over
+)
+
+# B01002_001E = Median age
+MEDIAN_AGE_VARIABLES = ('NAME', 'B01002_001E')
+
+# B03003 - Hispanic or Latino Origin
+# B03003_001E = Total population
+# B03003_003E = Hispanic or Latino
+HISPANIC_VARIABLES = ('NAME', 'B03003_001E', 'B03003_003E')
+
+# B02001 - Race
+# B02001_001E = Total population
+# B02001_002E = White alone
+RACE_VARIABLES = ('NAME', 'B02001_001E', 'B02001_002E')
+
+# B15003 - Educational Attainment for the Population 25 Years and Over
+# Need exclusive categories (highest level achieved)
+EDUCATION_DETAILED_VARIABLES = (
+    'NAME',
+    'B15003_001E',  # Total population 25 years and over
+    'B15003_017E',  # Regular high school diploma
+    'B15003_018E',  # GED or alternative credential
+    'B15003_021E',  # Associate's degree
+    'B15003_022E',  # Bachelor's degree
+)
+
+# B23025 - Employment Status for the Population 16 Years and Over
+# B23025_001E = Total population 16 years and over
+# B23025_002E = In labor force
+LABOR_FORCE_VARIABLES = ('NAME', 'B23025_001E', 'B23025_002E')
+
+# S2401 - Occupation by Sex and Median Earnings
+# Use occupation groups as proxy for knowledge workers
+KNOWLEDGE_WORKER_VARIABLES = (
+    'NAME',
+    'S2401_C01_001E',  # Total civilian employed population 16 years and over
+    'S2401_C01_002E',  # Management, business, science, and arts occupations
+)
+
+# S0801 - Commuting Characteristics by Sex
+# S0801_C01_046E = Mean travel time to work (minutes)
+COMMUTE_TIME_VARIABLES = ('NAME', 'S0801_C01_046E')
+
+HOUSING_AGE_VARIABLES = (
+    'NAME',
+    'DP04_0033E',  # Total housing units
+    'DP04_0035E',  # Built 1939 or earlier
+    'DP04_0036E',  # Built 1940 to 1949
+    'DP04_0037E',  # Built 1950 to 1959
+)
+
+
+def _union(*groups):
+    """
+    Merge variable tuples in order, dropping NAME and duplicates.
+
+    Args:
+        *groups: Tuples of variable codes
+
+    Returns:
+        tuple: Each variable once, in first-seen order
+    """
+    return tuple(dict.fromkeys(var for group in groups for var in group if var != 'NAME'))
+
+
+# Union of the county indicators each client method reads, by ACS endpoint.
+# One state's indicators are fetched together and each method slices out its
+# own columns, so collecting several indicators costs one or two requests per
+# state instead of one per indicator.
+INDICATOR_VARIABLES = {
+    'subject': _union(
+        HOUSEHOLDS_WITH_CHILDREN_VARIABLES, POVERTY_RATE_VARIABLES, EDUCATION_ATTAINMENT_VARIABLES,
+        OCCUPATION_VARIABLES, KNOWLEDGE_WORKER_VARIABLES, COMMUTE_TIME_VARIABLES,
+    ),
+    'detail': _union(
+        HOUSING_VALUE_VARIABLES, TELECOMMUTER_VARIABLES, POPULATION_VARIABLES, AGE_DISTRIBUTION_VARIABLES,
+        MEDIAN_AGE_VARIABLES, HISPANIC_VARIABLES, RACE_VARIABLES, EDUCATION_DETAILED_VARIABLES,
+        LABOR_FORCE_VARIABLES,
+    ),
+}
+
+# ACS vintage for which the collectors read every indicator. Other vintages
+# only need one or two indicators, so those are requested on their own.
+INDICATOR_YEAR = 2022
 
 
 class CensusClient:
     """Client for Census ACS API"""
 
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, cache_dir=None, enable_cache=True):
         """
         Initialize Census API client.
 
         Args:
             api_key: Census API key. If None, uses key from config.
+            cache_dir: Directory for caching API responses. If None, uses default.
+            enable_cache: Whether to serve repeated requests from the disk cache
         """
         self.api_key = api_key or CENSUS_API_KEY
         if not self.api_key:
             raise ValueError("Census API key is required")
 
         self.base_url = CENSUS_API_BASE
-        self.session = requests.Session()
+        self.session = create_session()
+        self.rate_limiter = get_rate_limiter(self.base_url)
 
-    def _make_request(self, url, params, retries=MAX_RETRIES):
+        # Raw responses are saved here
+        self.output_dir = RAW_DATA_DIR / 'census'
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Set up cache directory
+        self.enable_cache = enable_cache
+        if cache_dir is None:
+            self.cache_dir = self.output_dir / '_cache'
+        else:
+            self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Combined indicator responses (or the exception a combined request
+        # raised), keyed by (endpoint, year, state_fips)
+        self._indicator_tables = {}
+        self._indicator_lock = threading.Lock()
+
+    def _get_cache_path(self, url, params):
         """
-        Make API request with retry logic.
+        Get the cache file path for a request.
+
+        The file name is a hash of the URL and query parameters, excluding the
+        API key, so identical queries share one entry. Entries are gzipped;
+        the mostly numeric responses shrink several times over.
 
         Args:
             url: Full API URL
             params: Dictionary of query parameters
-            retries: Number of retries remaining
 
         Returns:
-            dict: JSON response from API
+            Path: Path to cache file
+        """
+        key = {k: v for k, v in params.items() if k != 'key'}
+        payload = json.dumps([url, key], sort_keys=True, default=str)
+        digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.json.gz"
+
+    def _load_from_cache(self, cache_path):
         """
-        params['key'] = self.api_key
+        Load data from cache file if it exists and has not expired.
+
+        Args:
+            cache_path: Path to cache file
 
+        Returns:
+            dict, list or None: Cached data if fresh, None otherwise
+        """
         try:
-            response = self.session.get(url, params=params, timeout=TIMEOUT)
-            response.raise_for_status()
+            if time.time() - cache_path.stat().st_mtime > CACHE_EXPIRE_AFTER:
+                return None
+            with gzip.open(cache_path, 'rt') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Failed to load cache from {cache_path}: {e}")
+            return None
+
+    def _save_to_cache(self, cache_path, data):
+        """
+        Save data to cache file.
 
-            try:
-                data = response.json()
-            except ValueError as json_err:
-                # Capture actual response text for debugging
-                print(f"JSON Parse Error. Response status: {response.status_code}")
-                print(f"Response headers: {dict(response.headers)}")
-                print(f"Response text (first 500 chars): {response.text[:500]}")
-                print(f"Full URL: {response.url}")
-                raise Exception(f"Invalid JSON response: {str(json_err)}")
+        Writes to a temporary file first so an interrupted run never leaves a
+        truncated cache entry behind.
 
-            # Census API returns errors as JSON with single element containing error message
-            if len(data) == 1 and isinstance(data[0], str) and 'error' in data[0].lower():
-                raise Exception(f"Census API Error: {data[0]}")
+        Args:
+            cache_path: Path to cache file
+            data: Data to cache
+        """
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            with gzip.open(tmp_path, 'wt', compresslevel=1) as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Warning: Failed to save cache to {cache_path}: {e}")
 
-            time.sleep(REQUEST_DELAY)
-            return data
+    def _make_request(self, url, params, skip_cache=False):
+        """
+        Make API request. Retries with backoff are handled by the session.
 
+        Requests are paced by the shared Census rate limiter, so concurrent
+        callers overlap up to the allowed rate instead of each sleeping.
+
+        Published ACS vintages do not change, so successful responses are
+        cached on disk (for CACHE_EXPIRE_AFTER seconds) unless the client was
+        created with enable_cache=False.
+
+        Args:
+            url: Full API URL
+            params: Dictionary of query parameters
+            skip_cache: If True, always query the API and refresh the cache
+
+        Returns:
+            dict: JSON response from API
+        """
+        use_cache = self.enable_cache and not skip_cache
+        cache_path = self._get_cache_path(url, params)
+        if use_cache:
+            cached_data = self._load_from_cache(cache_path)
+            if cached_data is not None:
+                return cached_data
+
+        params = {**params, 'key': self.api_key}
+        self.rate_limiter.acquire()
+
+        try:
+            response = self.session.get(url, params=params, timeout=TIMEOUT)
+            response.raise_for_status()
         except requests.exceptions.RequestException as e:
-            if retries > 0:
-                print(f"Request failed, retrying... ({retries} attempts left)")
-                time.sleep(REQUEST_DELAY * 2)
-                return self._make_request(url, params, retries - 1)
-            else:
-                raise Exception(f"Census API request failed after {MAX_RETRIES} attempts: {str(e)}")
+            # Census rejects bad queries with a 4xx status and the reason in the body
+            raise Exception(request_error_message('Census API', e)) from e
 
-    def get_acs5_data(self, year, variables, geography, state_fips=None):
+        # Successful queries are JSON; anything else (e.g. 204 for no data) is
+        # reported without attempting to parse it
+        content_type = response.headers.get('Content-Type', '')
+        try:
+            if 'json' not in content_type:
+                raise ValueError(f"unexpected Content-Type '{content_type}'")
+            data = response.json()
+        except ValueError as json_err:
+            # Capture actual response text for debugging
+            print(f"JSON Parse Error. Response status: {response.status_code}")
+            print(f"Response headers: {dict(response.headers)}")
+            print(f"Response text (first 500 chars): {response.text[:500]}")
+            print(f"Full URL: {response.url}")
+            raise Exception(f"Invalid JSON response: {str(json_err)}")
+
+        if self.enable_cache:
+            self._save_to_cache(cache_path, data)
+        return data
+
+    def _fetch(self, dataset, year, variables, geography='county:*', state_fips=None):
         """
-        Get ACS 5-year estimates data.
+        Request variables from one of the DATASET_PATHS endpoints.
 
         Args:
-            year: Year of ACS 5-year period end (e.g., 2022 for 2018-2022)
+            dataset: Key of DATASET_PATHS ('detail', 'subject', 'profile', 'dec2000')
+            year: Year of the data (ignored for fixed-year datasets)
             variables: List of variable codes or comma-separated string
             geography: Geographic level (e.g., 'county:*' for all counties)
             state_fips: State FIPS code (required for county-level data)
@@ -91,10 +399,10 @@ class CensusClient:
         Returns:
             list: API response as list of lists (first row is headers)
         """
-        if isinstance(variables, list):
+        if isinstance(variables, (list, tuple)):
             variables = ','.join(variables)
 
-        url = f"{self.base_url}/{year}/acs/acs5"
+        url = f"{self.base_url}/{DATASET_PATHS[dataset].format(year=year)}"
 
         params = {
             'get': variables,
@@ -107,6 +415,21 @@ class CensusClient:
 
         return self._make_request(url, params)
 
+    def get_acs5_data(self, year, variables, geography, state_fips=None):
+        """
+        Get ACS 5-year estimates data.
+
+        Args:
+            year: Year of ACS 5-year period end (e.g., 2022 for 2018-2022)
+            variables: List of variable codes or comma-separated string
+            geography: Geographic level (e.g., 'county:*' for all counties)
+            state_fips: State FIPS code (required for county-level data)
+
+        Returns:
+            list: API response as list of lists (first row is headers)
+        """
+        return self._fetch('detail', year, variables, geography, state_fips)
+
     def get_acs5_subject_table(self, year, variables, geography, state_fips=None):
         """
         Get ACS 5-year subject table data (S-tables).
@@ -120,20 +443,128 @@ class CensusClient:
         Returns:
             list: API response as list of lists
         """
-        if isinstance(variables, list):
-            variables = ','.join(variables)
+        return self._fetch('subject', year, variables, geography, state_fips)
 
-        url = f"{self.base_url}/{year}/acs/acs5/subject"
+    def _get_indicator_table(self, endpoint, year, state_fips):
+        """
+        Get every indicator in INDICATOR_VARIABLES[endpoint] for one state.
 
-        params = {
-            'get': variables,
-            'for': geography
-        }
+        The variables are requested in as few calls as the per-request limit
+        allows, merged by county, and kept for the life of the client. A
+        failure is kept as well and re-raised without another request.
 
-        if state_fips:
-            params['in'] = f'state:{state_fips}'
+        Args:
+            endpoint: 'subject' for S-tables or 'detail' for B-tables
+            year: Year of ACS 5-year period end
+            state_fips: State FIPS code
 
-        return self._make_request(url, params)
+        Returns:
+            list: Combined response as list of lists (first row is headers)
+        """
+        key = (endpoint, str(year), state_fips)
+        with self._indicator_lock:
+            table = self._indicator_tables.get(key)
+        if isinstance(table, Exception):
+            raise table
+        if table is not None:
+            return table
+
+        try:
+            table = self._fetch_combined(endpoint, year, INDICATOR_VARIABLES[endpoint], state_fips)
+        except Exception as e:
+            with self._indicator_lock:
+                self._indicator_tables[key] = e
+            raise
+
+        with self._indicator_lock:
+            self._indicator_tables[key] = table
+        return table
+
+    def _fetch_combined(self, endpoint, year, variables, state_fips):
+        """
+        Request any number of variables for a state's counties in as few calls as possible.
+
+        Args:
+            endpoint: Key of DATASET_PATHS for the variables' tables
+            year: Year of ACS 5-year period end
+            variables: Variable codes, without 'NAME'
+            state_fips: State FIPS code
+
+        Returns:
+            list: Merged response as list of lists (NAME, variables..., state, county)
+        """
+        table = None
+        per_request = MAX_VARIABLES_PER_REQUEST - 1  # NAME is sent with every part
+
+        for i in range(0, len(variables), per_request):
+            part = self._fetch(endpoint, year, ['NAME', *variables[i:i + per_request]], state_fips=state_fips)
+            table = part if table is None else self._merge_by_county(table, part)
+        return table
+
+    def _select_columns(self, table, variables):
+        """
+        Slice variables (plus state and county) out of a combined response.
+
+        Args:
+            table: Combined response as list of lists
+            variables: Variable codes to keep, in order
+
+        Returns:
+            list: Response with the same shape as requesting the variables alone
+        """
+        header = table[0]
+        columns = [header.index(var) for var in variables]
+        columns += [header.index('state'), header.index('county')]
+        return [[row[i] for i in columns] for row in table]
+
+    def _merge_by_county(self, table, part):
+        """
+        Append the variable columns of one response to another, matching rows by county.
+
+        Args:
+            table: Response whose rows are kept (NAME, variables..., state, county)
+            part: Response with the same geography and additional variables
+
+        Returns:
+            list: Merged response as list of lists
+        """
+        width = len(part[0]) - 3
+        part_values = {tuple(row[-2:]): row[1:-2] for row in part[1:]}
+
+        merged = [table[0][:-2] + part[0][1:-2] + table[0][-2:]]
+        for row in table[1:]:
+            values = part_values.get(tuple(row[-2:]), [None] * width)
+            merged.append(row[:-2] + values + row[-2:])
+        return merged
+
+    def _get_indicators(self, endpoint, year, variables, state_fips):
+        """
+        Get one indicator's columns for the counties in a state.
+
+        For INDICATOR_YEAR the columns are sliced out of the combined
+        per-state request, so the result has the same shape as requesting the
+        variables on their own. Other vintages, and states whose combined
+        request failed, request the variables alone.
+
+        Args:
+            endpoint: 'subject' for S-tables or 'detail' for B-tables
+            year: Year of ACS 5-year period end
+            variables: Variable codes, starting with 'NAME'
+            state_fips: State FIPS code
+
+        Returns:
+            list: API response as list of lists (first row is headers)
+        """
+        if not state_fips or int(year) != INDICATOR_YEAR:
+            return self._fetch(endpoint, year, variables, state_fips=state_fips)
+
+        try:
+            table = self._get_indicator_table(endpoint, year, state_fips)
+        except Exception as e:
+            print(f"  Combined {endpoint} request failed ({e}); requesting indicator alone")
+            return self._fetch(endpoint, year, variables, state_fips=state_fips)
+
+        return self._select_columns(table, variables)
 
     def get_households_with_children(self, year, state_fips=None):
         """
@@ -146,15 +577,8 @@ class CensusClient:
         Returns:
             list: API response with household data
         """
-        # S1101_C01_005E = Households with own children of the householder under 18 years (COUNT)
-        # S1101_C01_001E = Total households
-        # NOTE: S1101_C01_002E is average household size (not a count)
-        # NOTE: S1101_C01_010E is a percentage (not a count)
-        variables = ['NAME', 'S1101_C01_005E', 'S1101_C01_001E']
-
         if state_fips:
-            geography = 'county:*'
-            return self.get_acs5_subject_table(year, variables, geography, state_fips)
+            return self._get_indicators('subject', year, HOUSEHOLDS_WITH_CHILDREN_VARIABLES, state_fips)
         else:
             # Get for all counties (need to specify state)
             raise ValueError("state_fips required for county-level data")
@@ -170,11 +594,7 @@ class CensusClient:
         Returns:
             list: API response with poverty data
         """
-        # S1701_C03_001E = Percent below poverty level
-        variables = ['NAME', 'S1701_C03_001E']
-
-        geography = 'county:*'
-        return self.get_acs5_subject_table(year, variables, geography, state_fips)
+        return self._get_indicators('subject', year, POVERTY_RATE_VARIABLES, state_fips)
 
     def get_education_attainment(self, year, state_fips):
         """
@@ -187,19 +607,7 @@ class CensusClient:
         Returns:
             list: API response with education data
         """
-        # S1501 - Educational Attainment
-        # S1501_C02_015E = Percent bachelor's degree or higher (25+ population)
-        # S1501_C02_014E = Percent associate's degree or higher
-        # S1501_C02_009E = Percent high school graduate or higher
-        variables = [
-            'NAME',
-            'S1501_C02_015E',  # Bachelor's or higher
-            'S1501_C02_014E',  # Associate's or higher
-            'S1501_C02_009E'   # HS diploma or higher
-        ]
-
-        geography = 'county:*'
-        return self.get_acs5_subject_table(year, variables, geography, state_fips)
+        return self._get_indicators('subject', year, EDUCATION_ATTAINMENT_VARIABLES, state_fips)
 
     def get_housing_values(self, year, state_fips):
         """
@@ -212,12 +620,7 @@ class CensusClient:
         Returns:
             list: API response with housing data
         """
-        # B25077_001E = Median value (owner-occupied units)
-        # B25064_001E = Median gross rent
-        variables = ['NAME', 'B25077_001E', 'B25064_001E']
-
-        geography = 'county:*'
-        return self.get_acs5_data(year, variables, geography, state_fips)
+        return self._get_indicators('detail', year, HOUSING_VALUE_VARIABLES, state_fips)
 
     def get_occupation_data(self, year, state_fips):
         """
@@ -230,20 +633,7 @@ class CensusClient:
         Returns:
             list: API response with occupation data
         """
-        # S2401 - Occupation by Sex and Median Earnings
-        # Get employment counts by major occupation group
-        variables = [
-            'NAME',
-            'S2401_C01_001E',  # Total civilian employed population 16 years and over
-            'S2401_C01_002E',  # Management, business, science, and arts occupations
-            'S2401_C01_003E',  # Service occupations
-            'S2401_C01_004E',  # Sales and office occupations
-            'S2401_C01_005E',  # Natural resources, construction, and maintenance occupations
-            'S2401_C01_006E',  # Production, transportation, and material moving occupations
-        ]
-
-        geography = 'county:*'
-        return self.get_acs5_subject_table(year, variables, geography, state_fips)
+        return self._get_indicators('subject', year, OCCUPATION_VARIABLES, state_fips)
 
     def get_telecommuter_data(self, year, state_fips):
         """
@@ -256,23 +646,7 @@ class CensusClient:
         Returns:
             list: API response with telecommuter data
         """
-        # B08128 - Means of Transportation to Work by Class of Worker
-        # B08128_001E = Total workers 16 years and over
-        # B08128_002E = Workers who worked at home
-        # B08128_003E = Worked at home: Private wage and salary workers
-        # B08128_009E = Worked at home: Self-employed in own not incorporated business workers
-        # B08128_013E = Worked at home: Self-employed in own incorporated business workers
-        variables = [
-            'NAME',
-            'B08128_001E',  # Total workers
-            'B08128_002E',  # Total worked at home
-            'B08128_003E',  # Worked at home: Private wage and salary
-            'B08128_009E',  # Worked at home: Self-employed not incorporated
-            'B08128_013E',  # Worked at home: Self-employed incorporated
-        ]
-
-        geography = 'county:*'
-        return self.get_acs5_data(year, variables, geography, state_fips)
+        return self._get_indicators('detail', year, TELECOMMUTER_VARIABLES, state_fips)
 
     # ===== Component 4: Demographic Growth & Renewal Methods =====
 
@@ -287,16 +661,7 @@ class CensusClient:
             list: API response with population data
         """
         # P001001 = Total population (SF1 table)
-        url = f"{self.base_url}/2000/dec/sf1"
-
-        params = {
-            'get': 'NAME,P001001',
-            'for': 'county:*',
-            'in': f'state:{state_fips}',
-            'key': self.api_key
-        }
-
-        return self._make_request(url, params)
+        return self._fetch('dec2000', 2000, 'NAME,P001001', state_fips=state_fips)
 
     def get_population_total(self, year, state_fips):
         """
@@ -309,10 +674,7 @@ class CensusClient:
         Returns:
             list: API response with population data
         """
-        # B01001_001E = Total population
-        variables = ['NAME', 'B01001_001E']
-        geography = 'county:*'
-        return self.get_acs5_data(year, variables, geography, state_fips)
+        return self._get_indicators('detail', year, POPULATION_VARIABLES, state_fips)
 
     def get_age_distribution(self, year, state_fips):
         """
@@ -325,66 +687,7 @@ class CensusClient:
         Returns:
             list: API response with age distribution data
         """
-        # B01001 - Sex by Age
-        # We need age breakdowns to calculate dependency ratio
-        # Under 15: sum of age 0-14 groups
-        # 15-64: working age population
-        # 65+: elderly dependents
-        variables = [
-            'NAME',
-            'B01001_001E',  # Total population
-            # Male population by age
-            'B01001_003E',  # Male: Under 5 years
-            'B01001_004E',  # Male: 5 to 9 years
-            'B01001_005E',  # Male: 10 to 14 years
-            'B01001_006E',  # Male: 15 to 17 years
-            'B01001_007E',  # Male: 18 and 19 years
-            'B01001_008E',  # Male: 20 years
-            'B01001_009E',  # Male: 21 years
-            'B01001_010E',  # Male: 22 to 24 years
-            'B01001_011E',  # Male: 25 to 29 years
-            'B01001_012E',  # Male: 30 to 34 years
-            'B01001_013E',  # Male: 35 to 39 years
-            'B01001_014E',  # Male: 40 to 44 years
-            'B01001_015E',  # Male: 45 to 49 years
-            'B01001_016E',  # Male: 50 to 54 years
-            'B01001_017E',  # Male: 55 to 59 years
-            'B01001_018E',  # Male: 60 and 61 years
-            'B01001_019E',  # Male: 62 to 64 years
-            'B01001_020E',  # Male: 65 and 66 years
-            'B01001_021E',  # Male: 67 to 69 years
-            'B01001_022E',  # Male: 70 to 74 years
-            'B01001_023E',  # Male: 75 to 79 years
-            'B01001_024E',  # Male: 80 to 84 years
-            'B01001_025E',  # Male: 85 years and over
-            # Female population by age
-            'B01001_027E',  # Female: Under 5 years
-            'B01001_028E',  # Female: 5 to 9 years
-            'B01001_029E',  # Female: 10 to 14 years
-            'B01001_030E',  # Female: 15 to 17 years
-            'B01001_031E',  # Female: 18 and 19 years
-            'B01001_032E',  # Female: 20 years
-            'B01001_033E',  # Female: 21 years
-            'B01001_034E',  # Female: 22 to 24 years
-            'B01001_035E',  # Female: 25 to 29 years
-            'B01001_036E',  # Female: 30 to 34 years
-            'B01001_037E',  # Female: 35 to 39 years
-            'B01001_038E',  # Female: 40 to 44 years
-            'B01001_039E',  # Female: 45 to 49 years
-            'B01001_040E',  # Female: 50 to 54 years
-            'B01001_041E',  # Female: 55 to 59 years
-            'B01001_042E',  # Female: 60 and 61 years
-            'B01001_043E',  # Female: 62 to 64 years
-            'B01001_044E',  # Female: 65 and 66 years
-            'B01001_045E',  # Female: 67 to 69 years
-            'B01001_046E',  # Female: 70 to 74 years
-            'B01001_047E',  # Female: 75 to 79 years
-            'B01001_048E',  # Female: 80 to 84 years
-            'B01001_049E',  # Female: 85 years and over
-        ]
-
-        geography = 'county:*'
-        return self.get_acs5_data(year, variables, geography, state_fips)
+        return self._get_indicators('detail', year, AGE_DISTRIBUTION_VARIABLES, state_fips)
 
     def get_median_age(self, year, state_fips):
         """
@@ -397,10 +700,7 @@ class CensusClient:
         Returns:
             list: API response with median age data
         """
-        # B01002_001E = Median age
-        variables = ['NAME', 'B01002_001E']
-        geography = 'county:*'
-        return self.get_acs5_data(year, variables, geography, state_fips)
+        return self._get_indicators('detail', year, MEDIAN_AGE_VARIABLES, state_fips)
 
     def get_hispanic_data(self, year, state_fips):
         """
@@ -413,12 +713,7 @@ class CensusClient:
         Returns:
             list: API response with Hispanic data
         """
-        # B03003 - Hispanic or Latino Origin
-        # B03003_001E = Total population
-        # B03003_003E = Hispanic or Latino
-        variables = ['NAME', 'B03003_001E', 'B03003_003E']
-        geography = 'county:*'
-        return self.get_acs5_data(year, variables, geography, state_fips)
+        return self._get_indicators('detail', year, HISPANIC_VARIABLES, state_fips)
 
     def get_race_data(self, year, state_fips):
         """
@@ -431,12 +726,7 @@ class CensusClient:
         Returns:
             list: API response with race data
         """
-        # B02001 - Race
-        # B02001_001E = Total population
-        # B02001_002E = White alone
-        variables = ['NAME', 'B02001_001E', 'B02001_002E']
-        geography = 'county:*'
-        return self.get_acs5_data(year, variables, geography, state_fips)
+        return self._get_indicators('detail', year, RACE_VARIABLES, state_fips)
 
     # ===== Component 5: Education & Skill Methods =====
 
@@ -451,18 +741,7 @@ class CensusClient:
         Returns:
             list: API response with detailed education data
         """
-        # B15003 - Educational Attainment for the Population 25 Years and Over
-        # Need exclusive categories (highest level achieved)
-        variables = [
-            'NAME',
-            'B15003_001E',  # Total population 25 years and over
-            'B15003_017E',  # Regular high school diploma
-            'B15003_018E',  # GED or alternative credential
-            'B15003_021E',  # Associate's degree
-            'B15003_022E',  # Bachelor's degree
-        ]
-        geography = 'county:*'
-        return self.get_acs5_data(year, variables, geography, state_fips)
+        return self._get_indicators('detail', year, EDUCATION_DETAILED_VARIABLES, state_fips)
 
     def get_labor_force_participation(self, year, state_fips):
         """
@@ -475,12 +754,7 @@ class CensusClient:
         Returns:
             list: API response with labor force data
         """
-        # B23025 - Employment Status for the Population 16 Years and Over
-        # B23025_001E = Total population 16 years and over
-        # B23025_002E = In labor force
-        variables = ['NAME', 'B23025_001E', 'B23025_002E']
-        geography = 'county:*'
-        return self.get_acs5_data(year, variables, geography, state_fips)
+        return self._get_indicators('detail', year, LABOR_FORCE_VARIABLES, state_fips)
 
     def get_knowledge_workers(self, year, state_fips):
         """
@@ -497,15 +771,7 @@ class CensusClient:
         Returns:
             list: API response with occupation employment data
         """
-        # S2401 - Occupation by Sex and Median Earnings
-        # Use occupation groups as proxy for knowledge workers
-        variables = [
-            'NAME',
-            'S2401_C01_001E',  # Total civilian employed population 16 years and over
-            'S2401_C01_002E',  # Management, business, science, and arts occupations
-        ]
-        geography = 'county:*'
-        return self.get_acs5_subject_table(year, variables, geography, state_fips)
+        return self._get_indicators('subject', year, KNOWLEDGE_WORKER_VARIABLES, state_fips)
 
     # ===== Component 7: Quality of Life Methods =====
 
@@ -520,11 +786,7 @@ class CensusClient:
         Returns:
             list: API response with commute time data
         """
-        # S0801 - Commuting Characteristics by Sex
-        # S0801_C01_046E = Mean travel time to work (minutes)
-        variables = ['NAME', 'S0801_C01_046E']
-        geography = 'county:*'
-        return self.get_acs5_subject_table(year, variables, geography, state_fips)
+        return self._get_indicators('subject', year, COMMUTE_TIME_VARIABLES, state_fips)
 
     def get_housing_age(self, year, state_fips):
         """
@@ -538,25 +800,55 @@ class CensusClient:
             list: API response with housing age data
         """
         # DP04 - Selected Housing Characteristics (Profile table)
-        # Need to use profile endpoint
-        url = f"{self.base_url}/{year}/acs/acs5/profile"
+        return self._fetch('profile', year, HOUSING_AGE_VARIABLES, state_fips=state_fips)
+
+    def gather_states(self, fetch, state_fips_list, max_workers=8):
+        """
+        Run a per-state fetch for every requested state in parallel.
 
-        variables = [
-            'NAME',
-            'DP04_0033E',  # Total housing units
-            'DP04_0035E',  # Built 1939 or earlier
-            'DP04_0036E',  # Built 1940 to 1949
-            'DP04_0037E',  # Built 1950 to 1959
-        ]
+        Each state is an independent, network-bound request, so a thread pool
+        overlaps their round trips instead of paying them one after another.
+        Results come back in STATE_FIPS order so output stays stable.
 
-        params = {
-            'get': ','.join(variables),
-            'for': 'county:*',
-            'in': f'state:{state_fips}',
-            'key': self.api_key
-        }
+        Args:
+            fetch: Callable taking a state FIPS code and returning an API response
+            state_fips_list: List of state FIPS codes
+            max_workers: Maximum number of concurrent requests
 
-        return self._make_request(url, params)
+        Returns:
+            list: (state_name, state_fips, future) tuples
+        """
+        states = [(name, fips) for name, fips in STATE_FIPS.items() if fips in state_fips_list]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(name, fips, executor.submit(fetch, fips)) for name, fips in states]
+
+        return futures
+
+    def parse_response_to_df(self, response):
+        """
+        Convert Census API response to a DataFrame.
+
+        Preferred over parse_response_to_dict: the rows go straight into
+        columns without building a dict per row. Estimate columns (codes ending
+        in 'E') are converted to numbers; NAME and the geography codes stay as
+        strings so FIPS codes can still be concatenated.
+
+        Args:
+            response: Census API response (list of lists)
+
+        Returns:
+            DataFrame with one row per county and API variables as columns
+        """
+        if not response or len(response) < 2:
+            return pd.DataFrame()
+
+        df = pd.DataFrame(response[1:], columns=response[0])
+
+        estimate_columns = [col for col in df.columns if col != 'NAME' and col.endswith('E')]
+        df[estimate_columns] = df[estimate_columns].apply(pd.to_numeric, errors='coerce')
+
+        return df
 
     def parse_response_to_dict(self, response):
         """
@@ -576,22 +868,44 @@ class CensusClient:
 
         return [dict(zip(headers, row)) for row in data_rows]
 
-    def save_response(self, data, filename):
+    def save_response(self, data, filename, pretty=False, compress=False):
         """
         Save API response to file.
 
         Args:
             data: Response data (list)
             filename: Output filename (will be saved in data/raw/census/)
-        """
-        output_dir = RAW_DATA_DIR / 'census'
-        output_dir.mkdir(parents=True, exist_ok=True)
+            pretty: If True, indent the JSON for reading by hand
+            compress: If True, gzip the file and add a .gz suffix
 
-        output_path = output_dir / filename
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        Returns:
+            Path: Path of the written file
+        """
+        output_path = self.output_dir / filename
+        if compress:
+            output_path = output_path.with_name(output_path.name + '.gz')
+        write_json(output_path, data, pretty)
 
         print(f"Saved: {output_path}")
+        return output_path
+
+    def load_response(self, filename):
+        """
+        Load a response written by save_response, gzipped or not.
+
+        Args:
+            filename: File name in data/raw/census/, with or without .gz
+
+        Returns:
+            list: Saved response data
+        """
+        path = self.output_dir / filename
+        if path.suffix != '.gz' and not path.exists():
+            path = path.with_name(path.name + '.gz')
+
+        opener = gzip.open if path.suffix == '.gz' else open
+        with opener(path, 'rt') as f:
+            return json.load(f)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,232 @@
+"""
+County Health Rankings & Roadmaps Client
+
+This client downloads the County Health Rankings (CHR) analytic data release
+archived on Zenodo and reads its county-level CSV.
+Primary use: Life expectancy, voter turnout, and social associations by county
+
+Data Source: https://zenodo.org/records/17584421 (DOI 10.5281/zenodo.17584421)
+Documentation: https://www.countyhealthrankings.org/health-data/methodology-and-sources/data-documentation
+"""
+
+import requests
+import pandas as pd
+import zipfile
+import os
+import re
+import time
+from email.utils import formatdate
+from functools import lru_cache
+from pathlib import Path
+import sys
+
+# Add parent directory to path to import config
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from config import RAW_DATA_DIR, CACHE_EXPIRE_AFTER, create_session, ensure_dir
+
+# Zenodo record holding one ZIP per CHR release year
+ZENODO_RECORD_URL = 'https://zenodo.org/api/records/17584421'
+
+# Bytes read from the network per chunk while streaming a download to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Identifier columns (FIPS codes and names) kept whenever columns are selected
+ID_COLUMN_PATTERNS = ('fips', 'name')
+
+
+@lru_cache(maxsize=32)
+def _column_matcher(patterns):
+    """
+    Compile column-name substrings into one case-insensitive regex.
+
+    Args:
+        patterns: Tuple of substrings
+
+    Returns:
+        re.Pattern: Pattern matching any of the substrings
+    """
+    return re.compile('|'.join(map(re.escape, patterns)), re.IGNORECASE)
+
+
+class CountyHealthRankingsClient:
+    """Client for County Health Rankings analytic data releases"""
+
+    def __init__(self):
+        """Initialize County Health Rankings client."""
+        self.base_url = ZENODO_RECORD_URL
+        self.session = create_session()
+        self.raw_data_dir = ensure_dir(RAW_DATA_DIR / 'chr')
+
+    def download_analytic_data(self, year):
+        """
+        Download the CHR release ZIP for a year, reusing a previous download.
+
+        The ZIP (~50 MB) is streamed to disk in chunks rather than held in
+        memory, so each release is fetched once and shared by every measure.
+        A copy older than CACHE_EXPIRE_AFTER is revalidated with a conditional
+        GET (the saved ETag and its modification time), and kept if Zenodo
+        answers 304 Not Modified.
+
+        Args:
+            year: Year of CHR data release (e.g., 2025)
+
+        Returns:
+            Path: Path to the downloaded ZIP file
+        """
+        zip_path = self.raw_data_dir / f'chr_{year}.zip'
+        etag_path = zip_path.with_suffix('.etag')
+
+        headers = {}
+        if zip_path.exists():
+            mtime = zip_path.stat().st_mtime
+            if time.time() - mtime <= CACHE_EXPIRE_AFTER:
+                print(f"Using cached CHR {year} release: {zip_path}")
+                return zip_path
+            headers['If-Modified-Since'] = formatdate(mtime, usegmt=True)
+            if etag_path.exists():
+                headers['If-None-Match'] = etag_path.read_text().strip()
+
+        if headers:
+            print(f"Checking Zenodo for changes to cached CHR {year} release...")
+        else:
+            print(f"Downloading data from Zenodo... (this may take a minute, ~50 MB)")
+        url = f"{self.base_url}/files/{year}.zip/content"
+        tmp_path = zip_path.with_suffix('.tmp')
+
+        try:
+            with self.session.get(url, headers=headers, timeout=300, stream=True) as response:
+                if response.status_code == 304:
+                    # Unchanged upstream: restart the expiry clock and reuse it
+                    os.utime(zip_path)
+                    print(f"✓ CHR {year} release unchanged, using {zip_path}")
+                    return zip_path
+
+                response.raise_for_status()
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                etag = response.headers.get('ETag')
+            os.replace(tmp_path, zip_path)
+        except requests.exceptions.RequestException as e:
+            tmp_path.unlink(missing_ok=True)
+            raise Exception(f"Failed to download CHR data: {str(e)}")
+
+        if etag:
+            etag_path.write_text(etag)
+        else:
+            etag_path.unlink(missing_ok=True)
+
+        file_size_mb = zip_path.stat().st_size / (1024 * 1024)
+        print(f"✓ Downloaded {file_size_mb:.1f} MB")
+        return zip_path
+
+    def read_analytic_data(self, year, column_patterns=None):
+        """
+        Read the county-level analytic CSV from a CHR release.
+
+        The analytic file has several hundred columns. When column_patterns
+        is given, only matching columns (plus the FIPS and name columns) are
+        parsed, which skips most of the file's conversion work.
+
+        Args:
+            year: Year of CHR data release (e.g., 2025)
+            column_patterns: Lowercase substrings selecting measure columns
+                (e.g., ['v177_rawvalue', 'voter turnout raw']). None reads all.
+
+        Returns:
+            tuple: (DataFrame of analytic data, name of the CSV inside the ZIP)
+        """
+        usecols = None
+        if column_patterns:
+            usecols = _column_matcher(tuple(column_patterns) + ID_COLUMN_PATTERNS).search
+
+        zip_path = self.download_analytic_data(year)
+
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            file_list = zip_ref.namelist()
+
+            # Look for analytic data file
+            analytic_files = [
+                f for f in file_list
+                if ('analytic' in f.lower() or 'data' in f.lower())
+                and f.endswith('.csv')
+                and not f.startswith('__MACOSX')
+            ]
+
+            if not analytic_files:
+                analytic_files = [f for f in file_list if f.endswith('.csv') and not f.startswith('__MACOSX')]
+
+            if not analytic_files:
+                raise Exception("No CSV data files found in ZIP")
+
+            # Read the first analytic file
+            filename = analytic_files[0]
+            print(f"Reading: {filename}")
+
+            with zip_ref.open(filename) as f:
+                df = pd.read_csv(f, encoding='utf-8', usecols=usecols, low_memory=False)
+
+        return df, filename
+
+    def find_column(self, df, column_patterns):
+        """
+        Find the first column whose name contains any of the given substrings.
+
+        Args:
+            df: DataFrame from read_analytic_data
+            column_patterns: Substrings to look for (case-insensitive)
+
+        Returns:
+            str or None: Matching column name, or None if no column matches
+        """
+        matcher = _column_matcher(tuple(column_patterns))
+        return next((col for col in df.columns if matcher.search(str(col))), None)
+
+    def filter_to_states(self, df, state_fips_list):
+        """
+        Keep rows for counties in the given states.
+
+        The 5-digit county FIPS code is taken from whichever FIPS columns the
+        release provides, and rows are selected with one vectorized isin over
+        a set of state codes.
+
+        Args:
+            df: DataFrame from read_analytic_data
+            state_fips_list: Iterable of 2-digit state FIPS codes
+
+        Returns:
+            DataFrame: Matching rows with added 'full_fips' and 'state_fips' columns
+        """
+        fips_5digit_cols = [c for c in df.columns if '5-digit' in c.lower() and 'fips' in c.lower()]
+        fipscode_cols = [c for c in df.columns if 'fipscode' in c.lower()]
+
+        if fips_5digit_cols:
+            full_fips = df[fips_5digit_cols[0]].astype(str).str.zfill(5)
+        elif fipscode_cols:
+            full_fips = df[fipscode_cols[0]].astype(str).str.zfill(5)
+        else:
+            # Look for state and county FIPS columns
+            state_cols = [c for c in df.columns if 'state' in c.lower() and 'fips' in c.lower()]
+            county_cols = [c for c in df.columns if 'county' in c.lower() and 'fips' in c.lower()]
+
+            if state_cols and county_cols:
+                full_fips = (
+                    df[state_cols[0]].astype(str).str.zfill(2) +
+                    df[county_cols[0]].astype(str).str.zfill(3)
+                )
+            else:
+                raise Exception("Cannot determine FIPS code structure")
+
+        state_fips = full_fips.str[:2]
+        mask = state_fips.isin(frozenset(state_fips_list))
+        return df[mask].assign(full_fips=full_fips[mask], state_fips=state_fips[mask])
+
+
+if __name__ == '__main__':
+    # Test the CHR client
+    print("Testing County Health Rankings Client...")
+    print("=" * 60)
+
+    client = CountyHealthRankingsClient()
+    df, source_file = client.read_analytic_data(2025)
+    print(f"\n✓ Read {len(df)} rows and {len(df.columns)} columns from {source_file}")
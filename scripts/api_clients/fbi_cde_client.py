@@ -8,14 +8,17 @@ API Documentation: https://api.usa.gov/crime/fbi/cde/
 """
 
 import requests
-import time
 import json
+import gzip
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import sys
 
 # Add parent directory to path to import config
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from config import FBI_UCR_KEY, REQUEST_DELAY, MAX_RETRIES, TIMEOUT, RAW_DATA_DIR
+from config import FBI_UCR_KEY, TIMEOUT, RAW_DATA_DIR, create_session, ensure_dir, get_rate_limiter, request_error_message
 
 
 class FBICrimeClient:
@@ -34,22 +37,23 @@ class FBICrimeClient:
             raise ValueError("FBI_UCR_KEY is required")
 
         self.base_url = "https://api.usa.gov/crime/fbi/cde"
-        self.session = requests.Session()
+        self.session = create_session()
+        self.rate_limiter = get_rate_limiter(self.base_url)
 
         # Set up cache directory
-        if cache_dir is None:
-            self.cache_dir = RAW_DATA_DIR / 'fbi_cde'
-        else:
-            self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = ensure_dir(RAW_DATA_DIR / 'fbi_cde' if cache_dir is None else Path(cache_dir))
 
-        # Track API calls
+        # Track API calls (incremented from worker threads in batch fetches)
         self.api_calls_made = 0
+        self._calls_lock = threading.Lock()
 
     def _get_cache_path(self, ori, offense, from_date, to_date):
         """
         Get the cache file path for a specific request.
 
+        Entries are sharded into two levels of subdirectories by ORI prefix
+        (e.g. VA/00/) so no single directory holds thousands of files.
+
         Args:
             ori: ORI code
             offense: 'V' for violent, 'P' for property
@@ -61,60 +65,75 @@ class FBICrimeClient:
         """
         # Create filename from parameters
         offense_name = 'violent' if offense == 'V' else 'property'
-        filename = f"{ori}_{offense_name}_{from_date}_{to_date}.json"
+        filename = f"{ori}_{offense_name}_{from_date}_{to_date}.json.gz"
         filename = filename.replace('-', '_')
-        return self.cache_dir / filename
+        return self.cache_dir / ori[:2] / ori[2:4] / filename
 
     def _load_from_cache(self, cache_path):
         """
         Load data from cache file if it exists.
 
+        Falls back to the uncompressed file in the top-level cache directory
+        written by earlier versions of this client.
+
         Args:
             cache_path: Path to cache file
 
         Returns:
             dict or None: Cached data if exists, None otherwise
         """
-        if cache_path.exists():
-            try:
-                with open(cache_path, 'r') as f:
+        legacy_path = self.cache_dir / cache_path.name[:-len('.gz')]
+        try:
+            if cache_path.exists():
+                with gzip.open(cache_path, 'rt') as f:
                     return json.load(f)
-            except Exception as e:
-                print(f"Warning: Failed to load cache from {cache_path}: {e}")
-                return None
+            if legacy_path.exists():
+                with open(legacy_path, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Warning: Failed to load cache from {cache_path}: {e}")
         return None
 
     def _save_to_cache(self, cache_path, data):
         """
         Save data to cache file.
 
+        Writes to a temporary file first so an interrupted run never leaves a
+        truncated cache entry behind.
+
         Args:
             cache_path: Path to cache file
             data: Data to cache
         """
+        tmp_path = cache_path.with_suffix('.tmp')
         try:
-            with open(cache_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_path, 'wt', compresslevel=3) as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, cache_path)
         except Exception as e:
             print(f"Warning: Failed to save cache to {cache_path}: {e}")
 
-    def _make_request(self, endpoint, params, retries=MAX_RETRIES):
+    def _make_request(self, endpoint, params):
         """
-        Make API request with retry logic.
+        Make API request. Retries with backoff are handled by the session.
+
+        Requests are paced by the shared rate limiter for api.usa.gov rather
+        than a fixed sleep after each call.
 
         Args:
             endpoint: API endpoint path
             params: Dictionary of query parameters
-            retries: Number of retries remaining
 
         Returns:
-            dict: JSON response from API or None if failed
+            dict: JSON response from API
         """
         # Add API key to params
-        params['API_KEY'] = self.api_key
+        params = {**params, 'API_KEY': self.api_key}
 
         url = f"{self.base_url}{endpoint}"
 
+        self.rate_limiter.acquire()
         try:
             response = self.session.get(
                 url,
@@ -123,27 +142,22 @@ class FBICrimeClient:
             )
 
             # Track API call
-            self.api_calls_made += 1
+            with self._calls_lock:
+                self.api_calls_made += 1
 
             response.raise_for_status()
-            data = response.json()
-
-            time.sleep(REQUEST_DELAY)
-            return data
+            return response.json()
 
         except requests.exceptions.RequestException as e:
-            if retries > 0:
-                print(f"Request failed, retrying... ({retries} attempts left)")
-                time.sleep(REQUEST_DELAY * 2)
-                return self._make_request(endpoint, params, retries - 1)
-            else:
-                print(f"FBI API request failed after {MAX_RETRIES} attempts: {str(e)}")
-                return None
+            raise Exception(request_error_message('FBI API', e)) from e
 
     def get_summarized_data(self, ori, offense, from_date, to_date, use_cache=True):
         """
         Get summarized crime data for a specific agency and offense type.
 
+        A failed request raises and is not cached, so the next run asks the
+        API again instead of reusing the failure.
+
         Args:
             ori: 7-character ORI code (e.g., 'VA0010100')
             offense: Offense type - 'V' for violent crime, 'P' for property crime
@@ -152,7 +166,7 @@ class FBICrimeClient:
             use_cache: Whether to use cached data if available
 
         Returns:
-            dict or None: Crime data or None if request fails
+            dict: Crime data
         """
         # Validate offense type
         if offense not in ['V', 'P']:
@@ -177,7 +191,7 @@ class FBICrimeClient:
         # Make request
         data = self._make_request(endpoint, params)
 
-        # Cache the result (even if None/error)
+        # Cache the result (failed requests raise above and are never cached)
         if use_cache:
             self._save_to_cache(cache_path, data)
 
@@ -194,7 +208,7 @@ class FBICrimeClient:
             use_cache: Whether to use cached data
 
         Returns:
-            dict or None: Violent crime data or None if request fails
+            dict: Violent crime data
         """
         return self.get_summarized_data(ori, 'V', from_date, to_date, use_cache)
 
@@ -209,7 +223,7 @@ class FBICrimeClient:
             use_cache: Whether to use cached data
 
         Returns:
-            dict or None: Property crime data or None if request fails
+            dict: Property crime data
         """
         return self.get_summarized_data(ori, 'P', from_date, to_date, use_cache)
 
@@ -231,6 +245,52 @@ class FBICrimeClient:
             'property': self.get_property_crime(ori, from_date, to_date, use_cache)
         }
 
+    def get_all_crime_data_batch(self, oris, from_date, to_date, use_cache=True, max_workers=16,
+                                 progress_every=None):
+        """
+        Get violent and property crime data for many agencies concurrently.
+
+        Each (ORI, offense) pair is an independent request, so they are run on
+        a thread pool sharing the session's connection pool. The shared rate
+        limiter still caps the request rate across all threads.
+
+        Args:
+            oris: List of 7-character ORI codes
+            from_date: Start date in format 'MM-YYYY'
+            to_date: End date in format 'MM-YYYY'
+            use_cache: Whether to use cached data
+            max_workers: Maximum number of concurrent requests
+            progress_every: If set, print progress each time this many more
+                agencies have both results
+
+        Returns:
+            dict: ORI -> {'violent': data, 'property': data}, in the order of oris.
+                A request that raised is recorded as its exception instead of data.
+        """
+        offenses = (('violent', 'V'), ('property', 'P'))
+        results = {ori: {} for ori in oris}
+        agencies_done = 0
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.get_summarized_data, ori, offense, from_date, to_date, use_cache): (ori, key)
+                for ori in results
+                for key, offense in offenses
+            }
+
+            for future in as_completed(futures):
+                ori, key = futures[future]
+                error = future.exception()
+                results[ori][key] = error if error is not None else future.result()
+
+                if progress_every and len(results[ori]) == len(offenses):
+                    agencies_done += 1
+                    if agencies_done % progress_every == 0 or agencies_done == len(results):
+                        print(f"    Progress: {agencies_done}/{len(results)} agencies "
+                              f"({agencies_done/len(results)*100:.1f}%) - API calls: {self.api_calls_made}")
+
+        return results
+
 
 if __name__ == '__main__':
     # Test the FBI CDE API client
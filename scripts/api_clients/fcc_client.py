@@ -9,7 +9,7 @@ API Base: https://broadbandmap.fcc.gov/api/public/map
 """
 
 import requests
-import time
+import os
 import pandas as pd
 from pathlib import Path
 import sys
@@ -18,7 +18,49 @@ import zipfile
 
 # Add parent directory to path to import config
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from config import REQUEST_DELAY, MAX_RETRIES, TIMEOUT, RAW_DATA_DIR, FCC_BB_KEY, FCC_USERNAME
+from config import TIMEOUT, RAW_DATA_DIR, FCC_BB_KEY, FCC_USERNAME, create_session, get_rate_limiter, request_error_message
+
+# Bytes read from the network per chunk while streaming a download to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Columns (and their dtypes) read from the nationwide geography summary CSV.
+# The filter columns hold a handful of repeated labels, so they are parsed
+# straight into categoricals.
+GEO_SUMMARY_DTYPES = {
+    'geography_type': 'category',
+    'geography_id': str,
+    'geography_desc': str,
+    'technology': 'category',
+    'area_data_type': 'category',
+    'biz_res': 'category',
+    'total_units': 'Int64',
+    'speed_100_20': 'float64',
+}
+
+# Dtypes of the processed county summary cache
+COUNTY_SUMMARY_DTYPES = {
+    'county_fips': str,
+    'county_name': str,
+    'total_locations': 'Int64',
+    'percent_covered_100_20': 'float64',
+}
+
+
+def _filter_to_states(df, state_fips_list):
+    """
+    Keep county rows whose FIPS code falls in the given states.
+
+    The state prefix is sliced once from the string county_fips column and
+    tested in a single vectorized isin against a set of state codes.
+
+    Args:
+        df: DataFrame with a 5-digit string 'county_fips' column
+        state_fips_list: Iterable of 2-digit state FIPS codes
+
+    Returns:
+        DataFrame: Rows for counties in the given states
+    """
+    return df[df['county_fips'].str.slice(0, 2).isin(frozenset(state_fips_list))]
 
 
 class FCCBroadbandClient:
@@ -36,7 +78,7 @@ class FCCBroadbandClient:
         # Username should be from FCC User Registration
         self.username = username or FCC_USERNAME
         self.base_url = 'https://broadbandmap.fcc.gov/api/public'  # Per swagger spec
-        self.session = requests.Session()
+        self.session = create_session()
 
         # Set up authentication headers (per BDC Public Data API swagger spec)
         # IMPORTANT: Custom user-agent required to avoid blocking (per Stack Overflow workaround)
@@ -51,39 +93,32 @@ class FCCBroadbandClient:
         self.cache_dir = RAW_DATA_DIR / 'fcc' / 'api_cache'
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-    def _make_request(self, endpoint, params=None, retries=MAX_RETRIES):
+    def _make_request(self, endpoint, params=None):
         """
-        Make API request with retry logic.
+        Make API request. Retries with backoff are handled by the session.
 
         Args:
             endpoint: API endpoint (e.g., 'listAsOfDates')
             params: Query parameters (optional)
-            retries: Number of retries remaining
 
         Returns:
             dict or DataFrame: JSON response or parsed data
         """
         url = f"{self.base_url}/{endpoint}"
 
+        get_rate_limiter(url).acquire()
         try:
             response = self.session.get(url, params=params, timeout=TIMEOUT)
             response.raise_for_status()
-            time.sleep(REQUEST_DELAY)
-
-            # Try to parse as JSON
-            try:
-                return response.json()
-            except json.JSONDecodeError:
-                # Some endpoints might return other formats
-                return response.text
-
         except requests.exceptions.RequestException as e:
-            if retries > 0:
-                print(f"  Request failed, retrying... ({retries} attempts left)")
-                time.sleep(REQUEST_DELAY * 2)
-                return self._make_request(endpoint, params, retries - 1)
-            else:
-                raise Exception(f"FCC API request failed after {MAX_RETRIES} attempts: {str(e)}")
+            raise Exception(request_error_message('FCC API', e)) from e
+
+        # Try to parse as JSON
+        try:
+            return response.json()
+        except json.JSONDecodeError:
+            # Some endpoints might return other formats
+            return response.text
 
     def get_available_dates(self):
         """
@@ -188,23 +223,24 @@ class FCCBroadbandClient:
 
         print(f"Downloading file ID {file_id}...")
 
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = output_path.with_name(output_path.name + '.part')
+
         try:
             # Make request with streaming for large files
             url = f"{self.base_url}/{endpoint}"
-            response = self.session.get(url, timeout=TIMEOUT, stream=True)
-            response.raise_for_status()
-
-            # Save the file
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write in chunks for memory efficiency
-            total_size = 0
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
+            with self.session.get(url, timeout=TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+
+                # Write in large chunks to a .part file so a failed download
+                # never leaves a truncated file at output_path
+                total_size = 0
+                with open(part_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                         f.write(chunk)
                         total_size += len(chunk)
+            os.replace(part_path, output_path)
 
             # Convert to MB
             total_mb = total_size / (1024 * 1024)
@@ -212,6 +248,7 @@ class FCCBroadbandClient:
             return True
 
         except Exception as e:
+            part_path.unlink(missing_ok=True)
             print(f"  Error downloading file {file_id}: {str(e)}")
             return False
 
@@ -254,12 +291,12 @@ class FCCBroadbandClient:
         cache_file = self.cache_dir / f'county_summary_{as_of_date}.csv'
         if use_cache and cache_file.exists():
             print(f"\nLoading from cache: {cache_file}")
-            df = pd.read_csv(cache_file, dtype={'county_fips': str})
+            df = pd.read_csv(cache_file, dtype=COUNTY_SUMMARY_DTYPES)
             print(f"✓ Loaded {len(df):,} records from cache")
 
             # Apply filtering if needed
             if state_fips_list:
-                df = df[df['county_fips'].str[:2].isin(state_fips_list)]
+                df = _filter_to_states(df, state_fips_list)
                 print(f"✓ Filtered to {len(state_fips_list)} states: {len(df):,} counties")
 
             return df
@@ -313,7 +350,7 @@ class FCCBroadbandClient:
         # Read the extracted CSV
         csv_file = extract_dir / file_list[0]
         print(f"\nLoading extracted CSV...")
-        df = pd.read_csv(csv_file, low_memory=False)
+        df = pd.read_csv(csv_file, usecols=list(GEO_SUMMARY_DTYPES), dtype=GEO_SUMMARY_DTYPES)
         print(f"  ✓ Loaded {len(df):,} total records")
 
         # Filter to county records only
@@ -323,35 +360,24 @@ class FCCBroadbandClient:
             (df['technology'] == 'Any Technology') &
             (df['area_data_type'] == 'Total') &
             (df['biz_res'] == 'R')  # Residential (avoids duplication with Business)
-        ].copy()
+        ]
 
         print(f"  ✓ Found {len(counties):,} counties")
 
-        # Extract county FIPS from geography_id
-        counties['county_fips'] = counties['geography_id'].astype(str).str.zfill(5)
-        counties['state_fips'] = counties['county_fips'].str[:2]
+        # Build the output frame from just the columns we keep, so the
+        # filtered rows are never copied wholesale. The percent is a 0-1
+        # decimal in the source and is converted to an actual percentage.
+        result = pd.DataFrame({
+            'county_fips': counties['geography_id'].str.zfill(5),
+            'county_name': counties['geography_desc'],
+            'total_locations': counties['total_units'],
+            'percent_covered_100_20': counties['speed_100_20'] * 100,
+        })
 
         # Apply state filtering if needed
         if state_fips_list:
-            counties = counties[counties['state_fips'].isin(state_fips_list)]
-            print(f"  ✓ Filtered to {len(state_fips_list)} states: {len(counties):,} counties")
-
-        # Select and rename columns for clarity
-        result = counties[[
-            'county_fips',
-            'geography_desc',
-            'total_units',
-            'speed_100_20'
-        ]].copy()
-
-        result = result.rename(columns={
-            'geography_desc': 'county_name',
-            'total_units': 'total_locations',
-            'speed_100_20': 'percent_covered_100_20'
-        })
-
-        # Convert percent to actual percentage (it's a decimal 0-1)
-        result['percent_covered_100_20'] = result['percent_covered_100_20'] * 100
+            result = _filter_to_states(result, state_fips_list)
+            print(f"  ✓ Filtered to {len(state_fips_list)} states: {len(result):,} counties")
 
         # Cache the processed result
         result.to_csv(cache_file, index=False)
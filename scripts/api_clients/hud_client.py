@@ -8,14 +8,13 @@ Documentation: https://hudgis-hud.opendata.arcgis.com/
 """
 
 import requests
-import time
 import pandas as pd
 from pathlib import Path
 import sys
 
 # Add parent directory to path to import config
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from config import REQUEST_DELAY, MAX_RETRIES, TIMEOUT, RAW_DATA_DIR
+from config import TIMEOUT, RAW_DATA_DIR, create_session, get_rate_limiter, request_error_message
 
 
 class HUDClient:
@@ -25,37 +24,31 @@ class HUDClient:
         """Initialize HUD client."""
         self.base_url = 'https://services.arcgis.com/VTyQ9soqVukalItT/arcgis/rest/services'
         self.oz_endpoint = f'{self.base_url}/Opportunity_Zones/FeatureServer/13/query'
-        self.session = requests.Session()
+        self.session = create_session()
 
         # Set up cache directory
         self.cache_dir = RAW_DATA_DIR / 'hud' / 'cache'
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-    def _make_request(self, url, params, retries=MAX_RETRIES):
+    def _make_request(self, url, params):
         """
-        Make API request with retry logic.
+        Make API request. Retries with backoff are handled by the session.
 
         Args:
             url: API endpoint URL
             params: Query parameters
-            retries: Number of retries remaining
 
         Returns:
             dict: JSON response
         """
+        get_rate_limiter(url).acquire()
         try:
             response = self.session.get(url, params=params, timeout=TIMEOUT)
             response.raise_for_status()
-            time.sleep(REQUEST_DELAY)
-            return response.json()
-
         except requests.exceptions.RequestException as e:
-            if retries > 0:
-                print(f"  Request failed, retrying... ({retries} attempts left)")
-                time.sleep(REQUEST_DELAY * 2)
-                return self._make_request(url, params, retries - 1)
-            else:
-                raise Exception(f"HUD API request failed after {MAX_RETRIES} attempts: {str(e)}")
+            raise Exception(request_error_message('HUD API', e)) from e
+
+        return response.json()
 
     def get_opportunity_zones_count(self):
         """
@@ -170,7 +170,7 @@ class IRSExemptOrgClient:
             # Cache if requested
             if cache:
                 with open(cache_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.zip_to_fips, f, indent=2)
+                    json.dump(self.zip_to_fips, f, separators=(',', ':'))
                 print(f"Cached {len(self.zip_to_fips)} ZIP-FIPS mappings to {cache_file}")
 
             return self.zip_to_fips
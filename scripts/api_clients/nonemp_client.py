@@ -8,14 +8,12 @@ Documentation: https://www.census.gov/data/developers/data-sets/cbp-nonemp-zbp.h
 """
 
 import requests
-import time
-import json
 from pathlib import Path
 import sys
 
 # Add parent directory to path to import config
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from config import CENSUS_API_KEY, CENSUS_API_BASE, REQUEST_DELAY, MAX_RETRIES, TIMEOUT, RAW_DATA_DIR
+from config import CENSUS_API_KEY, CENSUS_API_BASE, TIMEOUT, RAW_DATA_DIR, create_session, get_rate_limiter, write_json, request_error_message
 
 
 class NonempClient:
@@ -33,42 +31,39 @@ class NonempClient:
             raise ValueError("Census API key is required")
 
         self.base_url = CENSUS_API_BASE
-        self.session = requests.Session()
+        self.session = create_session()
 
-    def _make_request(self, url, params, retries=MAX_RETRIES):
+        # Raw responses are saved here
+        self.output_dir = RAW_DATA_DIR / 'nonemp'
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def _make_request(self, url, params):
         """
-        Make API request with retry logic.
+        Make API request. Retries with backoff are handled by the session.
 
         Args:
             url: Full API URL
             params: Dictionary of query parameters
-            retries: Number of retries remaining
 
         Returns:
             list: JSON response from API (list of lists)
         """
-        params['key'] = self.api_key
+        params = {**params, 'key': self.api_key}
 
+        get_rate_limiter(url).acquire()
         try:
             response = self.session.get(url, params=params, timeout=TIMEOUT)
             response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise Exception(request_error_message('Census Nonemployer API', e)) from e
 
-            data = response.json()
+        data = response.json()
 
-            # Census API returns errors as JSON with single element containing error message
-            if len(data) == 1 and isinstance(data[0], str) and 'error' in data[0].lower():
-                raise Exception(f"Census Nonemployer API Error: {data[0]}")
+        # Census API returns errors as JSON with single element containing error message
+        if len(data) == 1 and isinstance(data[0], str) and 'error' in data[0].lower():
+            raise Exception(f"Census Nonemployer API Error: {data[0]}")
 
-            time.sleep(REQUEST_DELAY)
-            return data
-
-        except requests.exceptions.RequestException as e:
-            if retries > 0:
-                print(f"Request failed, retrying... ({retries} attempts left)")
-                time.sleep(REQUEST_DELAY * 2)
-                return self._make_request(url, params, retries - 1)
-            else:
-                raise Exception(f"Census Nonemployer API request failed after {MAX_RETRIES} attempts: {str(e)}")
+        return data
 
     def get_nonemp_data(self, year, variables, naics='00', state_fips=None):
         """
@@ -137,20 +132,17 @@ class NonempClient:
 
         return [dict(zip(headers, row)) for row in data_rows]
 
-    def save_response(self, data, filename):
+    def save_response(self, data, filename, pretty=False):
         """
         Save API response to file.
 
         Args:
             data: Response data (list or dict)
             filename: Output filename (will be saved in data/raw/nonemp/)
+            pretty: If True, indent the JSON for reading by hand
         """
-        output_dir = RAW_DATA_DIR / 'nonemp'
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        output_path = output_dir / filename
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        output_path = self.output_dir / filename
+        write_json(output_path, data, pretty)
 
         print(f"Saved: {output_path}")
 
@@ -8,14 +8,12 @@ Documentation: https://www.nps.gov/subjects/developer/api-documentation.htm
 """
 
 import requests
-import time
-import json
 from pathlib import Path
 import sys
 
 # Add parent directory to path to import config
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from config import NPS_API_KEY, REQUEST_DELAY, MAX_RETRIES, TIMEOUT, RAW_DATA_DIR
+from config import NPS_API_KEY, TIMEOUT, RAW_DATA_DIR, create_session, get_rate_limiter, write_json, request_error_message
 
 
 class NPSClient:
@@ -33,44 +31,36 @@ class NPSClient:
             raise ValueError("NPS API key is required. Register at https://www.nps.gov/subjects/developer/get-started.htm")
 
         self.base_url = 'https://developer.nps.gov/api/v1'
-        self.session = requests.Session()
+        self.session = create_session()
 
-    def _make_request(self, endpoint, params=None, retries=MAX_RETRIES):
+        # Raw responses are saved here
+        self.output_dir = RAW_DATA_DIR / 'nps'
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def _make_request(self, endpoint, params=None):
         """
-        Make API request with retry logic.
+        Make API request. Retries with backoff are handled by the session.
 
         Args:
             endpoint: API endpoint path (e.g., '/parks')
             params: Dictionary of query parameters
-            retries: Number of retries remaining
 
         Returns:
             dict: JSON response from API
         """
-        if params is None:
-            params = {}
-
-        # Add API key to params
-        params['api_key'] = self.api_key
+        # Add API key to a copy so the caller's params are left untouched
+        params = {**(params or {}), 'api_key': self.api_key}
 
         url = f"{self.base_url}{endpoint}"
 
+        get_rate_limiter(url).acquire()
         try:
             response = self.session.get(url, params=params, timeout=TIMEOUT)
             response.raise_for_status()
-
-            data = response.json()
-
-            time.sleep(REQUEST_DELAY)
-            return data
-
         except requests.exceptions.RequestException as e:
-            if retries > 0:
-                print(f"Request failed, retrying... ({retries} attempts left)")
-                time.sleep(REQUEST_DELAY * 2)
-                return self._make_request(endpoint, params, retries - 1)
-            else:
-                raise Exception(f"NPS API request failed after {MAX_RETRIES} attempts: {str(e)}")
+            raise Exception(request_error_message('NPS API', e)) from e
+
+        return response.json()
 
     def get_parks(self, state_code=None, limit=50, start=0):
         """
@@ -197,20 +187,17 @@ class NPSClient:
 
         return location
 
-    def save_response(self, data, filename):
+    def save_response(self, data, filename, pretty=False):
         """
         Save API response to file.
 
         Args:
             data: Response data (dict or list)
             filename: Output filename (will be saved in data/raw/nps/)
+            pretty: If True, indent the JSON for reading by hand
         """
-        output_dir = RAW_DATA_DIR / 'nps'
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        output_path = output_dir / filename
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        output_path = self.output_dir / filename
+        write_json(output_path, data, pretty)
 
         print(f"Saved: {output_path}")
 
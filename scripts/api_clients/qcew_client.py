@@ -28,7 +28,8 @@ class QCEWClient:
         """Initialize QCEW client."""
         self.base_url = 'https://data.bls.gov/cew/data/files'
         self.session = requests.Session()
-        self.cache_dir = RAW_DATA_DIR / 'qcew' / 'cache'
+        self.output_dir = RAW_DATA_DIR / 'qcew'
+        self.cache_dir = self.output_dir / 'cache'
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def _download_file(self, url, retries=MAX_RETRIES):
@@ -221,10 +222,7 @@ class QCEWClient:
             df: DataFrame to save
             filename: Output filename (will be saved in data/raw/qcew/)
         """
-        output_dir = RAW_DATA_DIR / 'qcew'
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        output_path = output_dir / filename
+        output_path = self.output_dir / filename
         df.to_csv(output_path, index=False)
 
         print(f"Saved: {output_path}")
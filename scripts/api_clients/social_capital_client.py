@@ -11,6 +11,7 @@ Documentation: https://opportunityinsights.org/paper/socialcapital1/
 import requests
 import pandas as pd
 import json
+import os
 from pathlib import Path
 import sys
 import time
@@ -62,14 +63,15 @@ class SocialCapitalAtlasClient:
             response = self.session.get(self.base_url, timeout=TIMEOUT, allow_redirects=True)
             response.raise_for_status()
 
-            # Parse CSV
-            from io import StringIO
-            df = pd.read_csv(StringIO(response.text))
+            # Cache the CSV bytes as received and parse from disk, rather than
+            # decoding to text, parsing, and re-serializing the DataFrame
+            tmp_file = cache_file.with_suffix('.tmp')
+            tmp_file.write_bytes(response.content)
+            os.replace(tmp_file, cache_file)
 
-            print(f"  ✓ Downloaded {len(df)} counties")
+            df = pd.read_csv(cache_file)
 
-            # Cache the data
-            df.to_csv(cache_file, index=False)
+            print(f"  ✓ Downloaded {len(df)} counties")
             print(f"  ✓ Cached data to {cache_file}")
 
             # Add small delay to be respectful
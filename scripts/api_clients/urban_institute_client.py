@@ -9,14 +9,13 @@ API Endpoint: https://educationdata.urban.org/api/v1/
 """
 
 import requests
-import time
 import pandas as pd
 from pathlib import Path
 import sys
 
 # Add parent directory to path to import config
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from config import REQUEST_DELAY, MAX_RETRIES, TIMEOUT
+from config import TIMEOUT, create_session, get_rate_limiter, request_error_message
 
 
 class UrbanInstituteClient:
@@ -25,33 +24,27 @@ class UrbanInstituteClient:
     def __init__(self):
         """Initialize Urban Institute client."""
         self.base_url = 'https://educationdata.urban.org/api/v1'
-        self.session = requests.Session()
+        self.session = create_session()
 
-    def _make_request(self, url, params=None, retries=MAX_RETRIES):
+    def _make_request(self, url, params=None):
         """
-        Make API request with retry logic.
+        Make API request. Retries with backoff are handled by the session.
 
         Args:
             url: API endpoint URL
             params: Query parameters (optional)
-            retries: Number of retries remaining
 
         Returns:
             dict: JSON response
         """
+        get_rate_limiter(url).acquire()
         try:
             response = self.session.get(url, params=params, timeout=TIMEOUT)
             response.raise_for_status()
-            time.sleep(REQUEST_DELAY)
-            return response.json()
-
         except requests.exceptions.RequestException as e:
-            if retries > 0:
-                print(f"  Request failed, retrying... ({retries} attempts left)")
-                time.sleep(REQUEST_DELAY * 2)
-                return self._make_request(url, params, retries - 1)
-            else:
-                raise Exception(f"Urban Institute API request failed after {MAX_RETRIES} attempts: {str(e)}")
+            raise Exception(request_error_message('Urban Institute API', e)) from e
+
+        return response.json()
 
     def get_colleges_count(self, year=2022, state_fips=None):
         """
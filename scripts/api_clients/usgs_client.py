@@ -9,7 +9,6 @@ API Endpoint: https://carto.nationalmap.gov/arcgis/rest/services/transportation/
 """
 
 import requests
-import time
 import pandas as pd
 import geopandas as gpd
 from pathlib import Path
@@ -19,7 +18,7 @@ import io
 
 # Add parent directory to path to import config
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from config import REQUEST_DELAY, MAX_RETRIES, TIMEOUT, RAW_DATA_DIR
+from config import TIMEOUT, RAW_DATA_DIR, create_session, get_rate_limiter, request_error_message
 
 
 class USGSTransportationClient:
@@ -29,37 +28,31 @@ class USGSTransportationClient:
         """Initialize USGS Transportation client."""
         self.base_url = 'https://carto.nationalmap.gov/arcgis/rest/services/transportation/MapServer'
         self.controlled_access_layer = f'{self.base_url}/29/query'  # Controlled-access Highways layer
-        self.session = requests.Session()
+        self.session = create_session()
 
         # Set up cache directory
         self.cache_dir = RAW_DATA_DIR / 'usgs' / 'cache'
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-    def _make_request(self, url, params, retries=MAX_RETRIES):
+    def _make_request(self, url, params):
         """
-        Make API request with retry logic.
+        Make API request. Retries with backoff are handled by the session.
 
         Args:
             url: API endpoint URL
             params: Query parameters
-            retries: Number of retries remaining
 
         Returns:
             dict: JSON response
         """
+        get_rate_limiter(url).acquire()
         try:
             response = self.session.get(url, params=params, timeout=TIMEOUT)
             response.raise_for_status()
-            time.sleep(REQUEST_DELAY)
-            return response.json()
-
         except requests.exceptions.RequestException as e:
-            if retries > 0:
-                print(f"  Request failed, retrying... ({retries} attempts left)")
-                time.sleep(REQUEST_DELAY * 2)
-                return self._make_request(url, params, retries - 1)
-            else:
-                raise Exception(f"USGS API request failed after {MAX_RETRIES} attempts: {str(e)}")
+            raise Exception(request_error_message('USGS API', e)) from e
+
+        return response.json()
 
     def get_interstate_highways_count(self):
         """
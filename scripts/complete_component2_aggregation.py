@@ -18,39 +18,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
 from regional_data_manager import RegionalDataManager
-
-
-def calculate_herfindahl_index(shares: pd.Series) -> float:
-    """
-    Calculate Herfindahl-Hirschman Index (HHI) from employment/worker shares.
-
-    HHI = sum(share_i^2) for all categories i
-    Then convert to diversity: Diversity = 1 - HHI
-
-    Higher diversity score = more diverse (closer to 1)
-    Lower diversity score = less diverse (closer to 0)
-
-    Args:
-        shares: Series of employment shares (as decimals, not percentages)
-
-    Returns:
-        Diversity index (1 - HHI), range 0-1
-    """
-    # Remove NaN values
-    shares = shares.dropna()
-
-    # Ensure shares sum to 1 (normalize)
-    share_sum = shares.sum()
-    if share_sum > 0:
-        shares = shares / share_sum
-
-    # Calculate HHI
-    hhi = (shares ** 2).sum()
-
-    # Convert to diversity (1 - HHI)
-    diversity = 1 - hhi
-
-    return diversity
+from aggregation_config import get_measure_config
 
 
 def aggregate_industry_diversity(rdm: RegionalDataManager) -> pd.DataFrame:
@@ -96,9 +64,7 @@ def aggregate_industry_diversity(rdm: RegionalDataManager) -> pd.DataFrame:
                            industry_df['county'].astype(str).str.zfill(3))
 
     # Map counties to regions (extract region_key from dict)
-    industry_df['region_key'] = industry_df['fips'].apply(
-        lambda fips: rdm.county_to_region.get(fips, {}).get('region_key') if fips in rdm.county_to_region else None
-    )
+    industry_df['region_key'] = rdm.map_region_keys(industry_df['fips'])
 
     # Remove unmapped counties
     unmapped = industry_df['region_key'].isna().sum()
@@ -112,31 +78,19 @@ def aggregate_industry_diversity(rdm: RegionalDataManager) -> pd.DataFrame:
     print(f"\nRegional employment by sector: {len(regional_employment)} records")
     print(f"Regions: {regional_employment['region_key'].nunique()}")
 
-    # Calculate diversity index for each region
-    diversity_results = []
-
-    for region in regional_employment['region_key'].unique():
-        region_data = regional_employment[regional_employment['region_key'] == region]
-
-        # Get employment by sector
-        employment = region_data.set_index('naics')['EMP']
-
-        # Calculate shares
-        total_employment = employment.sum()
-        if total_employment > 0:
-            shares = employment / total_employment
+    # Employment matrix with one row per region and one column per sector
+    emp_by_sector = regional_employment.pivot(index='region_key', columns='naics', values='EMP').fillna(0)
 
-            # Calculate Herfindahl diversity index
-            diversity = calculate_herfindahl_index(shares)
+    # Calculate diversity index for every region at once
+    hhi_diversity = get_measure_config('component2', '2.5_industry_diversity')['kernel']
+    diversity_results = pd.DataFrame({
+        'region_key': emp_by_sector.index,
+        'industry_diversity': hhi_diversity(emp_by_sector.to_numpy(dtype=float)),
+        'total_employment': emp_by_sector.sum(axis=1).to_numpy(),
+        'num_sectors': regional_employment.groupby('region_key').size().to_numpy()
+    })
 
-            diversity_results.append({
-                'region_key': region,
-                'industry_diversity': diversity,
-                'total_employment': total_employment,
-                'num_sectors': len(employment)
-            })
-
-    diversity_df = pd.DataFrame(diversity_results)
+    diversity_df = diversity_results[diversity_results['total_employment'] > 0].reset_index(drop=True)
 
     print(f"\nIndustry Diversity Statistics:")
     print(f"  Regions: {len(diversity_df)}")
@@ -189,9 +143,7 @@ def aggregate_occupation_diversity(rdm: RegionalDataManager) -> pd.DataFrame:
                       occ_df['county'].astype(str).str.zfill(3))
 
     # Map counties to regions (extract region_key from dict)
-    occ_df['region_key'] = occ_df['fips'].apply(
-        lambda fips: rdm.county_to_region.get(fips, {}).get('region_key') if fips in rdm.county_to_region else None
-    )
+    occ_df['region_key'] = rdm.map_region_keys(occ_df['fips'])
 
     # Remove unmapped counties
     unmapped = occ_df['region_key'].isna().sum()
@@ -205,30 +157,16 @@ def aggregate_occupation_diversity(rdm: RegionalDataManager) -> pd.DataFrame:
 
     print(f"\nRegional occupation data: {len(regional_occ)} regions")
 
-    # Calculate diversity index for each region
-    diversity_results = []
-
-    for _, row in regional_occ.iterrows():
-        region = row['region_key']
+    # Calculate diversity index for every region at once
+    hhi_diversity = get_measure_config('component2', '2.6_occupation_diversity')['kernel']
+    occ_counts = regional_occ[occupation_cols].to_numpy(dtype=float)
+    diversity_results = pd.DataFrame({
+        'region_key': regional_occ['region_key'],
+        'occupation_diversity': hhi_diversity(occ_counts),
+        'total_employed': occ_counts.sum(axis=1)
+    })
 
-        # Get occupation counts
-        occ_counts = row[occupation_cols]
-
-        # Calculate shares
-        total_employed = occ_counts.sum()
-        if total_employed > 0:
-            shares = occ_counts / total_employed
-
-            # Calculate Herfindahl diversity index
-            diversity = calculate_herfindahl_index(shares)
-
-            diversity_results.append({
-                'region_key': region,
-                'occupation_diversity': diversity,
-                'total_employed': total_employed
-            })
-
-    diversity_df = pd.DataFrame(diversity_results)
+    diversity_df = diversity_results[diversity_results['total_employed'] > 0].reset_index(drop=True)
 
     print(f"\nOccupation Diversity Statistics:")
     print(f"  Regions: {len(diversity_df)}")
@@ -281,9 +219,7 @@ def aggregate_nonemployer_share(rdm: RegionalDataManager) -> pd.DataFrame:
     print(f"\nMerged data: {len(merged)} counties")
 
     # Map counties to regions (extract region_key from dict)
-    merged['region_key'] = merged['fips'].apply(
-        lambda fips: rdm.county_to_region.get(fips, {}).get('region_key') if fips in rdm.county_to_region else None
-    )
+    merged['region_key'] = rdm.map_region_keys(merged['fips'])
 
     # Remove unmapped counties
     unmapped = merged['region_key'].isna().sum()
@@ -332,7 +268,12 @@ def main():
         print(f"\nERROR: Regional file not found: {regional_file}")
         return
 
-    existing_df = pd.read_csv(regional_file)
+    # Drop measures added by an earlier run of this script; they are recomputed
+    # above and would otherwise collide on merge
+    existing_df = pd.read_csv(regional_file).drop(
+        columns=['industry_diversity', 'occupation_diversity', 'nonemployer_share'],
+        errors='ignore'
+    )
     print(f"\n" + "="*80)
     print(f"MERGING WITH EXISTING REGIONAL DATA")
     print("="*80)
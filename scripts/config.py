@@ -4,8 +4,21 @@ Reads API keys from .Renviron file if available, otherwise falls back to
 environment variables. This allows the code to work in multiple environments.
 """
 
+import gzip
+import json
 import os
+import random
+import threading
+import time
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
 
 def load_env_file(env_path=None):
@@ -124,6 +137,193 @@ CENSUS_API_BASE = 'https://api.census.gov/data'
 REQUEST_DELAY = 0.5  # Seconds to wait between API requests
 MAX_RETRIES = 3  # Maximum number of retries for failed requests
 TIMEOUT = 30  # Request timeout in seconds
+POOL_MAXSIZE = 64  # Keep-alive connections kept per host for concurrent requests
+CACHE_EXPIRE_AFTER = 24 * 3600  # Seconds before a cached API response is refetched
+
+# Request quotas per API host as (requests, seconds). Hosts not listed fall
+# back to one request every REQUEST_DELAY seconds.
+RATE_LIMITS = {
+    'apps.bea.gov': (100, 60),  # BEA: 100 requests per minute
+    'api.bls.gov': (50, 10),  # BLS v2: 50 requests per 10 seconds
+    'api.census.gov': (20, 1),  # Census: no published cap, stay polite
+    'api.usa.gov': (1000, 3600),  # FBI Crime Data Explorer: api.data.gov keys allow 1,000 requests per hour
+}
+
+# Default request headers. make_headers only advertises br when a brotli
+# decoder is installed, so responses can always be decompressed.
+DEFAULT_HEADERS = make_headers(accept_encoding=True, user_agent='thriving-index/1.0')
+# Responses worth retrying: rate limiting, server errors and overload (529)
+RETRY_STATUSES = (429, 500, 502, 503, 504, 529)
+
+
+class JitteredRetry(Retry):
+    """urllib3 Retry whose exponential backoff is spread by random jitter."""
+
+    def get_backoff_time(self):
+        """
+        Scale urllib3's exponential backoff by a random factor in [1, 2).
+
+        Concurrent workers that fail together then retry at different
+        moments instead of hitting the API again in lockstep.
+
+        Returns:
+            float: Seconds to sleep before the next attempt
+        """
+        backoff = super().get_backoff_time()
+        return backoff * random.uniform(1, 2) if backoff else backoff
+
+
+def create_session(pool_maxsize=POOL_MAXSIZE):
+    """
+    Create a requests session with pooled keep-alive connections and retries.
+
+    Compressed responses are requested via DEFAULT_HEADERS. Failed
+    connections and RETRY_STATUSES responses are retried by urllib3 with
+    jittered exponential backoff (honoring Retry-After), so clients make each
+    request once instead of retrying in Python. Other 4xx responses fail
+    immediately.
+
+    Args:
+        pool_maxsize: Maximum connections kept open per host
+
+    Returns:
+        requests.Session: Session with the retrying adapter mounted for http and https
+    """
+    retry = JitteredRetry(
+        total=MAX_RETRIES,
+        backoff_factor=REQUEST_DELAY,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'POST']),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def request_error_message(api_name, error):
+    """
+    Describe a request that failed on a create_session() session.
+
+    Only connection errors and RETRY_STATUSES responses are retried, so only
+    those are reported as having failed after retries. Other 4xx responses
+    (e.g. a bad key or parameter) report their status and response body.
+
+    Args:
+        api_name: Name used in the message (e.g., 'BEA API')
+        error: requests exception raised for the request
+
+    Returns:
+        str: Error message
+    """
+    response = getattr(error, 'response', None)
+    if response is not None and 400 <= response.status_code < 500 and response.status_code not in RETRY_STATUSES:
+        return f"{api_name} Error ({response.status_code}): {response.text.strip()[:500]}"
+    return f"{api_name} request failed after {MAX_RETRIES} retries: {str(error)}"
+
+
+class RateLimiter:
+    """Thread-safe sliding-window limiter shared by every client that calls one host."""
+
+    def __init__(self, rate, per):
+        """
+        Initialize the limiter with no requests recorded.
+
+        The send times of the last `rate` requests are kept, so no window of
+        `per` seconds ever carries more than `rate` requests, even after an
+        idle stretch.
+
+        Args:
+            rate: Number of requests allowed per period
+            per: Period length in seconds
+        """
+        self.per = per
+        self.sent = deque(maxlen=rate)
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until a request may be sent, then record it.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if len(self.sent) < self.sent.maxlen or now - self.sent[0] >= self.per:
+                    self.sent.append(now)
+                    return
+                wait = self.sent[0] + self.per - now
+            time.sleep(wait)
+
+
+_RATE_LIMITERS = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(url):
+    """
+    Get the process-wide rate limiter for the host of a URL.
+
+    Args:
+        url: API URL
+
+    Returns:
+        RateLimiter: Limiter shared by all requests to that host
+    """
+    host = urlsplit(url).hostname
+    with _RATE_LIMITERS_LOCK:
+        limiter = _RATE_LIMITERS.get(host)
+        if limiter is None:
+            rate, per = RATE_LIMITS.get(host, (1, REQUEST_DELAY))
+            limiter = _RATE_LIMITERS[host] = RateLimiter(rate, per)
+    return limiter
+
+
+@lru_cache(maxsize=None)
+def ensure_dir(path):
+    """
+    Create a directory (and parents) once per process.
+
+    Clients call this from __init__; repeated constructions, e.g. one client
+    per worker, reuse the first result instead of issuing another mkdir.
+
+    Args:
+        path: Directory path
+
+    Returns:
+        Path: The same path, guaranteed to exist
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def write_json(path, data, pretty=False):
+    """
+    Write data to a JSON file, gzipped when the path ends in .gz.
+
+    Raw API responses are re-read by the pipeline, not by people, so they are
+    written compactly unless asked; indent=2 roughly doubles the size.
+
+    Args:
+        path: Output file path
+        data: JSON-serializable data
+        pretty: If True, indent the JSON for reading by hand
+    """
+    path = Path(path)
+    if path.suffix == '.gz':
+        output_file = gzip.open(path, 'wt', compresslevel=3)
+    else:
+        output_file = open(path, 'w')
+
+    with output_file as f:
+        if pretty:
+            json.dump(data, f, indent=2)
+        else:
+            json.dump(data, f, separators=(',', ':'))
 
 
 def validate_api_keys():
@@ -21,7 +21,7 @@ from datetime import datetime
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 from config import STATE_FIPS, RAW_DATA_DIR, PROCESSED_DATA_DIR
-from api_clients.bea_client import BEAClient
+from api_clients.bea_client import get_bea_client
 from api_clients.qcew_client import QCEWClient
 from api_clients.census_client import CensusClient
 
@@ -211,7 +211,7 @@ def main(skip_bls=False):
     acs_years = [2017, 2022]  # Two non-overlapping 5-year periods (2013-2017 and 2018-2022)
 
     # Initialize API clients
-    bea_client = BEAClient()
+    bea_client = get_bea_client()
     qcew_client = QCEWClient()
     census_client = CensusClient()
 
@@ -23,8 +23,8 @@ from datetime import datetime
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 from config import STATE_FIPS, RAW_DATA_DIR, PROCESSED_DATA_DIR
-from api_clients.bea_client import BEAClient
-from api_clients.cbp_client import CBPClient
+from api_clients.bea_client import get_bea_client
+from api_clients.cbp_client import get_cbp_client
 from api_clients.nonemp_client import NonempClient
 from api_clients.census_client import CensusClient
 from api_clients.bds_client import BDSClient
@@ -62,12 +62,13 @@ def collect_proprietors_data(bea_client, year, state_fips_list):
     return df
 
 
-def collect_business_dynamics(bds_client, year, state_fips_list):
+def collect_business_dynamics(bds_client, census_client, year, state_fips_list):
     """
     Collect business dynamics data from Census BDS (Measure 2.1).
 
     Args:
         bds_client: BDSClient instance
+        census_client: CensusClient instance, used to fan requests out by state
         year: Year of data
         state_fips_list: List of state FIPS codes
 
@@ -79,27 +80,29 @@ def collect_business_dynamics(bds_client, year, state_fips_list):
 
     all_data = []
 
-    for state_name, state_fips in STATE_FIPS.items():
-        if state_fips not in state_fips_list:
-            continue
+    futures = census_client.gather_states(
+        lambda fips: bds_client.get_business_dynamics(year, state_fips=fips, naics='00'),
+        state_fips_list
+    )
 
+    for state_name, state_fips, future in futures:
         print(f"  Fetching {state_name} (FIPS {state_fips})...")
         try:
-            response = bds_client.get_business_dynamics(year, state_fips=state_fips, naics='00')
+            response = future.result()
 
             # Save raw response
             filename = f"bds_business_dynamics_{state_name}_{year}.json"
             bds_client.save_response(response, filename)
 
-            # Convert to dict and add to list
-            parsed = bds_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            # Convert to DataFrame and add to list
+            parsed = bds_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
             print(f"    ✗ Error: {e}")
 
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     print(f"\n✓ Total: {len(df)} records across all states")
 
     return df
@@ -134,15 +137,15 @@ def collect_cbp_establishments(cbp_client, year, state_fips_list):
             filename = f"cbp_establishments_{state_name}_{year}.json"
             cbp_client.save_response(response, filename)
 
-            # Convert to dict and add to list
-            parsed = cbp_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            # Convert to DataFrame and add to list
+            parsed = cbp_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
             print(f"    ✗ Error: {e}")
 
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     print(f"\n✓ Total: {len(df)} records across all states")
 
     return df
@@ -224,15 +227,14 @@ def collect_industry_diversity_data(cbp_client, year, state_fips_list):
             if response is not None:
                 if naics_code not in industry_data:
                     industry_data[naics_code] = []
-                parsed = cbp_client.parse_response_to_dict(response)
-                industry_data[naics_code].extend(parsed)
+                industry_data[naics_code].append(cbp_client.parse_response_to_df(response))
 
-    # Convert to DataFrames
+    # Combine each sector's state DataFrames
     industry_dfs = {}
-    for naics_code, data_list in industry_data.items():
-        if data_list:
-            industry_dfs[naics_code] = pd.DataFrame(data_list)
-            print(f"\n✓ NAICS {naics_code}: {len(data_list)} total records")
+    for naics_code, frames in industry_data.items():
+        if frames:
+            industry_dfs[naics_code] = pd.concat(frames, ignore_index=True)
+            print(f"\n✓ NAICS {naics_code}: {len(industry_dfs[naics_code])} total records")
 
     return industry_dfs
 
@@ -254,27 +256,29 @@ def collect_occupation_diversity_data(census_client, year, state_fips_list):
 
     all_data = []
 
-    for state_name, state_fips in STATE_FIPS.items():
-        if state_fips not in state_fips_list:
-            continue
+    futures = census_client.gather_states(
+        lambda fips: census_client.get_occupation_data(year, state_fips=fips),
+        state_fips_list
+    )
 
+    for state_name, state_fips, future in futures:
         print(f"  Fetching {state_name} (FIPS {state_fips})...")
         try:
-            response = census_client.get_occupation_data(year, state_fips=state_fips)
+            response = future.result()
 
             # Save raw response
             filename = f"census_occupation_{state_name}_{year}.json"
             census_client.save_response(response, filename)
 
-            # Convert to dict and add to list
-            parsed = census_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            # Convert to DataFrame and add to list
+            parsed = census_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
             print(f"    ✗ Error: {e}")
 
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     print(f"\n✓ Total: {len(df)} records across all states")
 
     return df
@@ -297,27 +301,29 @@ def collect_telecommuter_data(census_client, year, state_fips_list):
 
     all_data = []
 
-    for state_name, state_fips in STATE_FIPS.items():
-        if state_fips not in state_fips_list:
-            continue
+    futures = census_client.gather_states(
+        lambda fips: census_client.get_telecommuter_data(year, state_fips=fips),
+        state_fips_list
+    )
 
+    for state_name, state_fips, future in futures:
         print(f"  Fetching {state_name} (FIPS {state_fips})...")
         try:
-            response = census_client.get_telecommuter_data(year, state_fips=state_fips)
+            response = future.result()
 
             # Save raw response
             filename = f"census_telecommuter_{state_name}_{year}.json"
             census_client.save_response(response, filename)
 
-            # Convert to dict and add to list
-            parsed = census_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            # Convert to DataFrame and add to list
+            parsed = census_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
             print(f"    ✗ Error: {e}")
 
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     print(f"\n✓ Total: {len(df)} records across all states")
 
     return df
@@ -351,15 +357,15 @@ def main():
 
     # Initialize API clients
     bds_client = BDSClient()
-    bea_client = BEAClient()
-    cbp_client = CBPClient()
+    bea_client = get_bea_client()
+    cbp_client = get_cbp_client()
     nonemp_client = NonempClient()
     census_client = CensusClient()
 
     # Collect all measures
     try:
         # Measure 2.1: Entrepreneurial Activity (Business Dynamics)
-        business_dynamics_df = collect_business_dynamics(bds_client, bds_year, state_fips_list)
+        business_dynamics_df = collect_business_dynamics(bds_client, census_client, bds_year, state_fips_list)
 
         # Measure 2.2: Non-Farm Proprietors
         proprietors_df = collect_proprietors_data(bea_client, bea_year, state_fips_list)
@@ -16,17 +16,18 @@ from pathlib import Path
 import json
 import pandas as pd
 import numpy as np
-import requests
-import zipfile
-import io
 from datetime import datetime
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 
-from config import STATE_FIPS, RAW_DATA_DIR, PROCESSED_DATA_DIR
-from api_clients.bea_client import BEAClient
+from config import STATE_FIPS, PROCESSED_DATA_DIR
+from api_clients.bea_client import get_bea_client
 from api_clients.census_client import CensusClient
+from api_clients.chr_client import CountyHealthRankingsClient
+
+# CHR analytic-file columns holding life expectancy (v147)
+LIFE_EXPECTANCY_COLUMN_PATTERNS = ['life expectancy', 'life_expectancy', 'lifespan', 'v147']
 
 
 def collect_proprietor_income(bea_client, year, state_fips_list):
@@ -112,11 +113,16 @@ def collect_poverty_rate(census_client, year, state_fips_dict):
 
     all_data = []
 
-    # Collect data state by state
-    for state_abbr, state_fips in state_fips_dict.items():
+    # Fetch all states concurrently, then process them in state order
+    futures = census_client.gather_states(
+        lambda fips: census_client.get_poverty_rate(year, state_fips=fips),
+        list(state_fips_dict.values())
+    )
+
+    for state_abbr, state_fips, future in futures:
         print(f"  Collecting {state_abbr}...", end=" ")
         try:
-            response = census_client.get_poverty_rate(year, state_fips=state_fips)
+            response = future.result()
 
             # Save raw response
             filename = f"census_poverty_{state_abbr}_{year}.json"
@@ -273,11 +279,12 @@ def process_dir_income_share(dir_df, total_df):
     return processed
 
 
-def collect_life_expectancy(year, state_fips_dict):
+def collect_life_expectancy(chr_client, year, state_fips_dict):
     """
     Collect life expectancy data from County Health Rankings via Zenodo (Measure 3.3).
 
     Args:
+        chr_client: CountyHealthRankingsClient instance
         year: Year of CHR data release (e.g., 2025)
         state_fips_dict: Dictionary of state abbreviations to FIPS codes
 
@@ -288,103 +295,34 @@ def collect_life_expectancy(year, state_fips_dict):
     print(f"Source: County Health Rankings & Roadmaps {year} (Zenodo)")
     print("-" * 60)
 
-    # Download from Zenodo
-    print(f"Downloading data from Zenodo... (this may take a minute, ~52 MB)")
-    url = f"https://zenodo.org/api/records/17584421/files/{year}.zip/content"
+    df, filename = chr_client.read_analytic_data(year, LIFE_EXPECTANCY_COLUMN_PATTERNS)
 
-    try:
-        response = requests.get(url, timeout=300)
-        response.raise_for_status()
-        file_size_mb = len(response.content) / (1024 * 1024)
-        print(f"✓ Downloaded {file_size_mb:.1f} MB")
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to download CHR data: {str(e)}")
-
-    # Extract ZIP and find life expectancy data
-    print("Extracting and locating life expectancy data...")
-    zip_data = io.BytesIO(response.content)
-
-    with zipfile.ZipFile(zip_data, 'r') as zip_ref:
-        file_list = zip_ref.namelist()
-
-        # Look for analytic data file
-        analytic_files = [
-            f for f in file_list
-            if ('analytic' in f.lower() or 'data' in f.lower())
-            and f.endswith('.csv')
-            and not f.startswith('__MACOSX')
-        ]
-
-        if not analytic_files:
-            analytic_files = [f for f in file_list if f.endswith('.csv') and not f.startswith('__MACOSX')]
-
-        if not analytic_files:
-            raise Exception("No CSV data files found in ZIP")
-
-        # Read the first analytic file
-        filename = analytic_files[0]
-        print(f"Reading: {filename}")
-
-        with zip_ref.open(filename) as f:
-            df = pd.read_csv(f, encoding='utf-8', low_memory=False)
-
-        # Save metadata
-        raw_dir = RAW_DATA_DIR / 'chr'
-        raw_dir.mkdir(parents=True, exist_ok=True)
-
-        metadata = {
-            'source': 'County Health Rankings & Roadmaps',
-            'zenodo_doi': '10.5281/zenodo.17584421',
-            'year': year,
-            'download_date': datetime.now().isoformat(),
-            'source_file': filename,
-            'records_downloaded': len(df)
-        }
+    # Save metadata
+    raw_dir = chr_client.raw_data_dir
 
-        metadata_file = raw_dir / f'chr_life_expectancy_{year}_metadata.json'
-        with open(metadata_file, 'w') as f_out:
-            json.dump(metadata, f_out, indent=2)
-        print(f"Saved: {metadata_file}")
+    metadata = {
+        'source': 'County Health Rankings & Roadmaps',
+        'zenodo_doi': '10.5281/zenodo.17584421',
+        'year': year,
+        'download_date': datetime.now().isoformat(),
+        'source_file': filename,
+        'records_downloaded': len(df)
+    }
+
+    metadata_file = raw_dir / f'chr_life_expectancy_{year}_metadata.json'
+    with open(metadata_file, 'w') as f_out:
+        json.dump(metadata, f_out, indent=2)
+    print(f"Saved: {metadata_file}")
 
     # Process the data
     # Look for life expectancy columns
-    le_columns = [
-        col for col in df.columns
-        if any(pattern in str(col).lower() for pattern in [
-            'life expectancy', 'life_expectancy', 'lifespan', 'v147'
-        ])
-    ]
-
-    if not le_columns:
+    le_col = chr_client.find_column(df, LIFE_EXPECTANCY_COLUMN_PATTERNS)
+    if le_col is None:
         raise Exception("Could not find life expectancy column")
-
-    le_col = le_columns[0]
     print(f"Using column: {le_col}")
 
-    # Find FIPS columns
-    fips_5digit_cols = [c for c in df.columns if '5-digit' in c.lower() and 'fips' in c.lower()]
-    if fips_5digit_cols:
-        df['full_fips'] = df[fips_5digit_cols[0]].astype(str).str.zfill(5)
-    elif any('fipscode' in c.lower() for c in df.columns):
-        fips_col = next((c for c in df.columns if 'fipscode' in c.lower()), None)
-        df['full_fips'] = df[fips_col].astype(str).str.zfill(5)
-    else:
-        # Look for state and county FIPS columns
-        state_cols = [c for c in df.columns if 'state' in c.lower() and 'fips' in c.lower()]
-        county_cols = [c for c in df.columns if 'county' in c.lower() and 'fips' in c.lower()]
-
-        if state_cols and county_cols:
-            df['full_fips'] = (
-                df[state_cols[0]].astype(str).str.zfill(2) +
-                df[county_cols[0]].astype(str).str.zfill(3)
-            )
-        else:
-            raise Exception("Cannot determine FIPS code structure")
-
-    # Extract state FIPS and filter
-    df['state_fips'] = df['full_fips'].str[:2]
-    target_state_fips = list(state_fips_dict.values())
-    filtered_df = df[df['state_fips'].isin(target_state_fips)].copy()
+    # Filter to target states
+    filtered_df = chr_client.filter_to_states(df, state_fips_dict.values())
 
     print(f"✓ Retrieved {len(filtered_df)} records for target states")
 
@@ -422,8 +360,9 @@ def main():
 
     # Initialize API clients
     print("Initializing API clients...")
-    bea_client = BEAClient()
+    bea_client = get_bea_client()
     census_client = CensusClient()
+    chr_client = CountyHealthRankingsClient()
     print("✓ API clients initialized\n")
 
     # Track collection summary
@@ -473,7 +412,7 @@ def main():
 
     # MEASURE 3.3: Life Expectancy
     try:
-        life_expectancy_df = collect_life_expectancy(2025, STATE_FIPS)
+        life_expectancy_df = collect_life_expectancy(chr_client, 2025, STATE_FIPS)
 
         # Save processed data
         output_file = PROCESSED_DATA_DIR / 'chr_life_expectancy_2025.csv'
@@ -41,21 +41,23 @@ def collect_population_2000(census_client, state_fips_list):
 
     all_data = []
 
-    for state_name, state_fips in STATE_FIPS.items():
-        if state_fips not in state_fips_list:
-            continue
+    futures = census_client.gather_states(
+        lambda fips: census_client.get_decennial_population_2000(state_fips=fips),
+        state_fips_list
+    )
 
+    for state_name, state_fips, future in futures:
         print(f"  Fetching {state_name} (FIPS {state_fips})...")
         try:
-            response = census_client.get_decennial_population_2000(state_fips=state_fips)
+            response = future.result()
 
             # Save raw response
             filename = f"census_population_2000_{state_name}.json"
             census_client.save_response(response, filename)
 
-            # Convert to dict and add to list
-            parsed = census_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            # Convert to DataFrame and add to list
+            parsed = census_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
@@ -63,7 +65,7 @@ def collect_population_2000(census_client, state_fips_list):
             continue
 
     # Create DataFrame
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     print(f"\n✓ Total records: {len(df)}")
 
     return df
@@ -86,21 +88,23 @@ def collect_population_current(census_client, year, state_fips_list):
 
     all_data = []
 
-    for state_name, state_fips in STATE_FIPS.items():
-        if state_fips not in state_fips_list:
-            continue
+    futures = census_client.gather_states(
+        lambda fips: census_client.get_population_total(year, state_fips=fips),
+        state_fips_list
+    )
 
+    for state_name, state_fips, future in futures:
         print(f"  Fetching {state_name} (FIPS {state_fips})...")
         try:
-            response = census_client.get_population_total(year, state_fips=state_fips)
+            response = future.result()
 
             # Save raw response
             filename = f"census_population_{year}_{state_name}.json"
             census_client.save_response(response, filename)
 
-            # Convert to dict and add to list
-            parsed = census_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            # Convert to DataFrame and add to list
+            parsed = census_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
@@ -108,7 +112,7 @@ def collect_population_current(census_client, year, state_fips_list):
             continue
 
     # Create DataFrame
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     print(f"\n✓ Total records: {len(df)}")
 
     return df
@@ -131,21 +135,23 @@ def collect_age_distribution(census_client, year, state_fips_list):
 
     all_data = []
 
-    for state_name, state_fips in STATE_FIPS.items():
-        if state_fips not in state_fips_list:
-            continue
+    futures = census_client.gather_states(
+        lambda fips: census_client.get_age_distribution(year, state_fips=fips),
+        state_fips_list
+    )
 
+    for state_name, state_fips, future in futures:
         print(f"  Fetching {state_name} (FIPS {state_fips})...")
         try:
-            response = census_client.get_age_distribution(year, state_fips=state_fips)
+            response = future.result()
 
             # Save raw response
             filename = f"census_age_distribution_{year}_{state_name}.json"
             census_client.save_response(response, filename)
 
-            # Convert to dict and add to list
-            parsed = census_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            # Convert to DataFrame and add to list
+            parsed = census_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
@@ -153,7 +159,7 @@ def collect_age_distribution(census_client, year, state_fips_list):
             continue
 
     # Create DataFrame
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     print(f"\n✓ Total records: {len(df)}")
 
     return df
@@ -176,21 +182,23 @@ def collect_median_age(census_client, year, state_fips_list):
 
     all_data = []
 
-    for state_name, state_fips in STATE_FIPS.items():
-        if state_fips not in state_fips_list:
-            continue
+    futures = census_client.gather_states(
+        lambda fips: census_client.get_median_age(year, state_fips=fips),
+        state_fips_list
+    )
 
+    for state_name, state_fips, future in futures:
         print(f"  Fetching {state_name} (FIPS {state_fips})...")
         try:
-            response = census_client.get_median_age(year, state_fips=state_fips)
+            response = future.result()
 
             # Save raw response
             filename = f"census_median_age_{year}_{state_name}.json"
             census_client.save_response(response, filename)
 
-            # Convert to dict and add to list
-            parsed = census_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            # Convert to DataFrame and add to list
+            parsed = census_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
@@ -198,7 +206,7 @@ def collect_median_age(census_client, year, state_fips_list):
             continue
 
     # Create DataFrame
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     print(f"\n✓ Total records: {len(df)}")
 
     return df
@@ -221,21 +229,23 @@ def collect_hispanic_data(census_client, year, state_fips_list):
 
     all_data = []
 
-    for state_name, state_fips in STATE_FIPS.items():
-        if state_fips not in state_fips_list:
-            continue
+    futures = census_client.gather_states(
+        lambda fips: census_client.get_hispanic_data(year, state_fips=fips),
+        state_fips_list
+    )
 
+    for state_name, state_fips, future in futures:
         print(f"  Fetching {state_name} (FIPS {state_fips})...")
         try:
-            response = census_client.get_hispanic_data(year, state_fips=state_fips)
+            response = future.result()
 
             # Save raw response
             filename = f"census_hispanic_{year}_{state_name}.json"
             census_client.save_response(response, filename)
 
-            # Convert to dict and add to list
-            parsed = census_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            # Convert to DataFrame and add to list
+            parsed = census_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
@@ -243,7 +253,7 @@ def collect_hispanic_data(census_client, year, state_fips_list):
             continue
 
     # Create DataFrame
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     print(f"\n✓ Total records: {len(df)}")
 
     return df
@@ -266,21 +276,23 @@ def collect_race_data(census_client, year, state_fips_list):
 
     all_data = []
 
-    for state_name, state_fips in STATE_FIPS.items():
-        if state_fips not in state_fips_list:
-            continue
+    futures = census_client.gather_states(
+        lambda fips: census_client.get_race_data(year, state_fips=fips),
+        state_fips_list
+    )
 
+    for state_name, state_fips, future in futures:
         print(f"  Fetching {state_name} (FIPS {state_fips})...")
         try:
-            response = census_client.get_race_data(year, state_fips=state_fips)
+            response = future.result()
 
             # Save raw response
             filename = f"census_race_{year}_{state_name}.json"
             census_client.save_response(response, filename)
 
-            # Convert to dict and add to list
-            parsed = census_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            # Convert to DataFrame and add to list
+            parsed = census_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
@@ -288,7 +300,7 @@ def collect_race_data(census_client, year, state_fips_list):
             continue
 
     # Create DataFrame
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     print(f"\n✓ Total records: {len(df)}")
 
     return df
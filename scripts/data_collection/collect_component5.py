@@ -41,21 +41,23 @@ def collect_education_attainment(census_client, year, state_fips_list):
 
     all_data = []
 
-    for state_name, state_fips in STATE_FIPS.items():
-        if state_fips not in state_fips_list:
-            continue
+    futures = census_client.gather_states(
+        lambda fips: census_client.get_education_detailed(year, state_fips=fips),
+        state_fips_list
+    )
 
+    for state_name, state_fips, future in futures:
         print(f"  Fetching {state_name} (FIPS {state_fips})...")
         try:
-            response = census_client.get_education_detailed(year, state_fips=state_fips)
+            response = future.result()
 
             # Save raw response
             filename = f"census_education_detailed_{year}_{state_name}.json"
             census_client.save_response(response, filename)
 
-            # Convert to dict and add to list
-            parsed = census_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            # Convert to DataFrame and add to list
+            parsed = census_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
@@ -63,7 +65,7 @@ def collect_education_attainment(census_client, year, state_fips_list):
             continue
 
     # Create DataFrame
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     print(f"\n✓ Total records: {len(df)}")
 
     return df
@@ -86,21 +88,23 @@ def collect_labor_force(census_client, year, state_fips_list):
 
     all_data = []
 
-    for state_name, state_fips in STATE_FIPS.items():
-        if state_fips not in state_fips_list:
-            continue
+    futures = census_client.gather_states(
+        lambda fips: census_client.get_labor_force_participation(year, state_fips=fips),
+        state_fips_list
+    )
 
+    for state_name, state_fips, future in futures:
         print(f"  Fetching {state_name} (FIPS {state_fips})...")
         try:
-            response = census_client.get_labor_force_participation(year, state_fips=state_fips)
+            response = future.result()
 
             # Save raw response
             filename = f"census_labor_force_{year}_{state_name}.json"
             census_client.save_response(response, filename)
 
-            # Convert to dict and add to list
-            parsed = census_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            # Convert to DataFrame and add to list
+            parsed = census_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
@@ -108,7 +112,7 @@ def collect_labor_force(census_client, year, state_fips_list):
             continue
 
     # Create DataFrame
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     print(f"\n✓ Total records: {len(df)}")
 
     return df
@@ -131,21 +135,23 @@ def collect_knowledge_workers(census_client, year, state_fips_list):
 
     all_data = []
 
-    for state_name, state_fips in STATE_FIPS.items():
-        if state_fips not in state_fips_list:
-            continue
+    futures = census_client.gather_states(
+        lambda fips: census_client.get_knowledge_workers(year, state_fips=fips),
+        state_fips_list
+    )
 
+    for state_name, state_fips, future in futures:
         print(f"  Fetching {state_name} (FIPS {state_fips})...")
         try:
-            response = census_client.get_knowledge_workers(year, state_fips=state_fips)
+            response = future.result()
 
             # Save raw response
             filename = f"census_knowledge_workers_{year}_{state_name}.json"
             census_client.save_response(response, filename)
 
-            # Convert to dict and add to list
-            parsed = census_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            # Convert to DataFrame and add to list
+            parsed = census_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
@@ -153,7 +159,7 @@ def collect_knowledge_workers(census_client, year, state_fips_list):
             continue
 
     # Create DataFrame
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     print(f"\n✓ Total records: {len(df)}")
 
     return df
@@ -27,7 +27,7 @@ from shapely.geometry import Point, shape
 from datetime import datetime
 import requests
 import argparse
-from collections import defaultdict
+from collections import Counter, defaultdict
 import csv
 
 # Add parent directory to path
@@ -35,7 +35,7 @@ sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 from config import STATE_FIPS, RAW_DATA_DIR, PROCESSED_DATA_DIR, PROJECT_ROOT
 from api_clients.census_client import CensusClient
-from api_clients.cbp_client import CBPClient
+from api_clients.cbp_client import get_cbp_client
 from api_clients.qcew_client import QCEWClient
 from api_clients.nps_client import NPSClient
 from api_clients.fbi_cde_client import FBICrimeClient
@@ -58,21 +58,23 @@ def collect_commute_time(census_client, year, state_fips_list):
 
     all_data = []
 
-    for state_name, state_fips in STATE_FIPS.items():
-        if state_fips not in state_fips_list:
-            continue
+    futures = census_client.gather_states(
+        lambda fips: census_client.get_commute_time(year, state_fips=fips),
+        state_fips_list
+    )
 
+    for state_name, state_fips, future in futures:
         print(f"  Fetching {state_name} (FIPS {state_fips})...")
         try:
-            response = census_client.get_commute_time(year, state_fips=state_fips)
+            response = future.result()
 
             # Save raw response
             filename = f"census_commute_time_{year}_{state_name}.json"
             census_client.save_response(response, filename)
 
-            # Convert to dict and add to list
-            parsed = census_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            # Convert to DataFrame and add to list
+            parsed = census_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
@@ -80,7 +82,7 @@ def collect_commute_time(census_client, year, state_fips_list):
             continue
 
     # Create DataFrame
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     print(f"\n✓ Total records: {len(df)}")
 
     return df
@@ -103,21 +105,23 @@ def collect_housing_age(census_client, year, state_fips_list):
 
     all_data = []
 
-    for state_name, state_fips in STATE_FIPS.items():
-        if state_fips not in state_fips_list:
-            continue
+    futures = census_client.gather_states(
+        lambda fips: census_client.get_housing_age(year, state_fips=fips),
+        state_fips_list
+    )
 
+    for state_name, state_fips, future in futures:
         print(f"  Fetching {state_name} (FIPS {state_fips})...")
         try:
-            response = census_client.get_housing_age(year, state_fips=state_fips)
+            response = future.result()
 
             # Save raw response
             filename = f"census_housing_age_{year}_{state_name}.json"
             census_client.save_response(response, filename)
 
-            # Convert to dict and add to list
-            parsed = census_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            # Convert to DataFrame and add to list
+            parsed = census_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
@@ -125,7 +129,7 @@ def collect_housing_age(census_client, year, state_fips_list):
             continue
 
     # Create DataFrame
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
     print(f"\n✓ Total records: {len(df)}")
 
     return df
@@ -645,17 +649,22 @@ def collect_crime_data(fbi_client, from_date, to_date, year, state_fips_list):
     print(f"\n  Collecting crime data for {len(oris)} agencies...")
     print(f"  Date range: {from_date} to {to_date}")
 
+    # Agencies are independent, so fetch them concurrently
+    crime_results = fbi_client.get_all_crime_data_batch(
+        [ori_record['ori'] for ori_record in oris], from_date, to_date, progress_every=100
+    )
+
     ori_results = {}
 
-    for i, ori_record in enumerate(oris, 1):
+    for ori_record in oris:
         ori = ori_record['ori']
 
-        if i % 100 == 0 or i == 1:
-            print(f"    Progress: {i}/{len(oris)} agencies ({i/len(oris)*100:.1f}%) - API calls: {fbi_client.api_calls_made}")
-
         try:
-            # Get both violent and property crime data
-            crime_data = fbi_client.get_all_crime_data(ori, from_date, to_date)
+            # Both violent and property crime data
+            crime_data = crime_results[ori]
+            for result in crime_data.values():
+                if isinstance(result, Exception):
+                    raise result
 
             # Extract totals
             violent_total = extract_crime_totals(crime_data['violent'])
@@ -677,6 +686,7 @@ def collect_crime_data(fbi_client, from_date, to_date, year, state_fips_list):
             print(f"    Error processing ORI {ori}: {e}")
             ori_results[ori] = {
                 'ori': ori,
+                'fips': ori_record['fips'],
                 'error': str(e)
             }
 
@@ -712,6 +722,15 @@ def collect_crime_data(fbi_client, from_date, to_date, year, state_fips_list):
     # Convert to DataFrame
     crime_df = pd.DataFrame([v for v in county_data.values()])
 
+    # Agencies whose requests failed are missing from their county's totals
+    # rather than counted as zero crimes; record how many each county lacks
+    failed_by_county = Counter(data['fips'] for data in ori_results.values() if 'error' in data)
+    if not crime_df.empty:
+        crime_df['failed_agency_count'] = crime_df['fips'].map(failed_by_county).fillna(0).astype(int)
+    if failed_by_county:
+        print(f"  ⚠ {sum(failed_by_county.values())} agencies in {len(failed_by_county)} counties failed "
+              f"and are missing from the totals")
+
     print(f"  ✓ Aggregated to {len(crime_df)} counties")
     print(f"\n✓ Total records: {len(crime_df)}")
 
@@ -1016,7 +1035,7 @@ Examples:
     # Initialize clients
     print("\nInitializing API clients...")
     census_client = CensusClient()
-    cbp_client = CBPClient()
+    cbp_client = get_cbp_client()
     qcew_client = QCEWClient()
     nps_client = NPSClient()
 
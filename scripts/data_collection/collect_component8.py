@@ -15,9 +15,6 @@ import sys
 from pathlib import Path
 import json
 import pandas as pd
-import requests
-import zipfile
-import io
 from datetime import datetime
 
 # Add parent directory to path
@@ -27,6 +24,11 @@ from config import STATE_FIPS, RAW_DATA_DIR, PROCESSED_DATA_DIR
 from api_clients.irs_client import IRSExemptOrgClient
 from api_clients.census_client import CensusClient
 from api_clients.social_capital_client import SocialCapitalAtlasClient
+from api_clients.chr_client import CountyHealthRankingsClient
+
+# CHR analytic-file columns holding voter turnout (v177) and social associations (v140)
+VOTER_TURNOUT_COLUMN_PATTERNS = ['voter turnout raw', 'v177_rawvalue', 'voter_turnout']
+SOCIAL_ASSOCIATIONS_COLUMN_PATTERNS = ['social associations raw', 'v140_rawvalue']
 
 
 # State names from STATE_FIPS mapping (imported from config)
@@ -125,17 +127,19 @@ def get_population_data(census_client, year, state_fips_list):
 
     all_data = []
 
-    for state_abbr, state_fips in STATE_FIPS.items():
-        if state_fips not in state_fips_list:
-            continue
+    futures = census_client.gather_states(
+        lambda fips: census_client.get_population_total(year, state_fips=fips),
+        state_fips_list
+    )
 
+    for state_abbr, state_fips, future in futures:
         print(f"  Fetching {state_abbr} (FIPS {state_fips})...")
         try:
-            response = census_client.get_population_total(year, state_fips=state_fips)
+            response = future.result()
 
             # Parse response
-            parsed = census_client.parse_response_to_dict(response)
-            all_data.extend(parsed)
+            parsed = census_client.parse_response_to_df(response)
+            all_data.append(parsed)
             print(f"    ✓ Retrieved {len(parsed)} counties")
 
         except Exception as e:
@@ -143,7 +147,7 @@ def get_population_data(census_client, year, state_fips_list):
             continue
 
     # Create DataFrame
-    df = pd.DataFrame(all_data)
+    df = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
 
     # Create county FIPS code (state + county)
     if 'state' in df.columns and 'county' in df.columns:
@@ -158,11 +162,12 @@ def get_population_data(census_client, year, state_fips_list):
     return df
 
 
-def collect_voter_turnout(chr_year, state_fips_dict):
+def collect_voter_turnout(chr_client, chr_year, state_fips_dict):
     """
     Collect voter turnout data from County Health Rankings via Zenodo (Measure 8.4).
 
     Args:
+        chr_client: CountyHealthRankingsClient instance
         chr_year: Year of CHR data release (e.g., 2025)
         state_fips_dict: Dictionary of state abbreviations to FIPS codes
 
@@ -174,104 +179,35 @@ def collect_voter_turnout(chr_year, state_fips_dict):
     print("Election: 2020 U.S. Presidential Election")
     print("-" * 60)
 
-    # Download from Zenodo
-    print(f"Downloading data from Zenodo... (this may take a minute, ~50 MB)")
-    url = f"https://zenodo.org/api/records/17584421/files/{chr_year}.zip/content"
-
-    try:
-        response = requests.get(url, timeout=300)
-        response.raise_for_status()
-        file_size_mb = len(response.content) / (1024 * 1024)
-        print(f"✓ Downloaded {file_size_mb:.1f} MB")
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to download CHR data: {str(e)}")
-
-    # Extract ZIP and find voter turnout data
-    print("Extracting and locating voter turnout data...")
-    zip_data = io.BytesIO(response.content)
-
-    with zipfile.ZipFile(zip_data, 'r') as zip_ref:
-        file_list = zip_ref.namelist()
-
-        # Look for analytic data file
-        analytic_files = [
-            f for f in file_list
-            if ('analytic' in f.lower() or 'data' in f.lower())
-            and f.endswith('.csv')
-            and not f.startswith('__MACOSX')
-        ]
-
-        if not analytic_files:
-            analytic_files = [f for f in file_list if f.endswith('.csv') and not f.startswith('__MACOSX')]
+    df, filename = chr_client.read_analytic_data(chr_year, VOTER_TURNOUT_COLUMN_PATTERNS)
 
-        if not analytic_files:
-            raise Exception("No CSV data files found in ZIP")
+    # Save metadata
+    raw_dir = chr_client.raw_data_dir
 
-        # Read the first analytic file
-        filename = analytic_files[0]
-        print(f"Reading: {filename}")
-
-        with zip_ref.open(filename) as f:
-            df = pd.read_csv(f, encoding='utf-8', low_memory=False)
-
-        # Save metadata
-        raw_dir = RAW_DATA_DIR / 'chr'
-        raw_dir.mkdir(parents=True, exist_ok=True)
-
-        metadata = {
-            'source': 'County Health Rankings & Roadmaps',
-            'zenodo_doi': '10.5281/zenodo.17584421',
-            'year': chr_year,
-            'download_date': datetime.now().isoformat(),
-            'source_file': filename,
-            'records_downloaded': len(df),
-            'measure': 'Voter Turnout (2020 Presidential Election)'
-        }
+    metadata = {
+        'source': 'County Health Rankings & Roadmaps',
+        'zenodo_doi': '10.5281/zenodo.17584421',
+        'year': chr_year,
+        'download_date': datetime.now().isoformat(),
+        'source_file': filename,
+        'records_downloaded': len(df),
+        'measure': 'Voter Turnout (2020 Presidential Election)'
+    }
 
-        metadata_file = raw_dir / f'chr_voter_turnout_{chr_year}_metadata.json'
-        with open(metadata_file, 'w') as f_out:
-            json.dump(metadata, f_out, indent=2)
-        print(f"Saved metadata: {metadata_file}")
+    metadata_file = raw_dir / f'chr_voter_turnout_{chr_year}_metadata.json'
+    with open(metadata_file, 'w') as f_out:
+        json.dump(metadata, f_out, indent=2)
+    print(f"Saved metadata: {metadata_file}")
 
     # Process the data
     # Look for voter turnout columns (v177_rawvalue)
-    voter_cols = [
-        col for col in df.columns
-        if any(pattern in str(col).lower() for pattern in [
-            'voter turnout raw', 'v177_rawvalue', 'voter_turnout'
-        ])
-    ]
-
-    if not voter_cols:
+    voter_col = chr_client.find_column(df, VOTER_TURNOUT_COLUMN_PATTERNS)
+    if voter_col is None:
         raise Exception("Could not find voter turnout column")
-
-    voter_col = voter_cols[0]
     print(f"Using column: {voter_col}")
 
-    # Find FIPS columns
-    fips_5digit_cols = [c for c in df.columns if '5-digit' in c.lower() and 'fips' in c.lower()]
-    if fips_5digit_cols:
-        df['full_fips'] = df[fips_5digit_cols[0]].astype(str).str.zfill(5)
-    elif any('fipscode' in c.lower() for c in df.columns):
-        fips_col = next((c for c in df.columns if 'fipscode' in c.lower()), None)
-        df['full_fips'] = df[fips_col].astype(str).str.zfill(5)
-    else:
-        # Look for state and county FIPS columns
-        state_cols = [c for c in df.columns if 'state' in c.lower() and 'fips' in c.lower()]
-        county_cols = [c for c in df.columns if 'county' in c.lower() and 'fips' in c.lower()]
-
-        if state_cols and county_cols:
-            df['full_fips'] = (
-                df[state_cols[0]].astype(str).str.zfill(2) +
-                df[county_cols[0]].astype(str).str.zfill(3)
-            )
-        else:
-            raise Exception("Cannot determine FIPS code structure")
-
-    # Extract state FIPS and filter
-    df['state_fips'] = df['full_fips'].str[:2]
-    target_state_fips = list(state_fips_dict.values())
-    filtered_df = df[df['state_fips'].isin(target_state_fips)].copy()
+    # Filter to target states
+    filtered_df = chr_client.filter_to_states(df, state_fips_dict.values())
 
     print(f"✓ Retrieved {len(filtered_df)} records for target states")
 
@@ -298,11 +234,12 @@ def collect_voter_turnout(chr_year, state_fips_dict):
     return result_df
 
 
-def collect_social_associations(chr_year, state_fips_dict):
+def collect_social_associations(chr_client, chr_year, state_fips_dict):
     """
     Collect social associations data from County Health Rankings via Zenodo (Measure 8.3).
 
     Args:
+        chr_client: CountyHealthRankingsClient instance
         chr_year: Year of CHR data release (e.g., 2025)
         state_fips_dict: Dictionary of state abbreviations to FIPS codes
 
@@ -314,105 +251,36 @@ def collect_social_associations(chr_year, state_fips_dict):
     print("Measure: Number of membership associations per 10,000 population")
     print("-" * 60)
 
-    # Download from Zenodo (same data source as voter turnout)
-    print(f"Downloading data from Zenodo... (this may take a minute, ~50 MB)")
-    url = f"https://zenodo.org/api/records/17584421/files/{chr_year}.zip/content"
-
-    try:
-        response = requests.get(url, timeout=300)
-        response.raise_for_status()
-        file_size_mb = len(response.content) / (1024 * 1024)
-        print(f"✓ Downloaded {file_size_mb:.1f} MB")
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to download CHR data: {str(e)}")
-
-    # Extract ZIP and find social associations data
-    print("Extracting and locating social associations data...")
-    zip_data = io.BytesIO(response.content)
-
-    with zipfile.ZipFile(zip_data, 'r') as zip_ref:
-        file_list = zip_ref.namelist()
-
-        # Look for analytic data file
-        analytic_files = [
-            f for f in file_list
-            if ('analytic' in f.lower() or 'data' in f.lower())
-            and f.endswith('.csv')
-            and not f.startswith('__MACOSX')
-        ]
-
-        if not analytic_files:
-            analytic_files = [f for f in file_list if f.endswith('.csv') and not f.startswith('__MACOSX')]
-
-        if not analytic_files:
-            raise Exception("No CSV data files found in ZIP")
-
-        # Read the first analytic file
-        filename = analytic_files[0]
-        print(f"Reading: {filename}")
+    df, filename = chr_client.read_analytic_data(chr_year, SOCIAL_ASSOCIATIONS_COLUMN_PATTERNS)
 
-        with zip_ref.open(filename) as f:
-            df = pd.read_csv(f, encoding='utf-8', low_memory=False)
+    # Save metadata
+    raw_dir = chr_client.raw_data_dir
 
-        # Save metadata
-        raw_dir = RAW_DATA_DIR / 'chr'
-        raw_dir.mkdir(parents=True, exist_ok=True)
-
-        metadata = {
-            'source': 'County Health Rankings & Roadmaps',
-            'zenodo_doi': '10.5281/zenodo.17584421',
-            'year': chr_year,
-            'download_date': datetime.now().isoformat(),
-            'source_file': filename,
-            'records_downloaded': len(df),
-            'measure': 'Social Associations (v140_rawvalue)',
-            'description': 'Number of membership associations per 10,000 population'
-        }
+    metadata = {
+        'source': 'County Health Rankings & Roadmaps',
+        'zenodo_doi': '10.5281/zenodo.17584421',
+        'year': chr_year,
+        'download_date': datetime.now().isoformat(),
+        'source_file': filename,
+        'records_downloaded': len(df),
+        'measure': 'Social Associations (v140_rawvalue)',
+        'description': 'Number of membership associations per 10,000 population'
+    }
 
-        metadata_file = raw_dir / f'chr_social_associations_{chr_year}_metadata.json'
-        with open(metadata_file, 'w') as f_out:
-            json.dump(metadata, f_out, indent=2)
-        print(f"Saved metadata: {metadata_file}")
+    metadata_file = raw_dir / f'chr_social_associations_{chr_year}_metadata.json'
+    with open(metadata_file, 'w') as f_out:
+        json.dump(metadata, f_out, indent=2)
+    print(f"Saved metadata: {metadata_file}")
 
     # Process the data
     # Look for social associations columns (v140_rawvalue or "Social Associations raw value")
-    social_cols = [
-        col for col in df.columns
-        if any(pattern in str(col).lower() for pattern in [
-            'social associations raw', 'v140_rawvalue'
-        ])
-    ]
-
-    if not social_cols:
+    social_col = chr_client.find_column(df, SOCIAL_ASSOCIATIONS_COLUMN_PATTERNS)
+    if social_col is None:
         raise Exception("Could not find social associations column")
-
-    social_col = social_cols[0]
     print(f"Using column: {social_col}")
 
-    # Find FIPS columns
-    fips_5digit_cols = [c for c in df.columns if '5-digit' in c.lower() and 'fips' in c.lower()]
-    if fips_5digit_cols:
-        df['full_fips'] = df[fips_5digit_cols[0]].astype(str).str.zfill(5)
-    elif any('fipscode' in c.lower() for c in df.columns):
-        fips_col = next((c for c in df.columns if 'fipscode' in c.lower()), None)
-        df['full_fips'] = df[fips_col].astype(str).str.zfill(5)
-    else:
-        # Look for state and county FIPS columns
-        state_cols = [c for c in df.columns if 'state' in c.lower() and 'fips' in c.lower()]
-        county_cols = [c for c in df.columns if 'county' in c.lower() and 'fips' in c.lower()]
-
-        if state_cols and county_cols:
-            df['full_fips'] = (
-                df[state_cols[0]].astype(str).str.zfill(2) +
-                df[county_cols[0]].astype(str).str.zfill(3)
-            )
-        else:
-            raise Exception("Cannot determine FIPS code structure")
-
-    # Extract state FIPS and filter
-    df['state_fips'] = df['full_fips'].str[:2]
-    target_state_fips = list(state_fips_dict.values())
-    filtered_df = df[df['state_fips'].isin(target_state_fips)].copy()
+    # Filter to target states
+    filtered_df = chr_client.filter_to_states(df, state_fips_dict.values())
 
     print(f"✓ Retrieved {len(filtered_df)} records for target states")
 
@@ -701,6 +569,7 @@ def main():
     irs_client = IRSExemptOrgClient()
     census_client = CensusClient()
     social_capital_client = SocialCapitalAtlasClient()
+    chr_client = CountyHealthRankingsClient()
 
     # Define target states (all 10 states)
     state_fips_list = list(STATE_FIPS.values())
@@ -718,7 +587,7 @@ def main():
     # Step 3: Collect social associations data
     social_associations_df = None
     try:
-        social_associations_df = collect_social_associations(chr_year, STATE_FIPS)
+        social_associations_df = collect_social_associations(chr_client, chr_year, STATE_FIPS)
     except Exception as e:
         print(f"\n✗ Error collecting social associations data: {e}")
         print("  Continuing without social associations data...")
@@ -726,7 +595,7 @@ def main():
     # Step 4: Collect voter turnout data
     voter_turnout_df = None
     try:
-        voter_turnout_df = collect_voter_turnout(chr_year, STATE_FIPS)
+        voter_turnout_df = collect_voter_turnout(chr_client, chr_year, STATE_FIPS)
     except Exception as e:
         print(f"\n✗ Error collecting voter turnout data: {e}")
         print("  Continuing without voter turnout data...")
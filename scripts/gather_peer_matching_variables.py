@@ -16,12 +16,46 @@ import numpy as np
 from pathlib import Path
 import sys
 import json
+from functools import lru_cache
 
 # Add scripts directory to path
 sys.path.append(str(Path(__file__).parent))
 from regional_data_manager import RegionalDataManager
 
 
+@lru_cache(maxsize=None)
+def load_omb_delineation() -> pd.DataFrame:
+    """
+    Load the OMB 2020 metro/micro delineation file with 5-digit county FIPS codes.
+
+    The file is downloaded on first use and parsed once per run; the micropolitan
+    and MSA distance variables both classify counties from it.
+
+    Returns:
+        DataFrame of county delineations with a 'fips' column added
+    """
+    # Download OMB delineation file if not already cached
+    delineation_file = Path('data/raw/omb/metro_micro_delineation_2020.xls')
+    delineation_file.parent.mkdir(parents=True, exist_ok=True)
+
+    if not delineation_file.exists():
+        print("  Downloading OMB metro/micro delineation file...")
+        import urllib.request
+        url = "https://www2.census.gov/programs-surveys/metro-micro/geographies/reference-files/2020/delineation-files/list1_2020.xls"
+        urllib.request.urlretrieve(url, delineation_file)
+        print(f"  Downloaded: {delineation_file}")
+
+    # Read delineation file (skip first 2 rows, header is row 3)
+    delineation = pd.read_excel(delineation_file, skiprows=2)
+
+    # Create 5-digit FIPS codes
+    delineation['state_fips'] = delineation['FIPS State Code'].fillna(0).astype(int).astype(str).str.zfill(2)
+    delineation['county_fips'] = delineation['FIPS County Code'].fillna(0).astype(int).astype(str).str.zfill(3)
+    delineation['fips'] = delineation['state_fips'] + delineation['county_fips']
+
+    return delineation
+
+
 def gather_population(rdm: RegionalDataManager) -> pd.DataFrame:
     """
     Variable 1: Total population (2022)
@@ -36,10 +70,7 @@ def gather_population(rdm: RegionalDataManager) -> pd.DataFrame:
     pop_data['fips'] = pop_data['fips'].astype(str).str.zfill(5)
 
     # Add region_key
-    pop_data['region_key'] = pop_data['fips'].apply(
-        lambda fips: rdm.county_to_region.get(str(fips), {}).get('region_key')
-        if str(fips) in rdm.county_to_region else None
-    )
+    pop_data['region_key'] = rdm.map_region_keys(pop_data['fips'])
 
     # Aggregate to regional level
     regional_pop = pop_data.groupby('region_key')['population_2022'].sum().reset_index()
@@ -58,24 +89,7 @@ def gather_micropolitan_percentage(rdm: RegionalDataManager) -> pd.DataFrame:
     """
     print("\n[2/7] Calculating micropolitan percentage...")
 
-    # Download OMB delineation file if not already cached
-    delineation_file = Path('data/raw/omb/metro_micro_delineation_2020.xls')
-    delineation_file.parent.mkdir(parents=True, exist_ok=True)
-
-    if not delineation_file.exists():
-        print("  Downloading OMB metro/micro delineation file...")
-        import urllib.request
-        url = "https://www2.census.gov/programs-surveys/metro-micro/geographies/reference-files/2020/delineation-files/list1_2020.xls"
-        urllib.request.urlretrieve(url, delineation_file)
-        print(f"  Downloaded: {delineation_file}")
-
-    # Read delineation file (skip first 2 rows, header is row 3)
-    delineation = pd.read_excel(delineation_file, skiprows=2)
-
-    # Create 5-digit FIPS codes
-    delineation['state_fips'] = delineation['FIPS State Code'].fillna(0).astype(int).astype(str).str.zfill(2)
-    delineation['county_fips'] = delineation['FIPS County Code'].fillna(0).astype(int).astype(str).str.zfill(3)
-    delineation['fips'] = delineation['state_fips'] + delineation['county_fips']
+    delineation = load_omb_delineation()
 
     # Filter to micropolitan areas
     micro = delineation[delineation['Metropolitan/Micropolitan Statistical Area'] == 'Micropolitan Statistical Area']
@@ -91,19 +105,16 @@ def gather_micropolitan_percentage(rdm: RegionalDataManager) -> pd.DataFrame:
     pop_data['is_micropolitan'] = pop_data['fips'].isin(micro_fips)
 
     # Add region_key
-    pop_data['region_key'] = pop_data['fips'].apply(
-        lambda fips: rdm.county_to_region.get(str(fips), {}).get('region_key')
-        if str(fips) in rdm.county_to_region else None
-    )
+    pop_data['region_key'] = rdm.map_region_keys(pop_data['fips'])
 
     # Filter to counties in our regions
-    pop_data = pop_data[pop_data['region_key'].notna()]
+    pop_data = pop_data[pop_data['region_key'].notna()].copy()
 
-    # Calculate total and micropolitan population by region
-    regional_stats = pop_data.groupby('region_key').agg({
-        'population_2022': 'sum',
-        'is_micropolitan': lambda x: pop_data.loc[x.index, 'population_2022'][pop_data.loc[x.index, 'is_micropolitan']].sum()
-    }).reset_index()
+    # Population living in micropolitan counties (zero for all other counties)
+    pop_data['micro_population'] = pop_data['population_2022'].where(pop_data['is_micropolitan'], 0)
+
+    # Calculate total and micropolitan population by region in a single groupby
+    regional_stats = pop_data.groupby('region_key')[['population_2022', 'micro_population']].sum().reset_index()
 
     regional_stats.columns = ['region_key', 'total_population', 'micro_population']
 
@@ -116,8 +127,9 @@ def gather_micropolitan_percentage(rdm: RegionalDataManager) -> pd.DataFrame:
 
     result = regional_stats[['region_key', 'micropolitan_pct']]
 
-    print(f"  Regions: {len(result)}, Mean: {result['micropolitan_pct'].mean():.2f}%")
-    print(f"  Range: {result['micropolitan_pct'].min():.2f}% to {result['micropolitan_pct'].max():.2f}%")
+    pct_stats = result['micropolitan_pct'].agg(['mean', 'min', 'max'])
+    print(f"  Regions: {len(result)}, Mean: {pct_stats['mean']:.2f}%")
+    print(f"  Range: {pct_stats['min']:.2f}% to {pct_stats['max']:.2f}%")
 
     return result
 
@@ -135,9 +147,9 @@ def gather_farm_income_percentage(rdm: RegionalDataManager) -> pd.DataFrame:
 
     # Import BEA client
     sys.path.append(str(Path(__file__).parent))
-    from api_clients.bea_client import BEAClient
+    from api_clients.bea_client import get_bea_client
 
-    bea = BEAClient()
+    bea = get_bea_client()
 
     # State FIPS codes for our 10 states
     state_fips = ['13', '21', '24', '37', '42', '45', '47', '51', '54']
@@ -197,10 +209,7 @@ def gather_farm_income_percentage(rdm: RegionalDataManager) -> pd.DataFrame:
     income_df = income_df.fillna(0)
 
     # Add region_key
-    income_df['region_key'] = income_df['fips'].apply(
-        lambda fips: rdm.county_to_region.get(str(fips), {}).get('region_key')
-        if str(fips) in rdm.county_to_region else None
-    )
+    income_df['region_key'] = rdm.map_region_keys(income_df['fips'])
 
     # Filter to counties in our regions
     income_df = income_df[income_df['region_key'].notna()]
@@ -264,10 +273,7 @@ def gather_services_employment_percentage(rdm: RegionalDataManager) -> pd.DataFr
             df = pd.read_csv(file)
             df['fips'] = (df['state'].astype(str).str.zfill(2) +
                          df['county'].astype(str).str.zfill(3))
-            df['region_key'] = df['fips'].apply(
-                lambda fips: rdm.county_to_region.get(str(fips), {}).get('region_key')
-                if str(fips) in rdm.county_to_region else None
-            )
+            df['region_key'] = rdm.map_region_keys(df['fips'])
             df = df[df['region_key'].notna()]
             services_employment.append(df[['region_key', 'EMP']])
         except FileNotFoundError:
@@ -305,10 +311,7 @@ def gather_manufacturing_employment_percentage(rdm: RegionalDataManager) -> pd.D
     # Add FIPS and region_key
     mfg['fips'] = (mfg['state'].astype(str).str.zfill(2) +
                    mfg['county'].astype(str).str.zfill(3))
-    mfg['region_key'] = mfg['fips'].apply(
-        lambda fips: rdm.county_to_region.get(str(fips), {}).get('region_key')
-        if str(fips) in rdm.county_to_region else None
-    )
+    mfg['region_key'] = rdm.map_region_keys(mfg['fips'])
 
     # Aggregate to regional level
     mfg_clean = mfg[mfg['region_key'].notna()]
@@ -361,17 +364,10 @@ def gather_msa_distances(rdm: RegionalDataManager) -> pd.DataFrame:
     gazetteer = gazetteer[['fips', 'INTPTLAT', 'INTPTLONG']]
     gazetteer.columns = ['fips', 'lat', 'lon']
 
-    # Read OMB delineation file
-    delineation_file = Path('data/raw/omb/metro_micro_delineation_2020.xls')
-    delineation = pd.read_excel(delineation_file, skiprows=2)
-
-    # Create 5-digit FIPS codes
-    delineation['state_fips'] = delineation['FIPS State Code'].fillna(0).astype(int).astype(str).str.zfill(2)
-    delineation['county_fips'] = delineation['FIPS County Code'].fillna(0).astype(int).astype(str).str.zfill(3)
-    delineation['fips'] = delineation['state_fips'] + delineation['county_fips']
+    delineation = load_omb_delineation()
 
     # Filter to metropolitan areas only
-    metro = delineation[delineation['Metropolitan/Micropolitan Statistical Area'] == 'Metropolitan Statistical Area']
+    metro = delineation[delineation['Metropolitan/Micropolitan Statistical Area'] == 'Metropolitan Statistical Area'].copy()
 
     # Get MSA populations from Census (2022 CBSA estimates)
     # For simplicity, we'll categorize based on MSA name patterns
@@ -403,10 +399,7 @@ def gather_msa_distances(rdm: RegionalDataManager) -> pd.DataFrame:
     # Calculate regional centroids (population-weighted average of county centroids)
     pop_data = pd.read_csv('data/processed/census_population_growth_2000_2022.csv')
     pop_data['fips'] = pop_data['fips'].astype(str).str.zfill(5)
-    pop_data['region_key'] = pop_data['fips'].apply(
-        lambda fips: rdm.county_to_region.get(str(fips), {}).get('region_key')
-        if str(fips) in rdm.county_to_region else None
-    )
+    pop_data['region_key'] = rdm.map_region_keys(pop_data['fips'])
     pop_data = pop_data[pop_data['region_key'].notna()]
     pop_data = pop_data.merge(gazetteer, on='fips', how='left')
     pop_data = pop_data.dropna(subset=['lat', 'lon'])
@@ -482,10 +475,7 @@ def gather_mining_employment_percentage(rdm: RegionalDataManager) -> pd.DataFram
     # Add FIPS and region_key
     mining['fips'] = (mining['state'].astype(str).str.zfill(2) +
                      mining['county'].astype(str).str.zfill(3))
-    mining['region_key'] = mining['fips'].apply(
-        lambda fips: rdm.county_to_region.get(str(fips), {}).get('region_key')
-        if str(fips) in rdm.county_to_region else None
-    )
+    mining['region_key'] = rdm.map_region_keys(mining['fips'])
 
     # Aggregate to regional level
     mining_clean = mining[mining['region_key'].notna()]
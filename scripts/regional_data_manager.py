@@ -43,11 +43,16 @@ class RegionalDataManager:
         self.regions_dir = regions_dir
         self.regional_data = {}  # Store DataFrames by state FIPS
         self.county_to_region = {}  # Fast lookup: county_fips -> region info
+        self.county_to_region_key = {}  # Fast lookup: county_fips -> region_key
         self.region_to_counties = {}  # Fast lookup: (state_fips, region_id) -> counties
 
         # Load all regional data
         self._load_regional_data()
 
+        # Categorical dtype over every region_key, so frames returned by
+        # aggregate_county_data share one category set and merge on integer codes
+        self.region_key_dtype = pd.CategoricalDtype(sorted(self.region_to_counties))
+
     def _load_regional_data(self):
         """Load all regional CSV files and build lookup tables."""
         for state_fips, state_info in self.STATE_INFO.items():
@@ -77,6 +82,7 @@ class RegionalDataManager:
                     'region_name': region_name,
                     'region_key': f"{state_fips}_{region_id}"  # Unique identifier
                 }
+                self.county_to_region_key[county_fips] = f"{state_fips}_{region_id}"
 
             # Build region-to-counties lookup
             for region_id in df['region_id'].unique():
@@ -105,6 +111,18 @@ class RegionalDataManager:
         county_fips = str(county_fips).zfill(5)
         return self.county_to_region.get(county_fips)
 
+    def map_region_keys(self, county_fips: pd.Series) -> pd.Series:
+        """
+        Map a Series of county FIPS codes to region keys in one vectorized lookup.
+
+        Args:
+            county_fips: Series of 5-digit county FIPS codes
+
+        Returns:
+            Series of region_key values (NaN for counties not in any region)
+        """
+        return county_fips.astype(str).map(self.county_to_region_key)
+
     def get_counties_in_region(self, region_key: str) -> Optional[Dict]:
         """
         Get all counties in a given region.
@@ -129,15 +147,11 @@ class RegionalDataManager:
         """
         summary = []
 
-        # Filter by state if requested
-        if state_fips:
-            regions_to_process = {state_fips: self.region_to_counties}
-            region_keys = [k for k in self.region_to_counties.keys() if k.startswith(f"{state_fips}_")]
-        else:
-            region_keys = self.region_to_counties.keys()
-
-        for region_key in sorted(region_keys):
+        for region_key in sorted(self.region_to_counties):
             region_info = self.region_to_counties[region_key]
+            # Filter by state if requested
+            if state_fips and region_info['state_fips'] != state_fips:
+                continue
             summary.append({
                 'region_key': region_key,
                 'state_fips': region_info['state_fips'],
@@ -152,7 +166,7 @@ class RegionalDataManager:
     def aggregate_county_data(
         self,
         county_data: pd.DataFrame,
-        value_column: str,
+        value_column: Union[str, List[str]],
         aggregation_method: str = 'sum',
         weight_column: Optional[str] = None,
         county_fips_column: str = 'fips'
@@ -162,39 +176,27 @@ class RegionalDataManager:
 
         Args:
             county_data: DataFrame with county-level data
-            value_column: Name of column containing values to aggregate
+            value_column: Name of column containing values to aggregate, or a list of
+                column names to aggregate together in a single groupby pass
             aggregation_method: How to aggregate ('sum', 'mean', 'weighted_mean', 'median', 'count')
             weight_column: Column to use for weighted_mean (e.g., 'population')
             county_fips_column: Name of column containing county FIPS codes
 
         Returns:
-            DataFrame with regional aggregated data
+            DataFrame with regional aggregated data. region_key is categorical over
+            all regions, so results from separate calls merge on integer codes.
         """
         # Ensure FIPS codes are strings with 5 digits
         county_data = county_data.copy()
         county_data[county_fips_column] = county_data[county_fips_column].astype(str).str.zfill(5)
 
-        # Add region information to county data
-        region_info = []
-        for fips in county_data[county_fips_column]:
-            region = self.get_region_for_county(fips)
-            if region:
-                region_info.append(region)
-            else:
-                # County not in any region (e.g., Delaware or metro counties in PA/MD)
-                region_info.append({
-                    'region_key': None,
-                    'state_fips': fips[:2],
-                    'region_id': None,
-                    'region_name': None
-                })
-
-        county_data['region_key'] = [r['region_key'] for r in region_info]
-        county_data['region_name'] = [r['region_name'] for r in region_info]
-        county_data['state_fips'] = [r['state_fips'] for r in region_info]
+        # Add region information to county data. Counties not in any region
+        # (e.g., Delaware or metro counties in PA/MD) get a missing region_key.
+        county_data['region_key'] = self.map_region_keys(county_data[county_fips_column])
 
         # Filter out counties not in any region
         regional_data = county_data[county_data['region_key'].notna()].copy()
+        regional_data['region_key'] = regional_data['region_key'].astype(self.region_key_dtype)
 
         if len(regional_data) == 0:
             print("WARNING: No counties matched to regions")
@@ -202,45 +204,49 @@ class RegionalDataManager:
 
         # Perform aggregation
         if aggregation_method == 'sum':
-            aggregated = regional_data.groupby('region_key')[value_column].sum().reset_index()
+            aggregated = regional_data.groupby('region_key', observed=True)[value_column].sum().reset_index()
 
         elif aggregation_method == 'mean':
-            aggregated = regional_data.groupby('region_key')[value_column].mean().reset_index()
+            aggregated = regional_data.groupby('region_key', observed=True)[value_column].mean().reset_index()
 
         elif aggregation_method == 'median':
-            aggregated = regional_data.groupby('region_key')[value_column].median().reset_index()
+            aggregated = regional_data.groupby('region_key', observed=True)[value_column].median().reset_index()
 
         elif aggregation_method == 'count':
-            aggregated = regional_data.groupby('region_key')[value_column].count().reset_index()
+            aggregated = regional_data.groupby('region_key', observed=True)[value_column].count().reset_index()
 
         elif aggregation_method == 'weighted_mean':
             if weight_column is None:
                 raise ValueError("weight_column required for weighted_mean aggregation")
 
+            value_columns = [value_column] if isinstance(value_column, str) else list(value_column)
+
             def weighted_avg(group):
                 weights = group[weight_column]
-                values = group[value_column]
-                # Handle missing values
-                mask = values.notna() & weights.notna()
-                if mask.sum() == 0:
-                    return np.nan
-                return (values[mask] * weights[mask]).sum() / weights[mask].sum()
-
-            aggregated = regional_data.groupby('region_key').apply(weighted_avg).reset_index()
-            aggregated.columns = ['region_key', value_column]
+                averages = {}
+                for column in value_columns:
+                    values = group[column]
+                    # Handle missing values
+                    mask = values.notna() & weights.notna()
+                    if mask.sum() == 0:
+                        averages[column] = np.nan
+                    else:
+                        averages[column] = (values[mask] * weights[mask]).sum() / weights[mask].sum()
+                return pd.Series(averages)
+
+            aggregated = regional_data.groupby('region_key', observed=True).apply(weighted_avg).reset_index()
+            aggregated.columns = ['region_key'] + value_columns
 
         else:
             raise ValueError(f"Unknown aggregation method: {aggregation_method}")
 
         # Add region metadata
-        aggregated = aggregated.merge(
-            self.get_all_regions()[['region_key', 'state_fips', 'state_name', 'region_id', 'region_name']],
-            on='region_key',
-            how='left'
-        )
+        region_info = self.get_all_regions()[['region_key', 'state_fips', 'state_name', 'region_id', 'region_name']]
+        region_info['region_key'] = region_info['region_key'].astype(self.region_key_dtype)
+        aggregated = aggregated.merge(region_info, on='region_key', how='left')
 
         # Add county count
-        county_counts = regional_data.groupby('region_key').size().reset_index(name='num_counties_with_data')
+        county_counts = regional_data.groupby('region_key', observed=True).size().reset_index(name='num_counties_with_data')
         aggregated = aggregated.merge(county_counts, on='region_key', how='left')
 
         return aggregated
@@ -302,24 +308,18 @@ class RegionalDataManager:
         Returns:
             Dictionary with validation statistics
         """
-        covered = 0
-        not_covered = 0
-        by_state = {}
-
-        for fips in county_fips_list:
-            fips = str(fips).zfill(5)
-            state_fips = fips[:2]
-
-            if state_fips not in by_state:
-                by_state[state_fips] = {'covered': 0, 'not_covered': 0}
+        fips = pd.Series(county_fips_list, dtype=str).str.zfill(5)
+        is_covered = fips.isin(self.county_to_region_key.keys())
+
+        # Covered and total counts per state in one groupby, in first-seen state order
+        state_counts = is_covered.groupby(fips.str[:2], sort=False).agg(['sum', 'size'])
+        by_state = {
+            state_fips: {'covered': int(row['sum']), 'not_covered': int(row['size'] - row['sum'])}
+            for state_fips, row in state_counts.iterrows()
+        }
 
-            region = self.get_region_for_county(fips)
-            if region:
-                covered += 1
-                by_state[state_fips]['covered'] += 1
-            else:
-                not_covered += 1
-                by_state[state_fips]['not_covered'] += 1
+        covered = int(is_covered.sum())
+        not_covered = len(fips) - covered
 
         return {
             'total_counties': len(county_fips_list),
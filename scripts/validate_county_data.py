@@ -21,6 +21,13 @@ from datetime import datetime
 VALID_STATE_FIPS = ['13', '21', '24', '37', '42', '45', '47', '51', '54']
 EXPECTED_COUNTIES = 802  # Total counties in 10 states
 
+# Possible FIPS column names, in order of preference
+POSSIBLE_FIPS_COLS = (
+    'fips', 'FIPS', 'county_fips', 'GeoFips',
+    'full_fips', 'area_fips', 'FIPS Code', 'fips_str',
+    'geoid', 'GEOID', 'geo_id'
+)
+
 
 def load_all_processed_files():
     """Find and load all processed CSV files."""
@@ -39,22 +46,18 @@ def load_all_processed_files():
     return datasets
 
 
+def find_fips_column(df):
+    """Return the first POSSIBLE_FIPS_COLS name present in df, or None."""
+    columns = set(df.columns)
+    return next((col for col in POSSIBLE_FIPS_COLS if col in columns), None)
+
+
 def validate_fips_codes(df, file_name):
     """Validate FIPS codes are properly formatted and valid."""
     issues = []
 
     # Check if FIPS column exists - expanded list of possible column names
-    fips_col = None
-    possible_fips_cols = [
-        'fips', 'FIPS', 'county_fips', 'GeoFips',
-        'full_fips', 'area_fips', 'FIPS Code', 'fips_str',
-        'geoid', 'GEOID', 'geo_id'
-    ]
-
-    for col in possible_fips_cols:
-        if col in df.columns:
-            fips_col = col
-            break
+    fips_col = find_fips_column(df)
 
     # Special case: some files have separate state/county columns
     if fips_col is None:
@@ -190,17 +193,7 @@ def calculate_coverage_stats(df, file_name):
     stats = {}
 
     # Count unique FIPS codes - use expanded list
-    fips_col = None
-    possible_fips_cols = [
-        'fips', 'FIPS', 'county_fips', 'GeoFips',
-        'full_fips', 'area_fips', 'FIPS Code', 'fips_str',
-        'geoid', 'GEOID', 'geo_id'
-    ]
-
-    for col in possible_fips_cols:
-        if col in df.columns:
-            fips_col = col
-            break
+    fips_col = find_fips_column(df)
 
     # Special case: create FIPS from state + county
     if fips_col is None and 'state' in df.columns and 'county' in df.columns:
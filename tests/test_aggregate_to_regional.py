@@ -0,0 +1,29 @@
+"""
+Tests for reading county-level CSVs in aggregate_to_regional.py.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add scripts directory to path to import the aggregation modules
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'scripts'))
+from aggregate_to_regional import DTYPE_HINTS
+
+
+def test_dtype_hints_keep_missing_and_sentinel_counts(tmp_path):
+    """Blank cells read as <NA> and negative Census sentinels are not wrapped."""
+    csv_path = tmp_path / 'bds_business_dynamics_2021.csv'
+    csv_path.write_text(
+        'state,county,ESTABS_ENTRY,ESTABS_EXIT,B08128_001E\n'
+        '51,1,120,95,-666666666\n'
+        '51,3,,40,\n'
+    )
+
+    df = pd.read_csv(csv_path, dtype=DTYPE_HINTS)
+
+    assert df['ESTABS_ENTRY'].isna().tolist() == [False, True]
+    assert df['ESTABS_ENTRY'].iloc[0] == 120
+    assert df['B08128_001E'].iloc[0] == -666666666
+    assert df['B08128_001E'].isna().iloc[1]